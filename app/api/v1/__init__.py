@@ -7,11 +7,15 @@ from app.api.v1.routers.clerk_webhooks import router as clerk_webhooks_router
 from app.api.v1.routers.documents import router as documents_router
 from app.api.v1.routers.vessels import router as vessels_router
 from app.api.v1.routers.pubsub_webhooks import router as pubsub_webhooks_router
+from app.api.v1.routers.metrics import router as metrics_router
+from app.api.v1.routers.parsing_jobs import router as parsing_jobs_router
 api_router = APIRouter()
 api_router.include_router(health_router)
 api_router.include_router(clerk_webhooks_router)
 api_router.include_router(documents_router)
 api_router.include_router(vessels_router)
 api_router.include_router(pubsub_webhooks_router)
+api_router.include_router(metrics_router)
+api_router.include_router(parsing_jobs_router)
 
 __all__ = ["api_router"]
@@ -5,7 +5,8 @@ from app.dependencies.services import (
     get_organization_service,
     get_authed_organization_service,
     get_document_service,
-    get_vessel_service
+    get_vessel_service,
+    get_parsing_job_service,
 )
 
 __all__ = [
@@ -15,4 +16,5 @@ __all__ = [
     "get_authed_organization_service",
     "get_document_service",
     "get_vessel_service",
+    "get_parsing_job_service",
 ]
\ No newline at end of file
@@ -2,8 +2,8 @@ from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession # Required for db dependency
 
 from app.core.config import Settings, get_settings
-from app.core.auth.webhooks import verify_clerk_webhook
-from app.core.auth.webhooks.handlers import dispatch_webhook_event
+from app.core.auth.webhooks import verify_clerk_webhook, get_webhook_consumer
+from app.core.auth.webhooks.inbox import WebhookInboxRepository
 from app.infrastructure.db import get_db_session
 
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
@@ -17,7 +17,8 @@ async def clerk_webhook(
 ):
     """
     Clerk webhook endpoint.
-    Verifies signature and dispatches events to appropriate handlers.
+    Verifies signature, stores the event in the inbox and acknowledges;
+    handlers run in the background inbox consumer.
     """
     raw_body = await request.body()
     event = verify_clerk_webhook(
@@ -26,7 +27,16 @@ async def clerk_webhook(
         secret=settings.clerk_webhook_secret,
     )
 
-    # Dispatch to handler
-    await dispatch_webhook_event(event.type, event.data, db)
+    # svix-id is guaranteed present once the signature is verified
+    stored = await WebhookInboxRepository(db).add_if_absent(
+        svix_id=request.headers["svix-id"],
+        event_type=event.type,
+        event_timestamp=event.timestamp,
+        payload=event.data,
+    )
+    await db.commit()
+
+    if stored:
+        get_webhook_consumer().notify()
 
-    return {"ok": True, "type": event.type}
+    return {"ok": True, "type": event.type, "duplicate": not stored}
@@ -0,0 +1,35 @@
+import hmac
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import PlainTextResponse
+
+from app.core.config import Settings, get_settings
+from app.core.exceptions.http import UnauthorizedError
+from app.core.metrics import get_metrics_registry
+
+
+def require_metrics_token(
+    request: Request,
+    settings: Settings = Depends(get_settings),
+) -> None:
+    """The metrics scraper authenticates with the shared METRICS_TOKEN."""
+    if not settings.metrics_token:
+        # Open only for local development without auth
+        if settings.auth_enabled:
+            raise UnauthorizedError("Metrics token not configured.")
+        return
+
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token, settings.metrics_token):
+        raise UnauthorizedError("Invalid metrics token.")
+
+
+router = APIRouter(tags=["metrics"], dependencies=[Depends(require_metrics_token)])
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(
+        get_metrics_registry().render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
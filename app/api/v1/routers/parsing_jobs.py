@@ -0,0 +1,52 @@
+import hmac
+
+from fastapi import APIRouter, Depends, Request
+
+from app.core.config import Settings, get_settings
+from app.core.exceptions.http import UnauthorizedError
+from app.domain.processing.schemas import (
+    ParsingJobStatusBatchRequest,
+    ParsingJobStatusBatchResponse,
+)
+from app.domain.processing.service.protocols import ParsingJobServiceProtocol
+from app.api.v1.dependencies import get_parsing_job_service
+
+
+def require_worker_token(
+    request: Request,
+    settings: Settings = Depends(get_settings),
+) -> None:
+    """Parsing workers authenticate with the shared PARSING_WORKER_TOKEN."""
+    if not settings.parsing_worker_token:
+        # Open only for local development without auth
+        if settings.auth_enabled:
+            raise UnauthorizedError("Worker token not configured.")
+        return
+
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token, settings.parsing_worker_token):
+        raise UnauthorizedError("Invalid worker token.")
+
+
+router = APIRouter(
+    prefix="/parsing-jobs",
+    tags=["parsing-jobs"],
+    dependencies=[Depends(require_worker_token)],
+)
+
+
+@router.post(
+    "/status",
+    response_model=ParsingJobStatusBatchResponse,
+    summary="Report parsing job status updates",
+    description=(
+        "Apply many worker status updates in one call. Updates that are not a "
+        "legal transition, or target a job leased by another worker, are "
+        "rejected individually."
+    ),
+)
+async def report_status(
+    request: ParsingJobStatusBatchRequest,
+    svc: ParsingJobServiceProtocol = Depends(get_parsing_job_service),
+) -> ParsingJobStatusBatchResponse:
+    return await svc.apply_status_updates(request)
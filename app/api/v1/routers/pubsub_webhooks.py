@@ -8,15 +8,23 @@ from app.core.pubsub import (
     PubSubRetryableError,
     get_dispatcher,
 )
+from app.core.config import get_settings
+from app.core.pubsub.overload import get_load_shedder
 
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 logger = logging.getLogger(__name__)
 
 @router.post("/pubsub")
 async def pubsub_webhook(request: Request) -> Response:
+    # Fail fast while overloaded: Pub/Sub retries the delivery with backoff
+    # rather than it queueing here for a pool connection
+    if get_settings().pubsub_shed_enabled and get_load_shedder().should_shed():
+        return Response(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+
     try:
-        body = await request.json()
-        envelope = PubSubPushEnvelope.model_validate(body)
+        # One pass: JSON parse + validation from the raw body; the payload
+        # itself stays base64 until a handler reads it
+        envelope = PubSubPushEnvelope.model_validate_json(await request.body())
         ctx = PubSubContext.from_push_message(
             subscription=envelope.subscription,
             message_id=envelope.message.message_id,
@@ -0,0 +1,350 @@
+"""
+Bulk reconciliation of users, organizations and memberships from Clerk.
+
+Pages through a Clerk-compatible directory source and bulk-upserts each page
+(INSERT ... ON CONFLICT) in its own transaction, reporting rows/s per batch.
+Fetching the next page overlaps with writing the current one.
+
+Usage:
+    python -m app.core.auth.backfill                      # Clerk Backend API (CLERK_SECRET_KEY)
+    python -m app.core.auth.backfill --api-url http://localhost:8081/v1
+    python -m app.core.auth.backfill --source fake --fake-users 20000 --fake-orgs 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Protocol, TypeVar
+
+from clerk_backend_api import Clerk
+
+from app.core.auth.client import get_clerk
+from app.core.auth.webhooks.handlers import WebhookHandlers
+from app.core.config import get_settings
+from app.dependencies.services import get_organization_service, get_user_service
+from app.domain.organization.models import OrganizationRole
+from app.domain.organization.schemas import OrganizationCreate, OrganizationMembershipUpsert
+from app.domain.users.schemas import UserCreate
+from app.infrastructure.db import AsyncSessionLocal, database_lifespan
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CLERK_MAX_PAGE_SIZE = 500
+# users rows carry 6 bind params each; Postgres allows 32767 per statement
+MAX_BATCH_SIZE = 5000
+
+
+class ClerkDirectorySource(Protocol):
+    """Read side of the Clerk list API, already mapped to our create schemas."""
+
+    def iter_users(self, page_size: int) -> AsyncIterator[list[UserCreate]]: ...
+
+    def iter_organizations(self, page_size: int) -> AsyncIterator[list[OrganizationCreate]]: ...
+
+    def iter_memberships(
+        self, clerk_org_id: str, page_size: int
+    ) -> AsyncIterator[list[OrganizationMembershipUpsert]]: ...
+
+
+class ClerkApiSource:
+    """Pages the Clerk Backend API (or anything speaking it, via `server_url`)."""
+
+    def __init__(self, clerk: Clerk):
+        self._clerk = clerk
+
+    async def iter_users(self, page_size: int) -> AsyncIterator[list[UserCreate]]:
+        offset = 0
+        while True:
+            users = await self._clerk.users.list_async(
+                request={"limit": page_size, "offset": offset, "order_by": "+created_at"}
+            )
+            page = [u for u in (self._to_user_create(user) for user in users) if u is not None]
+            if len(page) < len(users):
+                logger.warning(f"[Backfill] Skipped {len(users) - len(page)} user(s) without an email address")
+            if page:
+                yield page
+            if len(users) < page_size:
+                return
+            offset += page_size
+
+    async def iter_organizations(self, page_size: int) -> AsyncIterator[list[OrganizationCreate]]:
+        offset = 0
+        while True:
+            res = await self._clerk.organizations.list_async(
+                limit=page_size, offset=offset, order_by="+created_at"
+            )
+            if res.data:
+                yield [
+                    OrganizationCreate(clerk_id=org.id, name=org.name, logo_url=org.image_url)
+                    for org in res.data
+                ]
+            offset += len(res.data)
+            if not res.data or offset >= res.total_count:
+                return
+
+    async def iter_memberships(
+        self, clerk_org_id: str, page_size: int
+    ) -> AsyncIterator[list[OrganizationMembershipUpsert]]:
+        offset = 0
+        while True:
+            res = await self._clerk.organization_memberships.list_async(
+                organization_id=clerk_org_id, limit=page_size, offset=offset
+            )
+            page = []
+            for m in res.data:
+                if m.public_user_data is None:
+                    continue
+                pud = m.public_user_data
+                page.append(
+                    OrganizationMembershipUpsert(
+                        user=UserCreate(
+                            clerk_user_id=pud.user_id,
+                            email=pud.identifier or "",
+                            first_name=pud.first_name,
+                            last_name=pud.last_name,
+                            full_name=f"{pud.first_name or ''} {pud.last_name or ''}".strip() or None,
+                            image_url=pud.image_url,
+                        ),
+                        organization=OrganizationCreate(
+                            clerk_id=m.organization.id,
+                            name=m.organization.name,
+                            logo_url=m.organization.image_url,
+                        ),
+                        role=WebhookHandlers._map_clerk_role(m.role),
+                    )
+                )
+            if page:
+                yield page
+            offset += len(res.data)
+            if not res.data or offset >= res.total_count:
+                return
+
+    @staticmethod
+    def _to_user_create(user) -> UserCreate | None:
+        emails = user.email_addresses or []
+        primary = next((e for e in emails if e.id == user.primary_email_address_id), None)
+        email = primary or (emails[0] if emails else None)
+        if email is None:
+            return None
+        return UserCreate(
+            clerk_user_id=user.id,
+            email=email.email_address,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            full_name=f"{user.first_name or ''} {user.last_name or ''}".strip() or None,
+            image_url=user.image_url,
+        )
+
+
+class SyntheticClerkSource:
+    """
+    Local stand-in for the Clerk list API: deterministic users/orgs/memberships
+    with an optional per-page latency, for dry runs and throughput measurements.
+    User `i` is a member of org `i % orgs`.
+    """
+
+    def __init__(self, *, users: int, orgs: int, page_latency_ms: float = 0.0):
+        self._users = users
+        self._orgs = max(1, orgs)
+        self._latency = page_latency_ms / 1000
+
+    def _user(self, i: int) -> UserCreate:
+        return UserCreate(
+            clerk_user_id=f"user_bf_{i:07d}",
+            email=f"backfill+{i:07d}@example.com",
+            first_name="Backfill",
+            last_name=f"User {i}",
+            full_name=f"Backfill User {i}",
+        )
+
+    def _org(self, j: int) -> OrganizationCreate:
+        return OrganizationCreate(clerk_id=f"org_bf_{j:05d}", name=f"Backfill Org {j}")
+
+    async def _page(self, items: list[T]) -> list[T]:
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        return items
+
+    async def iter_users(self, page_size: int) -> AsyncIterator[list[UserCreate]]:
+        for start in range(0, self._users, page_size):
+            yield await self._page([self._user(i) for i in range(start, min(start + page_size, self._users))])
+
+    async def iter_organizations(self, page_size: int) -> AsyncIterator[list[OrganizationCreate]]:
+        for start in range(0, self._orgs, page_size):
+            yield await self._page([self._org(j) for j in range(start, min(start + page_size, self._orgs))])
+
+    async def iter_memberships(
+        self, clerk_org_id: str, page_size: int
+    ) -> AsyncIterator[list[OrganizationMembershipUpsert]]:
+        j = int(clerk_org_id.removeprefix("org_bf_"))
+        member_ids = range(j, self._users, self._orgs)
+        for start in range(0, len(member_ids), page_size):
+            yield await self._page([
+                OrganizationMembershipUpsert(
+                    user=self._user(i),
+                    organization=self._org(j),
+                    role=OrganizationRole.ADMIN if i == j else OrganizationRole.MEMBER,
+                )
+                for i in member_ids[start:start + page_size]
+            ])
+
+
+@dataclass
+class BackfillReport:
+    rows: dict[str, int] = field(default_factory=dict)
+    seconds: dict[str, float] = field(default_factory=dict)
+
+
+async def _rebatch(pages: AsyncIterator[list[T]], batch_size: int) -> AsyncIterator[list[T]]:
+    buffer: list[T] = []
+    async for page in pages:
+        buffer.extend(page)
+        while len(buffer) >= batch_size:
+            yield buffer[:batch_size]
+            buffer = buffer[batch_size:]
+    if buffer:
+        yield buffer
+
+
+class ClerkBackfill:
+    def __init__(
+        self,
+        source: ClerkDirectorySource,
+        *,
+        session_factory=AsyncSessionLocal,
+        page_size: int = CLERK_MAX_PAGE_SIZE,
+        batch_size: int = 2000,
+    ):
+        self._source = source
+        self._session_factory = session_factory
+        self._page_size = min(page_size, CLERK_MAX_PAGE_SIZE)
+        self._batch_size = min(batch_size, MAX_BATCH_SIZE)
+        self.report = BackfillReport()
+
+    async def run(self, entities: Sequence[str] = ("users", "organizations", "memberships")) -> BackfillReport:
+        org_ids: list[str] = []
+
+        if "users" in entities:
+            await self._drain("users", _rebatch(self._source.iter_users(self._page_size), self._batch_size), self._write_users)
+
+        if "organizations" in entities or "memberships" in entities:
+            async def write_orgs(batch: list[OrganizationCreate]) -> None:
+                org_ids.extend(o.clerk_id for o in batch)
+                if "organizations" in entities:
+                    await self._write_organizations(batch)
+
+            await self._drain(
+                "organizations",
+                _rebatch(self._source.iter_organizations(self._page_size), self._batch_size),
+                write_orgs,
+            )
+
+        if "memberships" in entities:
+            await self._drain("memberships", _rebatch(self._iter_all_memberships(org_ids), self._batch_size), self._write_memberships)
+
+        return self.report
+
+    async def _iter_all_memberships(self, clerk_org_ids: list[str]) -> AsyncIterator[list[OrganizationMembershipUpsert]]:
+        for clerk_org_id in clerk_org_ids:
+            async for page in self._source.iter_memberships(clerk_org_id, self._page_size):
+                yield page
+
+    async def _drain(
+        self,
+        label: str,
+        batches: AsyncIterator[list[T]],
+        write: Callable[[list[T]], Awaitable[None]],
+    ) -> None:
+        """Write batches as they arrive while the next one is being fetched."""
+        queue: asyncio.Queue[list[T] | None] = asyncio.Queue(maxsize=2)
+
+        async def produce() -> None:
+            try:
+                async for batch in batches:
+                    await queue.put(batch)
+            finally:
+                await queue.put(None)
+
+        producer = asyncio.create_task(produce())
+        started = time.perf_counter()
+        total = 0
+        n = 0
+        try:
+            while (batch := await queue.get()) is not None:
+                n += 1
+                t0 = time.perf_counter()
+                await write(batch)
+                elapsed = time.perf_counter() - t0
+                total += len(batch)
+                logger.info(
+                    f"[Backfill] {label} batch {n}: {len(batch)} rows in {elapsed:.3f}s "
+                    f"({len(batch) / elapsed if elapsed else 0:.0f} rows/s)"
+                )
+        except BaseException:
+            producer.cancel()
+            raise
+        await producer
+
+        seconds = time.perf_counter() - started
+        self.report.rows[label] = total
+        self.report.seconds[label] = seconds
+        logger.info(
+            f"[Backfill] {label}: {total} rows in {seconds:.2f}s "
+            f"({total / seconds if seconds else 0:.0f} rows/s overall)"
+        )
+
+    async def _write_users(self, batch: list[UserCreate]) -> None:
+        async with self._session_factory() as db:
+            await get_user_service(db=db).upsert_users(batch)
+
+    async def _write_organizations(self, batch: list[OrganizationCreate]) -> None:
+        async with self._session_factory() as db:
+            await get_organization_service(db=db).upsert_organizations(batch)
+
+    async def _write_memberships(self, batch: list[OrganizationMembershipUpsert]) -> None:
+        async with self._session_factory() as db:
+            await get_organization_service(db=db).upsert_memberships(batch)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", choices=["clerk", "fake"], default="clerk")
+    parser.add_argument("--api-url", help="Clerk-compatible API base URL (defaults to Clerk's)")
+    parser.add_argument("--only", default="users,organizations,memberships", help="comma-separated entities")
+    parser.add_argument("--page-size", type=int, default=CLERK_MAX_PAGE_SIZE)
+    parser.add_argument("--batch-size", type=int, default=2000, help=f"rows per upsert transaction (max {MAX_BATCH_SIZE})")
+    parser.add_argument("--fake-users", type=int, default=10_000)
+    parser.add_argument("--fake-orgs", type=int, default=100)
+    parser.add_argument("--fake-latency-ms", type=float, default=0.0, help="simulated latency per page")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.source == "fake":
+        source: ClerkDirectorySource = SyntheticClerkSource(
+            users=args.fake_users, orgs=args.fake_orgs, page_latency_ms=args.fake_latency_ms
+        )
+    elif args.api_url:
+        source = ClerkApiSource(Clerk(bearer_auth=get_settings().clerk_secret_key, server_url=args.api_url))
+    else:
+        source = ClerkApiSource(get_clerk())
+
+    entities = [e.strip() for e in args.only.split(",") if e.strip()]
+    backfill = ClerkBackfill(source, page_size=args.page_size, batch_size=args.batch_size)
+
+    async def run() -> None:
+        async with database_lifespan():
+            await backfill.run(entities)
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
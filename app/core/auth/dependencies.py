@@ -1,27 +1,46 @@
 import logging
 
-from fastapi import Request, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Request
 
-from app.core.auth.client import update_user_metadata, update_organization_metadata
 from app.core.auth.context import AuthContext
+from app.core.auth.id_cache import get_org_id_cache, get_user_id_cache
+from app.core.auth.metadata_sync import get_metadata_sync_queue
 from app.core.auth.exceptions import (
     MissingOrganizationError,
     PendingOrganizationError,
     InvalidAuthTokenError,
 )
 from app.core.auth.tokens import verify_request_with_clerk
-from app.infrastructure.db import get_db_session
+from app.infrastructure.db import LazySession
 from app.domain.users.repository import UserRepository
 from app.domain.organization.repository import OrganizationRepository
 
 logger = logging.getLogger(__name__)
 
 
-async def get_auth_context(
-    request: Request,
-    db: AsyncSession = Depends(get_db_session),
-) -> AuthContext:
+async def _lookup_user_id(db: LazySession, clerk_user_id: str) -> str | None:
+    user = await UserRepository(db.get()).get_by_clerk_id(clerk_user_id)
+    return user.id if user else None
+
+
+async def _lookup_org_id(db: LazySession, clerk_org_id: str) -> str | None:
+    org = await OrganizationRepository(db.get()).get_by_clerk_id(clerk_org_id)
+    return org.id if org else None
+
+
+async def get_auth_context(request: Request) -> AuthContext:
+    """
+    Builds the AuthContext from the verified session token.
+
+    Does not depend on the request DB session: internal ids come from the token
+    claims or the id cache, and only on a miss is a short-lived session opened
+    (and its connection returned before the route runs).
+    """
+    async with LazySession() as db:
+        return await _resolve_auth_context(request, db)
+
+
+async def _resolve_auth_context(request: Request, db: LazySession) -> AuthContext:
     payload = await verify_request_with_clerk(request)
 
     user_id = payload.get("sub")
@@ -46,18 +65,15 @@ async def get_auth_context(
     user_source = "session"
 
     if not internal_user_id:
-        # Fallback to DB
-        user_repo = UserRepository(db)
-        user = await user_repo.get_by_clerk_id(user_id)
-        if user:
-            internal_user_id = user.id
+        # Fallback to DB (through the shared id cache)
+        internal_user_id = await get_user_id_cache().resolve(
+            user_id, lambda clerk_id: _lookup_user_id(db, clerk_id)
+        )
+        if internal_user_id:
             user_source = "db"
-            # Self-healing: Sync to Clerk metadata so next token has it
-            try:
-                logger.info("[Auth] Self-healing: syncing internal user_id to Clerk for %s", user_id)
-                await update_user_metadata(user_id, public_metadata={"user_id": user.id})
-            except Exception as e:
-                logger.warning("[Auth] Failed to sync user metadata for %s: %s", user_id, e)
+            # Self-healing: Sync to Clerk metadata (in the background) so next token has it
+            if get_metadata_sync_queue().enqueue_user(user_id, {"user_id": internal_user_id}):
+                logger.info("[Auth] Self-healing: queued internal user_id sync to Clerk for %s", user_id)
 
     # Resolve Internal Org ID
     org_metadata = payload.get("org_public_metadata") or {}
@@ -68,18 +84,15 @@ async def get_auth_context(
     org_source = "session"
 
     if not internal_org_id and org_id:
-        # Fallback to DB
-        org_repo = OrganizationRepository(db)
-        org = await org_repo.get_by_clerk_id(org_id)
-        if org:
-            internal_org_id = org.id
+        # Fallback to DB (through the shared id cache)
+        internal_org_id = await get_org_id_cache().resolve(
+            org_id, lambda clerk_id: _lookup_org_id(db, clerk_id)
+        )
+        if internal_org_id:
             org_source = "db"
-            # Self-healing: Sync to Clerk metadata so next token has it
-            try:
-                logger.info("[Auth] Self-healing: syncing internal org_id to Clerk for %s", org_id)
-                await update_organization_metadata(org_id, public_metadata={"org_id": org.id})
-            except Exception as e:
-                logger.warning("[Auth] Failed to sync org metadata for %s: %s", org_id, e)
+            # Self-healing: Sync to Clerk metadata (in the background) so next token has it
+            if get_metadata_sync_queue().enqueue_organization(org_id, {"org_id": internal_org_id}):
+                logger.info("[Auth] Self-healing: queued internal org_id sync to Clerk for %s", org_id)
 
     return AuthContext(
         user_id=user_id,
@@ -91,11 +104,8 @@ async def get_auth_context(
 
 
 # Optional version (nice for mixed public/private endpoints)
-async def get_optional_auth_context(
-    request: Request,
-    db: AsyncSession = Depends(get_db_session),
-) -> AuthContext | None:
+async def get_optional_auth_context(request: Request) -> AuthContext | None:
     try:
-        return await get_auth_context(request, db)
+        return await get_auth_context(request)
     except Exception:
         return None
\ No newline at end of file
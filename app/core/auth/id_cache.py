@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+
+from app.core.config import get_settings
+
+
+class ClerkIdCache:
+    """
+    Bounded TTL cache of Clerk id -> internal id.
+
+    Misses are cached too (as `None`, with a shorter TTL) so a token for a
+    user/org that has not been provisioned yet doesn't hit the DB on every request.
+    Webhook handlers invalidate entries on create/update/delete; other instances
+    converge within the TTL.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 10_000,
+        ttl_seconds: float = 300,
+        negative_ttl_seconds: float = 30,
+    ) -> None:
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._negative_ttl = negative_ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, str | None]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, clerk_id: str) -> tuple[bool, str | None]:
+        """Return `(hit, internal_id)`; `(True, None)` is a cached miss."""
+        entry = self._entries.get(clerk_id)
+        if entry is None:
+            return False, None
+
+        expires_at, internal_id = entry
+        if expires_at <= time.monotonic():
+            del self._entries[clerk_id]
+            return False, None
+
+        self._entries.move_to_end(clerk_id)
+        return True, internal_id
+
+    def set(self, clerk_id: str, internal_id: str | None) -> None:
+        if self._max_size <= 0:
+            return
+
+        ttl = self._ttl if internal_id is not None else self._negative_ttl
+        self._entries[clerk_id] = (time.monotonic() + ttl, internal_id)
+        self._entries.move_to_end(clerk_id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, clerk_id: str) -> None:
+        self._entries.pop(clerk_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def resolve(
+        self,
+        clerk_id: str,
+        loader: Callable[[str], Awaitable[str | None]],
+    ) -> str | None:
+        """Return the cached internal id, calling `loader` (and caching its result) on a miss."""
+        hit, internal_id = self.get(clerk_id)
+        if hit:
+            return internal_id
+
+        internal_id = await loader(clerk_id)
+        self.set(clerk_id, internal_id)
+        return internal_id
+
+
+def _build_cache() -> ClerkIdCache:
+    settings = get_settings()
+    return ClerkIdCache(
+        max_size=settings.auth_id_cache_size,
+        ttl_seconds=settings.auth_id_cache_ttl_seconds,
+        negative_ttl_seconds=settings.auth_id_cache_negative_ttl_seconds,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_user_id_cache() -> ClerkIdCache:
+    """Clerk user id -> internal users.id"""
+    return _build_cache()
+
+
+@lru_cache(maxsize=1)
+def get_org_id_cache() -> ClerkIdCache:
+    """Clerk organization id -> internal organization.id"""
+    return _build_cache()
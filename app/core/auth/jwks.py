@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+import time
+from functools import lru_cache
+
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
+from cryptography.hazmat.primitives.serialization import load_pem_public_key
+from jwt.algorithms import RSAAlgorithm
+
+from app.core.auth.client import get_clerk
+from app.core.auth.exceptions import InvalidAuthTokenError
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class JwksKeyStore:
+    """
+    In-process cache of the RSA public keys used to sign Clerk session tokens.
+
+    Two modes:
+    - `jwt_key` set (PEM from the Clerk dashboard): fully networkless, the same key
+      is used for every token.
+    - otherwise: the instance JWKS is fetched from the Clerk Backend API, indexed by
+      `kid`, and refreshed every `refresh_interval_seconds`. An unknown `kid` (key
+      rotation) forces an early refresh, rate-limited by `min_refresh_interval_seconds`.
+
+    Refreshes are single-flight: concurrent callers wait on the same fetch.
+    """
+
+    def __init__(
+        self,
+        *,
+        jwt_key: str | None = None,
+        refresh_interval_seconds: float = 3600,
+        min_refresh_interval_seconds: float = 30,
+    ) -> None:
+        self._static_key = self._load_pem(jwt_key) if jwt_key else None
+        self._refresh_interval = refresh_interval_seconds
+        self._min_refresh_interval = min_refresh_interval_seconds
+        self._keys: dict[str, RSAPublicKey] = {}
+        self._fetched_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_static(self) -> bool:
+        return self._static_key is not None
+
+    async def get_key(self, kid: str | None) -> RSAPublicKey:
+        if self._static_key is not None:
+            return self._static_key
+
+        if self._is_stale():
+            await self.refresh()
+
+        key = self._keys.get(kid) if kid else None
+        if key is None and self._can_force_refresh():
+            await self.refresh(force=True)
+            key = self._keys.get(kid) if kid else None
+
+        if key is None:
+            raise InvalidAuthTokenError(metadata={"reason": "jwk-kid-mismatch"})
+        return key
+
+    async def refresh(self, *, force: bool = False) -> None:
+        """Re-fetch the JWKS. Without `force`, skipped if another caller just refreshed."""
+        if self._static_key is not None:
+            return
+
+        async with self._lock:
+            if not force and not self._is_stale():
+                return
+            if force and not self._can_force_refresh():
+                return
+
+            try:
+                jwks = await get_clerk().jwks.get_jwks_async()
+            except Exception as e:
+                logger.warning("[Auth] Failed to fetch JWKS: %s", e)
+                if not self._keys:
+                    raise InvalidAuthTokenError(metadata={"reason": "jwk-failed-to-load"}) from e
+                # Keep serving the previous keys; retry after the minimum interval.
+                self._fetched_at = time.monotonic() - self._refresh_interval + self._min_refresh_interval
+                return
+
+            keys: dict[str, RSAPublicKey] = {}
+            for jwk in jwks.keys or []:
+                if jwk.kty != "RSA" or not jwk.kid:
+                    continue
+                public_key = RSAAlgorithm.from_jwk(json.dumps(jwk.model_dump()))
+                if isinstance(public_key, RSAPublicKey):
+                    keys[jwk.kid] = public_key
+
+            if not keys:
+                raise InvalidAuthTokenError(metadata={"reason": "jwk-remote-invalid"})
+
+            self._keys = keys
+            self._fetched_at = time.monotonic()
+            logger.info("[Auth] Loaded %d JWKS signing key(s)", len(keys))
+
+    def invalidate(self) -> None:
+        """Mark the cached keys stale so the next lookup re-fetches them."""
+        self._fetched_at = None
+
+    def _is_stale(self) -> bool:
+        if self._fetched_at is None:
+            return True
+        return time.monotonic() - self._fetched_at >= self._refresh_interval
+
+    def _can_force_refresh(self) -> bool:
+        if self._fetched_at is None:
+            return True
+        return time.monotonic() - self._fetched_at >= self._min_refresh_interval
+
+    @staticmethod
+    def _load_pem(pem: str) -> RSAPublicKey:
+        # Clerk shows the PEM with literal newlines; env vars often carry them as "\n".
+        normalized = pem.replace("\\n", "\n").strip()
+        if "\n" not in normalized:
+            body = re.sub(r"-----(BEGIN|END) PUBLIC KEY-----", "", normalized).strip()
+            normalized = f"-----BEGIN PUBLIC KEY-----\n{body}\n-----END PUBLIC KEY-----"
+        key = load_pem_public_key(normalized.encode("utf-8"))
+        if not isinstance(key, RSAPublicKey):
+            raise ValueError("CLERK_JWT_KEY must be an RSA public key")
+        return key
+
+
+@lru_cache(maxsize=1)
+def get_jwks_key_store() -> JwksKeyStore:
+    """Get the process-wide JWKS key store."""
+    settings = get_settings()
+    return JwksKeyStore(
+        jwt_key=settings.clerk_jwt_key or None,
+        refresh_interval_seconds=settings.auth_jwks_refresh_seconds,
+    )
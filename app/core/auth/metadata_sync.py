@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Literal
+
+from app.core.auth.client import update_organization_metadata, update_user_metadata
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+SyncKind = Literal["user", "organization"]
+
+
+@dataclass
+class _SyncJob:
+    kind: SyncKind
+    clerk_id: str
+    public_metadata: dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    not_before: float = 0.0
+
+    @property
+    def key(self) -> tuple[SyncKind, str]:
+        return self.kind, self.clerk_id
+
+
+class ClerkMetadataSyncQueue:
+    """
+    Background writer for Clerk public metadata (the self-healing path of auth).
+
+    - Enqueue is synchronous and never touches the network.
+    - Jobs are keyed by (kind, Clerk id): while one is pending its metadata is
+      merged, while one is in flight or was synced within `suppress_seconds`
+      further enqueues are dropped (tokens minted before the sync still lack the claim).
+    - A single worker task drains up to `batch_size` due jobs concurrently and
+      retries failures with exponential backoff up to `max_attempts`.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = 20,
+        max_attempts: int = 5,
+        retry_base_seconds: float = 1.0,
+        suppress_seconds: float = 300,
+        max_pending: int = 10_000,
+    ) -> None:
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._retry_base = retry_base_seconds
+        self._suppress_seconds = suppress_seconds
+        self._max_pending = max_pending
+
+        self._pending: OrderedDict[tuple[SyncKind, str], _SyncJob] = OrderedDict()
+        self._in_flight: set[tuple[SyncKind, str]] = set()
+        self._synced_until: dict[tuple[SyncKind, str], float] = {}
+
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._closing = False
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def enqueue_user(self, clerk_user_id: str, public_metadata: dict[str, Any]) -> bool:
+        return self._enqueue("user", clerk_user_id, public_metadata)
+
+    def enqueue_organization(self, clerk_org_id: str, public_metadata: dict[str, Any]) -> bool:
+        return self._enqueue("organization", clerk_org_id, public_metadata)
+
+    def _enqueue(self, kind: SyncKind, clerk_id: str, public_metadata: dict[str, Any]) -> bool:
+        """Returns True if a new job was scheduled."""
+        key = (kind, clerk_id)
+        now = time.monotonic()
+
+        synced_until = self._synced_until.get(key)
+        if synced_until is not None:
+            if synced_until > now:
+                return False
+            del self._synced_until[key]
+
+        if key in self._in_flight:
+            return False
+
+        job = self._pending.get(key)
+        if job is not None:
+            job.public_metadata.update(public_metadata)
+            return False
+
+        if len(self._pending) >= self._max_pending:
+            logger.warning("[Auth] Metadata sync queue full, dropping %s %s", kind, clerk_id)
+            return False
+
+        if len(self._synced_until) >= self._max_pending:
+            self._synced_until = {k: v for k, v in self._synced_until.items() if v > now}
+
+        self._pending[key] = _SyncJob(kind=kind, clerk_id=clerk_id, public_metadata=dict(public_metadata))
+        self._ensure_started()
+        self._wakeup.set()
+        return True
+
+    def _ensure_started(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._closing = False
+        self._task = loop.create_task(self._run(), name="clerk-metadata-sync")
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Flush due jobs and stop the worker; jobs waiting on a retry backoff are dropped."""
+        if self._task is None:
+            return
+
+        self._closing = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+        finally:
+            self._task = None
+
+        if self._pending:
+            logger.warning("[Auth] Dropping %d unsynced Clerk metadata job(s) on shutdown", len(self._pending))
+            self._pending.clear()
+
+    async def _run(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if batch:
+                await asyncio.gather(*(self._sync(job) for job in batch))
+                continue
+
+            if self._closing:
+                return
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._next_due_in())
+            except asyncio.TimeoutError:
+                pass
+
+    def _take_batch(self) -> list[_SyncJob]:
+        now = time.monotonic()
+        batch: list[_SyncJob] = []
+        for key, job in list(self._pending.items()):
+            if len(batch) >= self._batch_size:
+                break
+            if job.not_before > now:
+                continue
+            del self._pending[key]
+            self._in_flight.add(key)
+            batch.append(job)
+        return batch
+
+    def _next_due_in(self) -> float | None:
+        if not self._pending:
+            return None
+        next_due = min(job.not_before for job in self._pending.values())
+        return max(0.0, next_due - time.monotonic())
+
+    async def _sync(self, job: _SyncJob) -> None:
+        try:
+            if job.kind == "user":
+                await update_user_metadata(job.clerk_id, public_metadata=job.public_metadata)
+            else:
+                await update_organization_metadata(job.clerk_id, public_metadata=job.public_metadata)
+        except Exception as e:
+            job.attempts += 1
+            if job.attempts >= self._max_attempts:
+                logger.warning(
+                    "[Auth] Giving up syncing %s metadata for %s after %d attempts: %s",
+                    job.kind, job.clerk_id, job.attempts, e,
+                )
+            else:
+                logger.info(
+                    "[Auth] Failed to sync %s metadata for %s (attempt %d): %s",
+                    job.kind, job.clerk_id, job.attempts, e,
+                )
+                job.not_before = time.monotonic() + self._retry_base * 2 ** (job.attempts - 1)
+                self._pending[job.key] = job
+            return
+        finally:
+            self._in_flight.discard(job.key)
+
+        self._synced_until[job.key] = time.monotonic() + self._suppress_seconds
+        logger.info("[Auth] Synced %s metadata to Clerk for %s", job.kind, job.clerk_id)
+
+
+@lru_cache(maxsize=1)
+def get_metadata_sync_queue() -> ClerkMetadataSyncQueue:
+    """Get the process-wide Clerk metadata sync queue."""
+    settings = get_settings()
+    return ClerkMetadataSyncQueue(
+        batch_size=settings.clerk_metadata_sync_batch_size,
+        max_attempts=settings.clerk_metadata_sync_max_attempts,
+        retry_base_seconds=settings.clerk_metadata_sync_retry_base_seconds,
+        suppress_seconds=settings.clerk_metadata_sync_suppress_seconds,
+    )
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any
+
+from app.core.config import get_settings
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of already-verified session token payloads.
+
+    Keyed by the SHA-256 of the raw token (the token itself is never stored) and
+    expiring at the token's own `exp` claim, so a cached entry is never served
+    past the point where verification would have rejected it.
+    Payloads are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, payload = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return payload
+
+    def put(self, token: str, payload: dict[str, Any]) -> None:
+        if self._max_size <= 0:
+            return
+
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)) or exp <= time.time():
+            return
+
+        key = self._key(token)
+        self._entries[key] = (float(exp), payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+@lru_cache(maxsize=1)
+def get_verified_token_cache() -> VerifiedTokenCache:
+    """Get the process-wide verified token cache."""
+    return VerifiedTokenCache(max_size=get_settings().auth_token_cache_size)
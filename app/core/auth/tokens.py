@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import asyncio
-from fastapi import Request
+from datetime import timedelta
 
-from clerk_backend_api.security.types import AuthenticateRequestOptions
+import jwt
+from fastapi import Request
 
-from app.core.auth.client import get_clerk
 from app.core.auth.exceptions import MissingAuthTokenError, InvalidAuthTokenError
+from app.core.auth.jwks import get_jwks_key_store
+from app.core.auth.token_cache import get_verified_token_cache
+from app.core.config import get_settings
 
 
 def extract_session_token(request: Request) -> str:
@@ -21,28 +23,71 @@ def extract_session_token(request: Request) -> str:
     raise MissingAuthTokenError()
 
 
-async def verify_request_with_clerk(request: Request) -> dict:
+def _decode(token: str, key) -> dict:
+    settings = get_settings()
+    payload = jwt.decode(
+        token,
+        key,
+        algorithms=["RS256"],
+        options={"verify_iss": False, "verify_aud": False, "require": ["exp", "sub"]},
+        leeway=timedelta(seconds=settings.auth_clock_skew_seconds),
+    )
+
+    if settings.clerk_authorized_parties:
+        azp = payload.get("azp")
+        if azp is None or azp not in settings.clerk_authorized_parties:
+            raise InvalidAuthTokenError(metadata={"reason": "token-invalid-authorized-parties"})
+
+    return payload
+
+
+async def verify_session_token(token: str) -> dict:
     """
-    Verifies the request with Clerk and returns the JWT payload dict.
+    Verifies a Clerk session JWT in-process and returns its payload.
+
+    Signatures are checked against the cached JWKS (or the configured PEM key);
+    tokens that already passed verification are served from an LRU until `exp`.
     """
-    # ensures clearer error if nothing was sent
-    extract_session_token(request)
+    cache = get_verified_token_cache()
+    cached = cache.get(token)
+    if cached is not None:
+        return cached
 
-    clerk = get_clerk()
+    try:
+        kid = jwt.get_unverified_header(token).get("kid")
+    except jwt.InvalidTokenError:
+        raise InvalidAuthTokenError(metadata={"reason": "token-invalid"})
 
-    # minimal options; Clerk will fetch JWKS if needed
-    options = AuthenticateRequestOptions()
+    key_store = get_jwks_key_store()
+    key = await key_store.get_key(kid)
 
-    state = await asyncio.to_thread(clerk.authenticate_request, request, options)
+    try:
+        try:
+            payload = _decode(token, key)
+        except jwt.InvalidSignatureError:
+            if key_store.is_static:
+                raise
+            # Signing key may have been rotated under the same kid: re-fetch once.
+            await key_store.refresh(force=True)
+            payload = _decode(token, await key_store.get_key(kid))
+    except jwt.ExpiredSignatureError:
+        raise InvalidAuthTokenError(metadata={"reason": "token-expired"})
+    except jwt.InvalidSignatureError:
+        raise InvalidAuthTokenError(metadata={"reason": "token-invalid-signature"})
+    except jwt.ImmatureSignatureError:
+        raise InvalidAuthTokenError(metadata={"reason": "token-not-active-yet"})
+    except jwt.InvalidIssuedAtError:
+        raise InvalidAuthTokenError(metadata={"reason": "token-iat-in-the-future"})
+    except jwt.InvalidTokenError:
+        raise InvalidAuthTokenError(metadata={"reason": "token-invalid"})
 
-    if not getattr(state, "is_signed_in", False):
-        reason = getattr(state, "reason", None)
-        raise InvalidAuthTokenError(
-            metadata={"reason": str(reason) if reason else None}
-        )
+    cache.put(token, payload)
+    return payload
 
-    payload = getattr(state, "payload", None) or {}
-    if not isinstance(payload, dict):
-        raise InvalidAuthTokenError(metadata={"reason": "invalid_payload"})
 
-    return payload
+async def verify_request_with_clerk(request: Request) -> dict:
+    """
+    Verifies the request's Clerk session token and returns the JWT payload dict.
+    """
+    token = extract_session_token(request)
+    return await verify_session_token(token)
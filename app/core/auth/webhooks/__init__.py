@@ -1,5 +1,6 @@
 from .verifier import verify_clerk_webhook
 from .types import ClerkWebhookEvent
 from .handlers import dispatch_webhook_event
+from .consumer import get_webhook_consumer
 
-__all__ = ["verify_clerk_webhook", "ClerkWebhookEvent", "dispatch_webhook_event"]
+__all__ = ["verify_clerk_webhook", "ClerkWebhookEvent", "dispatch_webhook_event", "get_webhook_consumer"]
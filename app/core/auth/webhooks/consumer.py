@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from functools import lru_cache
+
+from app.core.auth.webhooks.handlers import dispatch_webhook_event
+from app.core.auth.webhooks.inbox import ClaimedWebhookEvent, WebhookInboxRepository
+from app.core.config import get_settings
+from app.infrastructure.db import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+_MAX_RETRY_DELAY_SECONDS = 300.0
+
+
+class ClerkWebhookConsumer:
+    """
+    Background processor for the Clerk webhook inbox.
+
+    Keeps up to `concurrency` events in flight, each from a different ordering
+    key (see `WebhookInboxRepository.claim_heads`), so events for one org are
+    applied in order while different orgs proceed in parallel. Claims carry a
+    lease, so rows left PROCESSING by a crashed instance are picked up again.
+    Failures are retried with exponential backoff, then parked as FAILED.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory=AsyncSessionLocal,
+        concurrency: int = 4,
+        lease_seconds: float = 60,
+        max_attempts: int = 8,
+        retry_base_seconds: float = 2.0,
+        poll_interval_seconds: float = 5.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._concurrency = concurrency
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+        self._retry_base = retry_base_seconds
+        self._poll_interval = poll_interval_seconds
+
+        self._active: set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._closing = False
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._closing = False
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="clerk-webhook-consumer")
+
+    def notify(self) -> None:
+        """Signal that new events were stored."""
+        self._wakeup.set()
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop claiming and give in-flight events `timeout` seconds to finish."""
+        if self._task is None:
+            return
+
+        self._closing = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+
+        if self._active:
+            _, pending = await asyncio.wait(self._active, timeout=timeout)
+            for task in pending:
+                # Row stays PROCESSING; it is reclaimed once its lease expires.
+                task.cancel()
+
+    async def _run(self) -> None:
+        while not self._closing:
+            self._wakeup.clear()
+
+            free = self._concurrency - len(self._active)
+            if free > 0:
+                for event in await self._claim(free):
+                    task = asyncio.create_task(self._process(event))
+                    self._active.add(task)
+                    task.add_done_callback(self._on_done)
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        self._active.discard(task)
+        # A finished event may unblock the next one for its key.
+        self._wakeup.set()
+
+    async def _claim(self, limit: int) -> list[ClaimedWebhookEvent]:
+        try:
+            async with self._session_factory() as db:
+                claimed = await WebhookInboxRepository(db).claim_heads(
+                    limit=limit,
+                    lease_seconds=self._lease_seconds,
+                )
+                await db.commit()
+                return claimed
+        except Exception as e:
+            logger.error(f"Failed to claim webhook inbox events: {e}", exc_info=True)
+            return []
+
+    async def _process(self, event: ClaimedWebhookEvent) -> None:
+        try:
+            async with self._session_factory() as db:
+                await dispatch_webhook_event(event.event_type, event.payload, db)
+        except Exception as e:
+            await self._record_failure(event, e)
+            return
+
+        try:
+            async with self._session_factory() as db:
+                await WebhookInboxRepository(db).mark_done(event.svix_id)
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Failed to mark webhook {event.svix_id} done: {e}", exc_info=True)
+
+    async def _record_failure(self, event: ClaimedWebhookEvent, error: Exception) -> None:
+        message = f"{type(error).__name__}: {error}"
+        try:
+            async with self._session_factory() as db:
+                repo = WebhookInboxRepository(db)
+                if event.attempt_count >= self._max_attempts:
+                    logger.error(
+                        f"Giving up on webhook {event.svix_id} ({event.event_type}) "
+                        f"after {event.attempt_count} attempts: {message}"
+                    )
+                    await repo.mark_failed(event.svix_id, error=message)
+                else:
+                    delay = min(self._retry_base * 2 ** (event.attempt_count - 1), _MAX_RETRY_DELAY_SECONDS)
+                    await repo.mark_retry(event.svix_id, error=message, retry_in_seconds=delay)
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Failed to record webhook {event.svix_id} failure: {e}", exc_info=True)
+
+
+@lru_cache(maxsize=1)
+def get_webhook_consumer() -> ClerkWebhookConsumer:
+    """Get the process-wide Clerk webhook inbox consumer."""
+    settings = get_settings()
+    return ClerkWebhookConsumer(
+        concurrency=settings.clerk_webhook_consumer_concurrency,
+        lease_seconds=settings.clerk_webhook_lease_seconds,
+        max_attempts=settings.clerk_webhook_max_attempts,
+        retry_base_seconds=settings.clerk_webhook_retry_base_seconds,
+        poll_interval_seconds=settings.clerk_webhook_poll_interval_seconds,
+    )
@@ -1,11 +1,17 @@
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth.client import update_organization_metadata, update_user_metadata
+from app.core.auth.id_cache import get_org_id_cache, get_user_id_cache
+from app.core.auth.metadata_sync import get_metadata_sync_queue
 from app.domain.users.schemas import UserCreate, UserUpdate
 from app.dependencies.services import get_user_service, get_organization_service
-from app.domain.organization.schemas import OrganizationCreate, OrganizationUpdate
+from app.domain.organization.schemas import (
+    OrganizationCreate,
+    OrganizationUpdate,
+    OrganizationMembershipUpsert,
+)
 from app.domain.organization.models import OrganizationRole
 
 logger = logging.getLogger(__name__)
@@ -24,6 +30,8 @@ class WebhookHandlers:
                 image_url=data.get("image_url"),
             )
             user = await user_svc.create_user(payload)
+            # Drop any cached "not found" so the new id resolves immediately
+            get_user_id_cache().invalidate(user.clerk_user_id)
             # Sync internal ID to Clerk metadata
             await update_user_metadata(user.clerk_user_id, public_metadata={"user_id": user.id})
             logger.info(f"User created: {data['id']}")
@@ -42,6 +50,7 @@ class WebhookHandlers:
                 image_url=data.get("image_url"),
             )
             await user_svc.update_user_by_clerk_id(data["id"], payload)
+            get_user_id_cache().invalidate(data["id"])
             logger.info(f"User updated: {data['id']}")
         except Exception as e:
             logger.error(f"Failed to handle user.updated: {e}", exc_info=True)
@@ -52,6 +61,7 @@ class WebhookHandlers:
         try:
             user_svc = get_user_service(db=db)
             await user_svc.delete_user_by_clerk_id(data["id"])
+            get_user_id_cache().invalidate(data["id"])
             logger.info(f"User deleted: {data['id']}")
         except Exception as e:
             logger.error(f"Failed to handle user.deleted: {e}", exc_info=True)
@@ -67,6 +77,8 @@ class WebhookHandlers:
                 logo_url=data.get("logo_url"),
             )
             org = await org_svc.create_organization(payload)
+            # Drop any cached "not found" so the new id resolves immediately
+            get_org_id_cache().invalidate(org.clerk_id)
             # Sync internal ID to Clerk metadata
             await update_organization_metadata(org.clerk_id, public_metadata={"org_id": org.id})
             logger.info(f"Organization created: {data['id']}")
@@ -84,6 +96,7 @@ class WebhookHandlers:
                 logo_url=data.get("logo_url"),
             )
             await org_svc.update_organization(org.id, payload)
+            get_org_id_cache().invalidate(data["id"])
             logger.info(f"Organization updated: {data['id']}")
         except Exception as e:
             logger.error(f"Failed to handle organization.updated: {e}", exc_info=True)
@@ -95,6 +108,7 @@ class WebhookHandlers:
             org_svc = get_organization_service(db=db)
             org = await org_svc.get_organization_by_clerk_id(data["id"])
             await org_svc.delete_organization(org.id)
+            get_org_id_cache().invalidate(data["id"])
             logger.info(f"Organization deleted: {data['id']}")
         except Exception as e:
             logger.error(f"Failed to handle organization.deleted: {e}", exc_info=True)
@@ -104,44 +118,37 @@ class WebhookHandlers:
     async def handle_organization_membership_created(
         db: AsyncSession, data: Dict[str, Any]
     ) -> None:
+        await WebhookHandlers.handle_organization_memberships_created(db, [data])
+
+    @staticmethod
+    async def handle_organization_memberships_created(
+        db: AsyncSession, events: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Applies a batch of organizationMembership.created payloads in a single
+        transaction (users/orgs created if missing, memberships upserted).
+        """
+        if not events:
+            return
         try:
-            user_svc = get_user_service(db=db)
             org_svc = get_organization_service(db=db)
-
-            clerk_role = data.get("role", "basic_member")
-            role = WebhookHandlers._map_clerk_role(clerk_role)
-
-            user_payload = UserCreate(
-                clerk_user_id=data["public_user_data"]["user_id"],
-                email=data["public_user_data"].get("identifier", ""),
-                first_name=data["public_user_data"].get("first_name"),
-                last_name=data["public_user_data"].get("last_name"),
-                full_name=f"{data['public_user_data'].get('first_name', '')} {data['public_user_data'].get('last_name', '')}".strip() or None,
-            )
-
-            try:
-                user = await user_svc.get_user_by_clerk_id(data["public_user_data"]["user_id"])
-            except Exception:
-                user = await user_svc.create_user(user_payload)
-                await update_user_metadata(user.clerk_user_id, public_metadata={"user_id": user.id})
-
-            org_payload = OrganizationCreate(
-                clerk_id=data["organization"]["id"],
-                name=data["organization"]["name"],
-                logo_url=data["organization"].get("logo_url"),
-            )
-
-            try:
-                org = await org_svc.get_organization_by_clerk_id(data["organization"]["id"])
-            except Exception:
-                org = await org_svc.create_organization(org_payload)
-                await update_organization_metadata(org.clerk_id, public_metadata={"org_id": org.id})
-
-            await org_svc.add_member_to_organization(org.id, user.id, role)
-            logger.info(
-                f"Member added: user={data['public_user_data']['user_id']}, "
-                f"org={data['organization']['id']}, role={role}"
-            )
+            items = [WebhookHandlers._membership_upsert(data) for data in events]
+            result = await org_svc.upsert_memberships(items)
+
+            # Sync internal IDs of newly created rows to Clerk metadata (background)
+            sync_queue = get_metadata_sync_queue()
+            for clerk_user_id in result.created_user_clerk_ids:
+                get_user_id_cache().invalidate(clerk_user_id)
+                sync_queue.enqueue_user(clerk_user_id, {"user_id": result.user_ids[clerk_user_id]})
+            for clerk_org_id in result.created_org_clerk_ids:
+                get_org_id_cache().invalidate(clerk_org_id)
+                sync_queue.enqueue_organization(clerk_org_id, {"org_id": result.org_ids[clerk_org_id]})
+
+            for item in items:
+                logger.info(
+                    f"Member added: user={item.user.clerk_user_id}, "
+                    f"org={item.organization.clerk_id}, role={item.role}"
+                )
         except Exception as e:
             logger.error(
                 f"Failed to handle organizationMembership.created: {e}", exc_info=True
@@ -195,6 +202,25 @@ class WebhookHandlers:
             )
             raise
 
+    @staticmethod
+    def _membership_upsert(data: Dict[str, Any]) -> OrganizationMembershipUpsert:
+        public_user_data = data["public_user_data"]
+        return OrganizationMembershipUpsert(
+            user=UserCreate(
+                clerk_user_id=public_user_data["user_id"],
+                email=public_user_data.get("identifier", ""),
+                first_name=public_user_data.get("first_name"),
+                last_name=public_user_data.get("last_name"),
+                full_name=f"{public_user_data.get('first_name', '')} {public_user_data.get('last_name', '')}".strip() or None,
+            ),
+            organization=OrganizationCreate(
+                clerk_id=data["organization"]["id"],
+                name=data["organization"]["name"],
+                logo_url=data["organization"].get("logo_url"),
+            ),
+            role=WebhookHandlers._map_clerk_role(data.get("role", "basic_member")),
+        )
+
     @staticmethod
     def _map_clerk_role(clerk_role: str) -> OrganizationRole:
         role_lower = clerk_role.lower()
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.auth.webhooks.models import ClerkWebhookInbox, WebhookInboxStatus
+
+
+def ordering_key_for(event_type: str, data: dict[str, Any]) -> str:
+    """
+    Events with the same key are applied in order: organization and membership
+    events by Clerk org id, everything else (user.*) by the object id.
+    """
+    if event_type.startswith("organizationMembership."):
+        org = data.get("organization") or {}
+        if org.get("id"):
+            return org["id"]
+    return data.get("id") or event_type
+
+
+@dataclass(frozen=True)
+class ClaimedWebhookEvent:
+    svix_id: str
+    event_type: str
+    ordering_key: str
+    payload: dict[str, Any]
+    attempt_count: int
+
+
+# Claims the oldest unfinished event of each ordering key, skipping keys whose
+# head is leased by another worker (or waiting on a retry backoff). A key's next
+# event only becomes claimable once its predecessor is DONE or FAILED.
+_CLAIM_HEADS_SQL = text(
+    """
+    WITH heads AS (
+        SELECT i.svix_id
+        FROM clerk_webhook_inbox i
+        WHERE i.status IN ('PENDING', 'PROCESSING')
+          AND i.available_at <= now()
+          AND (i.status = 'PENDING' OR i.locked_until < now())
+          AND NOT EXISTS (
+              SELECT 1
+              FROM clerk_webhook_inbox e
+              WHERE e.ordering_key = i.ordering_key
+                AND e.status IN ('PENDING', 'PROCESSING')
+                AND (e.event_timestamp, e.svix_id) < (i.event_timestamp, i.svix_id)
+          )
+        ORDER BY i.event_timestamp
+        LIMIT :limit
+        FOR UPDATE OF i SKIP LOCKED
+    )
+    UPDATE clerk_webhook_inbox t
+    SET status = 'PROCESSING',
+        locked_until = now() + make_interval(secs => :lease_seconds),
+        attempt_count = t.attempt_count + 1,
+        updated_at = now()
+    FROM heads
+    WHERE t.svix_id = heads.svix_id
+    RETURNING t.svix_id, t.event_type, t.ordering_key, t.payload, t.attempt_count
+    """
+)
+
+
+class WebhookInboxRepository:
+    def __init__(self, db: AsyncSession):
+        self._db = db
+
+    async def add_if_absent(
+        self,
+        *,
+        svix_id: str,
+        event_type: str,
+        event_timestamp: int,
+        payload: dict[str, Any],
+    ) -> bool:
+        """Store a delivery; returns False if this svix-id was already received."""
+        stmt = (
+            pg_insert(ClerkWebhookInbox)
+            .values(
+                svix_id=svix_id,
+                event_type=event_type,
+                ordering_key=ordering_key_for(event_type, payload),
+                event_timestamp=event_timestamp,
+                payload=payload,
+            )
+            .on_conflict_do_nothing(index_elements=[ClerkWebhookInbox.svix_id])
+            .returning(ClerkWebhookInbox.svix_id)
+        )
+        result = await self._db.execute(stmt)
+        return result.scalar() is not None
+
+    async def claim_heads(self, *, limit: int, lease_seconds: float) -> list[ClaimedWebhookEvent]:
+        result = await self._db.execute(
+            _CLAIM_HEADS_SQL,
+            {"limit": limit, "lease_seconds": float(lease_seconds)},
+        )
+        return [
+            ClaimedWebhookEvent(
+                svix_id=row.svix_id,
+                event_type=row.event_type,
+                ordering_key=row.ordering_key,
+                payload=row.payload,
+                attempt_count=row.attempt_count,
+            )
+            for row in result
+        ]
+
+    async def mark_done(self, svix_id: str) -> None:
+        await self._db.execute(
+            update(ClerkWebhookInbox)
+            .where(ClerkWebhookInbox.svix_id == svix_id)
+            .values(
+                status=WebhookInboxStatus.DONE,
+                locked_until=None,
+                processed_at=text("now()"),
+                last_error=None,
+            )
+        )
+
+    async def mark_retry(self, svix_id: str, *, error: str, retry_in_seconds: float) -> None:
+        await self._db.execute(
+            update(ClerkWebhookInbox)
+            .where(ClerkWebhookInbox.svix_id == svix_id)
+            .values(
+                status=WebhookInboxStatus.PENDING,
+                locked_until=None,
+                available_at=text("now() + make_interval(secs => :retry_in)").bindparams(
+                    retry_in=float(retry_in_seconds)
+                ),
+                last_error=error,
+            )
+        )
+
+    async def mark_failed(self, svix_id: str, *, error: str) -> None:
+        await self._db.execute(
+            update(ClerkWebhookInbox)
+            .where(ClerkWebhookInbox.svix_id == svix_id)
+            .values(
+                status=WebhookInboxStatus.FAILED,
+                locked_until=None,
+                processed_at=text("now()"),
+                last_error=error,
+            )
+        )
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from enum import Enum
+
+from app.domain._shared.types import DateTime
+from app.infrastructure.db import Base
+import app.infrastructure.db.sa as sa
+from app.infrastructure.db.mixins import TimestampsMixin
+
+
+class WebhookInboxStatus(str, Enum):
+    PENDING = "PENDING"
+    PROCESSING = "PROCESSING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+
+class ClerkWebhookInbox(TimestampsMixin, Base):
+    """
+    Verified Clerk webhook deliveries awaiting (or done with) processing.
+
+    Keyed by the `svix-id` header, so Svix replays of the same delivery are
+    no-ops. Events sharing an `ordering_key` (Clerk org id, or user id for
+    user.* events) are processed strictly in `event_timestamp` order.
+    """
+
+    __tablename__ = "clerk_webhook_inbox"
+
+    svix_id: sa.Mapped[str] = sa.mapped_column(sa.String, primary_key=True)
+
+    event_type: sa.Mapped[str] = sa.mapped_column(sa.String, nullable=False)
+    ordering_key: sa.Mapped[str] = sa.mapped_column(sa.String, nullable=False)
+    event_timestamp: sa.Mapped[int] = sa.mapped_column(sa.BigInteger, nullable=False)
+    payload: sa.Mapped[dict] = sa.mapped_column(sa.JSONB, nullable=False)
+
+    status: sa.Mapped[WebhookInboxStatus] = sa.mapped_column(
+        sa.SAEnum(WebhookInboxStatus, name="webhook_inbox_status", native_enum=False),
+        nullable=False,
+        server_default=sa.text(f"'{WebhookInboxStatus.PENDING.value}'"),
+    )
+
+    attempt_count: sa.Mapped[int] = sa.mapped_column(
+        sa.Integer,
+        nullable=False,
+        server_default=sa.text("0"),
+    )
+
+    # Not claimable before this (retry backoff)
+    available_at: sa.Mapped[DateTime] = sa.mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.text("now()"),
+    )
+    # Claim lease; a PROCESSING row past this is considered abandoned
+    locked_until: sa.Mapped[DateTime | None] = sa.mapped_column(sa.DateTime(timezone=True), nullable=True)
+    processed_at: sa.Mapped[DateTime | None] = sa.mapped_column(sa.DateTime(timezone=True), nullable=True)
+
+    last_error: sa.Mapped[str | None] = sa.mapped_column(sa.Text, nullable=True)
+
+    __table_args__ = (
+        # Head-of-key lookups for unfinished events
+        sa.Index(
+            "ix_clerk_webhook_inbox_open_key_ts",
+            "ordering_key",
+            "event_timestamp",
+            "svix_id",
+            postgresql_where=sa.text("status IN ('PENDING','PROCESSING')"),
+        ),
+        sa.Index(
+            "ix_clerk_webhook_inbox_open_available",
+            "available_at",
+            postgresql_where=sa.text("status IN ('PENDING','PROCESSING')"),
+        ),
+    )
+
+
+__all__ = [
+    "ClerkWebhookInbox",
+    "WebhookInboxStatus",
+]
@@ -71,7 +71,11 @@ from .handlers import BasePubSubHandler, GcsUploadHandler
 from .dispatcher import PubSubDispatcher, get_dispatcher, reset_dispatcher
 
 # Publisher
-from .publisher import MockPubSubPublisher, PubSubPublisher
+from .publisher import CoalescingPubSubPublisher, MockPubSubPublisher, PubSubPublisher
+from .loopback import LoopbackPubSubBroker
+
+# Streaming pull
+from .subscriber import PubSubPullSubscriber, build_pull_subscriber
 
 # Setup and dependencies
 from .setup import get_publisher, setup_pubsub, teardown_pubsub
@@ -108,8 +112,13 @@ __all__ = [
     "get_dispatcher",
     "reset_dispatcher",
     # Publisher
+    "CoalescingPubSubPublisher",
+    "LoopbackPubSubBroker",
     "MockPubSubPublisher",
     "PubSubPublisher",
+    # Streaming pull
+    "PubSubPullSubscriber",
+    "build_pull_subscriber",
     # Setup and dependencies
     "get_publisher",
     "setup_pubsub",
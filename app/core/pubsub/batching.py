@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, Sequence, TypeVar
+
+from .metrics import register_gauge
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Per-item outcome of a batch: None for success, or the exception that item's
+# caller should see (e.g. PubSubDropError / PubSubRetryableError).
+BatchProcessor = Callable[[list[T]], Awaitable[Sequence[BaseException | None]]]
+
+
+class MicroBatcher(Generic[T]):
+    """
+    Collects items submitted by concurrent handlers for up to `window_seconds`
+    (or until `max_size` items) and processes them with one call to `process`.
+
+    Each `submit()` waits for its own item's outcome, so per-message ack/nack
+    is unchanged: the caller raises exactly what it would have raised alone.
+    A `name` exposes the number of waiting items as a gauge.
+    """
+
+    def __init__(
+        self,
+        process: BatchProcessor[T],
+        *,
+        max_size: int = 100,
+        window_seconds: float = 0.05,
+        name: str | None = None,
+    ) -> None:
+        self._process = process
+        self._max_size = max(1, max_size)
+        self._window = window_seconds
+        self._pending: list[tuple[T, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        if name:
+            register_gauge(
+                "pubsub_batch_pending_items",
+                "Items waiting for the next micro-batch",
+                lambda: len(self._pending),
+                batcher=name,
+            )
+
+    async def submit(self, item: T) -> None:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self._max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+
+        error = await future
+        if error is not None:
+            raise error
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[T, asyncio.Future]]) -> None:
+        try:
+            outcomes = await self._process([item for item, _ in batch])
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            logger.error("Batch of %d items failed: %s", len(batch), e)
+            outcomes = [e] * len(batch)
+
+        for (_, future), outcome in zip(batch, outcomes):
+            if not future.done():
+                future.set_result(outcome)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import base64
+import binascii
 import json
-from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, TypeVar
 
@@ -12,23 +12,96 @@ from .enums import PubSubSubscription
 
 T = TypeVar("T", bound=BaseModel)
 
+_UNSET: Any = object()
+
 
-@dataclass(frozen=True)
 class PubSubContext:
-    subscription_resource: str
-    subscription: PubSubSubscription | None
-    subscription_short_name: str
-    message_id: str
-    publish_time: datetime
-    attributes: dict[str, str] = field(default_factory=dict)
-    data_raw: bytes = field(default=b"")
-    data_text: str | None = None
-    data_json: Any | None = None
+    """
+    A received message. Routing fields (subscription, attributes) are plain
+    slots; the payload is kept as delivered (base64 text for push, bytes for
+    pull) and decoded on first access to `data_raw`, `data_text`, `data_json`
+    or `parse_as`, then cached. Handlers are matched on attributes before any
+    payload decoding happens.
+    """
+
+    __slots__ = (
+        "subscription_resource",
+        "subscription",
+        "subscription_short_name",
+        "message_id",
+        "publish_time",
+        "attributes",
+        "_data_b64",
+        "_data_raw",
+        "_data_text",
+        "_data_json",
+        "_parsed",
+    )
+
+    def __init__(
+        self,
+        subscription_resource: str,
+        subscription: PubSubSubscription | None,
+        subscription_short_name: str,
+        message_id: str,
+        publish_time: datetime,
+        attributes: dict[str, str] | None = None,
+        data_raw: bytes | None = None,
+        *,
+        data_b64: str | None = None,
+    ) -> None:
+        self.subscription_resource = subscription_resource
+        self.subscription = subscription
+        self.subscription_short_name = subscription_short_name
+        self.message_id = message_id
+        self.publish_time = publish_time
+        self.attributes = attributes or {}
+        self._data_b64 = data_b64
+        self._data_raw = data_raw
+        self._data_text = _UNSET
+        self._data_json = _UNSET
+        self._parsed: dict[type, BaseModel] = {}
+
+    @property
+    def data_raw(self) -> bytes:
+        if self._data_raw is None:
+            try:
+                self._data_raw = base64.b64decode(self._data_b64 or "")
+            except (binascii.Error, ValueError):
+                self._data_raw = b""
+        return self._data_raw
+
+    @property
+    def data_text(self) -> str | None:
+        if self._data_text is _UNSET:
+            try:
+                self._data_text = self.data_raw.decode("utf-8")
+            except UnicodeDecodeError:
+                self._data_text = None
+        return self._data_text
+
+    @property
+    def data_json(self) -> Any | None:
+        if self._data_json is _UNSET:
+            raw = self.data_raw
+            try:
+                self._data_json = json.loads(raw) if raw else None
+            except ValueError:
+                self._data_json = None
+        return self._data_json
 
     def parse_as(self, model: type[T]) -> T:
-        if self.data_json is None or not isinstance(self.data_json, dict):
-            raise ValueError("JSON data not available or invalid")
-        return model.model_validate(self.data_json)
+        """Validate the payload as `model` (straight from bytes if not decoded yet); cached per model."""
+        parsed = self._parsed.get(model)
+        if parsed is None:
+            if self._data_json is not _UNSET:
+                if not isinstance(self._data_json, dict):
+                    raise ValueError("JSON data not available or invalid")
+                parsed = model.model_validate(self._data_json)
+            else:
+                parsed = model.model_validate_json(self.data_raw)
+            self._parsed[model] = parsed
+        return parsed  # type: ignore[return-value]
 
     def get_attribute(self, key: str, default: str | None = None) -> str | None:
         return self.attributes.get(key, default)
@@ -45,6 +118,12 @@ class PubSubContext:
     def object_id(self) -> str | None:
         return self.attributes.get("objectId")
 
+    def __repr__(self) -> str:
+        return (
+            f"PubSubContext(subscription={self.subscription_short_name!r}, "
+            f"message_id={self.message_id!r}, attributes={self.attributes!r})"
+        )
+
     @classmethod
     def from_push_message(
         cls,
@@ -54,36 +133,32 @@ class PubSubContext:
         data_b64: str,
         attributes: dict[str, str] | None = None,
     ) -> PubSubContext:
-        attributes = attributes or {}
-        subscription_short = subscription.rsplit("/", 1)[-1]
-        subscription_enum = PubSubSubscription.from_resource_name(subscription)
-
-        try:
-            data_raw = base64.b64decode(data_b64)
-        except Exception:
-            data_raw = b""
-
-        data_text = None
-        try:
-            data_text = data_raw.decode("utf-8")
-        except Exception:
-            pass
-
-        data_json = None
-        if data_text:
-            try:
-                data_json = json.loads(data_text)
-            except Exception:
-                pass
+        return cls(
+            subscription_resource=subscription,
+            subscription=PubSubSubscription.from_resource_name(subscription),
+            subscription_short_name=subscription.rsplit("/", 1)[-1],
+            message_id=message_id,
+            publish_time=publish_time,
+            attributes=attributes,
+            data_b64=data_b64,
+        )
 
+    @classmethod
+    def from_raw_message(
+        cls,
+        subscription: str,
+        message_id: str,
+        publish_time: datetime,
+        data: bytes,
+        attributes: dict[str, str] | None = None,
+    ) -> PubSubContext:
+        """Build a context from raw message bytes (streaming pull)."""
         return cls(
             subscription_resource=subscription,
-            subscription=subscription_enum,
-            subscription_short_name=subscription_short,
+            subscription=PubSubSubscription.from_resource_name(subscription),
+            subscription_short_name=subscription.rsplit("/", 1)[-1],
             message_id=message_id,
             publish_time=publish_time,
             attributes=attributes,
-            data_raw=data_raw,
-            data_text=data_text,
-            data_json=data_json,
+            data_raw=data,
         )
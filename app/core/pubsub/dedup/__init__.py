@@ -0,0 +1,3 @@
+from .cache import DedupStore, MessageDeduplicator, SeenMessageCache
+
+__all__ = ["DedupStore", "MessageDeduplicator", "SeenMessageCache"]
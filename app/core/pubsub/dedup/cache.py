@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Protocol
+
+from ..context import PubSubContext
+from ..metrics import DEDUP_LOOKUPS
+
+logger = logging.getLogger(__name__)
+
+
+class DedupStore(Protocol):
+    """Shared record of processed messages (e.g. Postgres, see store.py)."""
+
+    async def seen(self, subscription: str, message_id: str) -> bool: ...
+
+    async def mark(self, subscription: str, message_id: str) -> None: ...
+
+
+class SeenMessageCache:
+    """Bounded TTL set of (subscription, message_id) pairs already processed."""
+
+    def __init__(self, *, max_size: int = 100_000, ttl_seconds: float = 3600) -> None:
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[tuple[str, str], float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        expires_at = self._entries.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False
+        self._entries.move_to_end(key)
+        return True
+
+    def add(self, key: tuple[str, str]) -> None:
+        if self._max_size <= 0:
+            return
+        self._entries[key] = time.monotonic() + self._ttl
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class MessageDeduplicator:
+    """
+    Short-circuits Pub/Sub redeliveries of messages this subscription already
+    processed, before any handler opens a session. Checks the in-process cache
+    first, then the optional shared store (which also covers other instances).
+    """
+
+    def __init__(
+        self,
+        cache: SeenMessageCache,
+        store: DedupStore | None = None,
+        *,
+        stats_log_seconds: float = 300.0,
+    ) -> None:
+        self._cache = cache
+        self._store = store
+        self._stats_log_seconds = stats_log_seconds
+        self._last_stats_log = time.monotonic()
+        self.cache_hits = 0
+        self.store_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(ctx: PubSubContext) -> tuple[str, str]:
+        return ctx.subscription_short_name, ctx.message_id
+
+    async def is_duplicate(self, ctx: PubSubContext) -> bool:
+        if not ctx.message_id:
+            return False
+
+        key = self._key(ctx)
+        if key in self._cache:
+            self.cache_hits += 1
+            DEDUP_LOOKUPS.inc(result="cache_hit")
+            return True
+
+        if self._store is not None:
+            try:
+                if await self._store.seen(*key):
+                    self.store_hits += 1
+                    DEDUP_LOOKUPS.inc(result="store_hit")
+                    self._cache.add(key)
+                    return True
+            except Exception as e:
+                # Fall through to the handlers; they are idempotent on message id
+                logger.warning("Dedup store lookup failed: %s", e)
+
+        self.misses += 1
+        DEDUP_LOOKUPS.inc(result="miss")
+        self._maybe_log_stats()
+        return False
+
+    async def mark_processed(self, ctx: PubSubContext) -> None:
+        if not ctx.message_id:
+            return
+
+        key = self._key(ctx)
+        self._cache.add(key)
+        if self._store is not None:
+            try:
+                await self._store.mark(*key)
+            except Exception as e:
+                logger.warning("Dedup store write failed: %s", e)
+
+    def stats(self) -> dict[str, int | float]:
+        lookups = self.cache_hits + self.store_hits + self.misses
+        return {
+            "size": len(self._cache),
+            "cache_hits": self.cache_hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.cache_hits + self.store_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+    def _maybe_log_stats(self) -> None:
+        now = time.monotonic()
+        if now - self._last_stats_log < self._stats_log_seconds:
+            return
+        self._last_stats_log = now
+        logger.info("Pub/Sub dedup stats: %s", self.stats())
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from app.domain._shared.types import DateTime
+from app.infrastructure.db import Base
+import app.infrastructure.db.sa as sa
+
+
+class PubSubProcessedMessage(Base):
+    """Pub/Sub messages already processed per subscription (redelivery dedup)."""
+
+    __tablename__ = "pubsub_processed_message"
+
+    subscription: sa.Mapped[str] = sa.mapped_column(sa.String, primary_key=True)
+    message_id: sa.Mapped[str] = sa.mapped_column(sa.String, primary_key=True)
+
+    processed_at: sa.Mapped[DateTime] = sa.mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.text("now()"),
+    )
+
+    __table_args__ = (
+        sa.Index("ix_pubsub_processed_message_processed_at", "processed_at"),
+    )
+
+
+__all__ = [
+    "PubSubProcessedMessage",
+]
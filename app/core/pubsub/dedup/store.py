@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.pubsub.dedup.models import PubSubProcessedMessage
+from app.infrastructure.db import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Rows older than the retention are pruned every this many marks
+_PRUNE_EVERY = 1000
+
+
+class PostgresDedupStore:
+    """
+    `DedupStore` backed by the `pubsub_processed_message` table, shared by all
+    instances. One primary-key lookup per cache miss, one insert per message.
+    """
+
+    def __init__(self, *, session_factory=AsyncSessionLocal, retention_seconds: float = 7 * 24 * 3600) -> None:
+        self._session_factory = session_factory
+        self._retention = retention_seconds
+        self._marks = 0
+
+    async def seen(self, subscription: str, message_id: str) -> bool:
+        async with self._session_factory() as db:
+            result = await db.execute(
+                select(PubSubProcessedMessage.message_id).where(
+                    PubSubProcessedMessage.subscription == subscription,
+                    PubSubProcessedMessage.message_id == message_id,
+                )
+            )
+            return result.scalar() is not None
+
+    async def mark(self, subscription: str, message_id: str) -> None:
+        self._marks += 1
+        async with self._session_factory() as db:
+            await db.execute(
+                pg_insert(PubSubProcessedMessage)
+                .values(subscription=subscription, message_id=message_id)
+                .on_conflict_do_nothing()
+            )
+            if self._marks % _PRUNE_EVERY == 0:
+                result = await db.execute(
+                    delete(PubSubProcessedMessage).where(
+                        PubSubProcessedMessage.processed_at
+                        < text("now() - make_interval(secs => :retention)").bindparams(retention=float(self._retention))
+                    )
+                )
+                logger.info("Pruned %d processed-message rows", result.rowcount)
+            await db.commit()
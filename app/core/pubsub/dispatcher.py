@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from collections import defaultdict
 from typing import TYPE_CHECKING
 
+from app.core.config import get_settings
+
 from .context import PubSubContext
+from .dedup import MessageDeduplicator, SeenMessageCache
 from .enums import PubSubSubscription
 from .exceptions import PubSubDropError, PubSubRetryableError
+from .metrics import (
+    DISPATCH_MESSAGES,
+    HANDLER_DURATION,
+    HANDLER_MESSAGES,
+    LIMITER_WAIT,
+    register_gauge,
+)
 
 if TYPE_CHECKING:
     from .protocols import PubSubHandlerProtocol
@@ -14,9 +26,38 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 class PubSubDispatcher:
-    def __init__(self) -> None:
+    """
+    Routes a message to every matching handler of its subscription.
+
+    Matching handlers run concurrently, each bounded by its `timeout_seconds`
+    (or the dispatcher default); a timeout counts as a retryable failure.
+    `max_concurrency` caps handler executions in flight across all messages.
+    With a `dedup`, redeliveries of already processed messages are skipped
+    before any handler runs.
+    """
+
+    def __init__(
+        self,
+        *,
+        handler_timeout_seconds: float | None = None,
+        max_concurrency: int | None = None,
+        dedup: MessageDeduplicator | None = None,
+    ) -> None:
         self._handlers: dict[PubSubSubscription, list[PubSubHandlerProtocol]] = defaultdict(list)
         self._all_handlers: list[PubSubHandlerProtocol] = []
+        self._handler_timeout = handler_timeout_seconds
+        self._limiter = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._dedup = dedup
+        self._in_flight = 0
+        register_gauge(
+            "pubsub_handlers_in_flight",
+            "Handler executions currently running",
+            lambda: self._in_flight,
+        )
+
+    @property
+    def dedup(self) -> MessageDeduplicator | None:
+        return self._dedup
 
     def register(self, handler: PubSubHandlerProtocol) -> None:
         self._all_handlers.append(handler)
@@ -28,47 +69,133 @@ class PubSubDispatcher:
         return self._handlers.get(subscription, []) if subscription else []
 
     async def dispatch(self, ctx: PubSubContext) -> bool:
+        subscription = ctx.subscription_short_name
         if not ctx.subscription:
-            logger.warning("Unknown subscription %s", ctx.subscription_short_name)
+            logger.warning("Unknown subscription %s", subscription)
+            DISPATCH_MESSAGES.inc(subscription=subscription, result="unrouted")
             return False
 
         handlers = self.get_handlers(ctx.subscription)
         if not handlers:
             logger.warning("No handlers for %s", ctx.subscription.value)
+            DISPATCH_MESSAGES.inc(subscription=subscription, result="unrouted")
             return False
 
-        processed = False
-        retryable_errors = []
-
-        for handler in handlers:
-            try:
-                if not handler.matches(ctx):
-                    continue
+        if self._dedup is not None and await self._dedup.is_duplicate(ctx):
+            logger.info("Skipping already processed message %s", ctx.message_id)
+            DISPATCH_MESSAGES.inc(subscription=subscription, result="duplicate")
+            return False
 
-                await handler.handle(ctx)
-                processed = True
-                logger.info("Handler %s processed message %s", handler.name, ctx.message_id)
+        outcomes = await asyncio.gather(*(self._run_handler(h, ctx) for h in handlers))
 
-            except PubSubDropError as e:
-                logger.warning("Handler %s dropped message: %s", handler.name, e)
-            except PubSubRetryableError as e:
-                logger.error("Handler %s failed (retryable): %s", handler.name, e)
-                retryable_errors.append(e)
-            except Exception as e:
-                logger.exception("Handler %s unexpected error", handler.name)
-                retryable_errors.append(PubSubRetryableError(f"Unexpected: {e}"))
+        processed = any(outcome is True for outcome in outcomes)
+        retryable_errors = [o for o in outcomes if isinstance(o, PubSubRetryableError)]
 
         if retryable_errors:
+            DISPATCH_MESSAGES.inc(subscription=subscription, result="retry")
             raise PubSubRetryableError(f"Errors in handlers: {retryable_errors}")
 
+        if self._dedup is not None:
+            await self._dedup.mark_processed(ctx)
+
+        DISPATCH_MESSAGES.inc(subscription=subscription, result="handled")
         return processed
 
+    async def _run_handler(
+        self,
+        handler: PubSubHandlerProtocol,
+        ctx: PubSubContext,
+    ) -> bool | PubSubRetryableError:
+        """Returns True if handled, False if skipped or dropped, or the retryable error."""
+        subscription = ctx.subscription_short_name
+        try:
+            if not handler.matches(ctx):
+                return False
+        except Exception as e:
+            logger.exception("Handler %s unexpected error", handler.name)
+            HANDLER_MESSAGES.inc(subscription=subscription, handler=handler.name, outcome="unexpected")
+            return PubSubRetryableError(f"Unexpected: {e}")
+
+        timeout = getattr(handler, "timeout_seconds", None) or self._handler_timeout
+        if self._limiter is not None:
+            waited = time.perf_counter()
+            async with self._limiter:
+                LIMITER_WAIT.observe(time.perf_counter() - waited, subscription=subscription)
+                outcome, result = await self._timed_handle(handler, ctx, timeout)
+        else:
+            outcome, result = await self._timed_handle(handler, ctx, timeout)
+
+        HANDLER_MESSAGES.inc(subscription=subscription, handler=handler.name, outcome=outcome)
+        return result
+
+    async def _timed_handle(
+        self,
+        handler: PubSubHandlerProtocol,
+        ctx: PubSubContext,
+        timeout: float | None,
+    ) -> tuple[str, bool | PubSubRetryableError]:
+        """Runs the handler; returns its metrics outcome label and dispatch result."""
+        self._in_flight += 1
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(handler.handle(ctx), timeout)
+            logger.info("Handler %s processed message %s", handler.name, ctx.message_id)
+            outcome, result = "processed", True
+
+        except PubSubDropError as e:
+            logger.warning("Handler %s dropped message: %s", handler.name, e)
+            outcome, result = "dropped", False
+        except PubSubRetryableError as e:
+            logger.error("Handler %s failed (retryable): %s", handler.name, e)
+            outcome, result = "retryable", e
+        except asyncio.TimeoutError:
+            logger.error("Handler %s timed out on message %s", handler.name, ctx.message_id)
+            outcome, result = "retryable", PubSubRetryableError(f"Handler {handler.name} timed out")
+        except Exception as e:
+            logger.exception("Handler %s unexpected error", handler.name)
+            outcome, result = "unexpected", PubSubRetryableError(f"Unexpected: {e}")
+        finally:
+            self._in_flight -= 1
+
+        HANDLER_DURATION.observe(
+            time.perf_counter() - started,
+            subscription=ctx.subscription_short_name,
+            handler=handler.name,
+            outcome=outcome,
+        )
+        return outcome, result
+
 _dispatcher: PubSubDispatcher | None = None
 
+def _build_dedup() -> MessageDeduplicator | None:
+    settings = get_settings()
+    if settings.pubsub_dedup_cache_size <= 0 and not settings.pubsub_dedup_postgres:
+        return None
+
+    store = None
+    if settings.pubsub_dedup_postgres:
+        from .dedup.store import PostgresDedupStore
+
+        store = PostgresDedupStore(retention_seconds=settings.pubsub_dedup_retention_seconds)
+
+    return MessageDeduplicator(
+        SeenMessageCache(
+            max_size=settings.pubsub_dedup_cache_size,
+            ttl_seconds=settings.pubsub_dedup_ttl_seconds,
+        ),
+        store,
+    )
+
+
 def get_dispatcher() -> PubSubDispatcher:
     global _dispatcher
     if _dispatcher is None:
-        _dispatcher = PubSubDispatcher()
+        settings = get_settings()
+        _dispatcher = PubSubDispatcher(
+            handler_timeout_seconds=settings.pubsub_handler_timeout_seconds,
+            max_concurrency=settings.pubsub_dispatch_max_concurrency,
+            dedup=_build_dedup(),
+        )
     return _dispatcher
 
 def reset_dispatcher() -> None:
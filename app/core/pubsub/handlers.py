@@ -9,6 +9,8 @@ from .enums import PubSubSubscription
 class BasePubSubHandler(ABC):
     name: ClassVar[str]
     subscriptions: ClassVar[set[PubSubSubscription]]
+    # Overrides the dispatcher's default handler timeout
+    timeout_seconds: ClassVar[float | None] = None
 
     def matches(self, ctx: PubSubContext) -> bool:
         return ctx.subscription in self.subscriptions
@@ -0,0 +1,160 @@
+"""
+In-memory stand-ins for the google-cloud Pub/Sub clients, for running the
+pull runtime (see subscriber.py) without GCP or the emulator.
+
+Usage:
+    client = InMemorySubscriberClient()
+    client.put(PubSubSubscription.DOCUMENT_UPLOADS_API, b'{"name": "..."}', {"eventType": "OBJECT_FINALIZE"})
+    subscriber = PubSubPullSubscriber(PubSubSubscription.DOCUMENT_UPLOADS_API, project_id="local", client=client)
+    await subscriber.run(stop)
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import itertools
+import queue
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from .enums import PubSubSubscription
+
+_ids = itertools.count(1)
+
+
+def _short_name(subscription: PubSubSubscription | str) -> str:
+    return str(subscription).rsplit("/", 1)[-1]
+
+
+class InMemoryMessage:
+    """Duck-typed `pubsub_v1.subscriber.message.Message`."""
+
+    def __init__(self, data: bytes, attributes: dict[str, str] | None = None, ordering_key: str = "") -> None:
+        self.message_id = str(next(_ids))
+        self.data = data
+        self.attributes = attributes or {}
+        self.ordering_key = ordering_key
+        self.publish_time = datetime.now(timezone.utc)
+        self.delivery_attempt = 0
+        self._on_settle: Callable[[InMemoryMessage, bool], None] | None = None
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    def ack(self) -> None:
+        self._settle(True)
+
+    def nack(self) -> None:
+        self._settle(False)
+
+    def modify_ack_deadline(self, seconds: int) -> None:
+        pass
+
+    def _settle(self, acked: bool) -> None:
+        on_settle, self._on_settle = self._on_settle, None
+        if on_settle is not None:
+            on_settle(self, acked)
+
+
+class _InMemoryStreamingPullFuture(concurrent.futures.Future):
+    def __init__(self) -> None:
+        super().__init__()
+        self.stopped = threading.Event()
+
+    def cancel(self) -> bool:
+        self.stopped.set()
+        if not self.done():
+            self.set_result(True)
+        return True
+
+
+class InMemorySubscriberClient:
+    """
+    Duck-typed `pubsub_v1.SubscriberClient`. Messages `put()` on a subscription
+    are delivered to its `subscribe()` callback from a background thread, with
+    at most `flow_control.max_messages` unsettled at once. Nacked messages are
+    redelivered; acked ones are recorded in `acked`.
+    """
+
+    def __init__(self) -> None:
+        self._queues: dict[str, queue.Queue[InMemoryMessage]] = {}
+        self._lock = threading.Lock()
+        self.acked: list[InMemoryMessage] = []
+        self.nacked: list[InMemoryMessage] = []
+
+    def _queue(self, subscription: PubSubSubscription | str) -> queue.Queue[InMemoryMessage]:
+        with self._lock:
+            return self._queues.setdefault(_short_name(subscription), queue.Queue())
+
+    def subscription_path(self, project: str, subscription: str) -> str:
+        return f"projects/{project}/subscriptions/{subscription}"
+
+    def put(
+        self,
+        subscription: PubSubSubscription | str,
+        data: bytes,
+        attributes: dict[str, str] | None = None,
+    ) -> InMemoryMessage:
+        message = InMemoryMessage(data, attributes)
+        self._queue(subscription).put(message)
+        return message
+
+    def pending(self, subscription: PubSubSubscription | str) -> int:
+        return self._queue(subscription).qsize()
+
+    def subscribe(
+        self,
+        subscription: str,
+        callback: Callable[[Any], Any],
+        flow_control: Any = (),
+        **kwargs: Any,
+    ) -> _InMemoryStreamingPullFuture:
+        max_messages = getattr(flow_control, "max_messages", 1000)
+        future = _InMemoryStreamingPullFuture()
+        threading.Thread(
+            target=self._deliver,
+            args=(self._queue(subscription), callback, max_messages, future),
+            daemon=True,
+        ).start()
+        return future
+
+    def _deliver(
+        self,
+        messages: queue.Queue[InMemoryMessage],
+        callback: Callable[[Any], Any],
+        max_messages: int,
+        future: _InMemoryStreamingPullFuture,
+    ) -> None:
+        outstanding = threading.BoundedSemaphore(max_messages)
+
+        def on_settle(message: InMemoryMessage, acked: bool) -> None:
+            outstanding.release()
+            with self._lock:
+                (self.acked if acked else self.nacked).append(message)
+            if not acked:
+                messages.put(message)
+
+        while not future.stopped.is_set():
+            if not outstanding.acquire(timeout=0.05):
+                continue
+            try:
+                message = messages.get(timeout=0.05)
+            except queue.Empty:
+                outstanding.release()
+                continue
+            if future.stopped.is_set():
+                messages.put(message)
+                outstanding.release()
+                break
+            message.delivery_attempt += 1
+            message._on_settle = on_settle
+            try:
+                callback(message)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                return
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,227 @@
+"""
+In-process Pub/Sub broker for benchmarks and local development without GCP.
+
+`LoopbackPubSubBroker` implements `PubSubPublisherProtocol`: messages published
+to a topic are delivered to the dispatcher for every subscription routed from
+that topic, with push-like semantics:
+
+- a delivery is acked when dispatch returns, nacked when it raises
+- nacked deliveries are redelivered with exponential backoff until
+  `max_delivery_attempts`, then dead-lettered
+- a delivery still running after `ack_deadline_seconds` is redelivered while
+  the first attempt carries on (as Pub/Sub does when an ack is late)
+- `duplicate_ratio` of messages are delivered twice (at-least-once)
+
+Messages on topics without a route are only recorded, like MockPubSubPublisher.
+
+Usage:
+    broker = LoopbackPubSubBroker(latency_seconds=0.02, duplicate_ratio=0.05)
+    await broker.publish(PubSubTopic.DOCUMENT_UPLOADS, metadata, attributes)
+    await broker.drain()
+    print(broker.stats())
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+import random
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from .context import PubSubContext
+from .dispatcher import PubSubDispatcher, get_dispatcher
+from .enums import PubSubSubscription, PubSubTopic
+from .exceptions import PubSubPublishError
+
+logger = logging.getLogger(__name__)
+
+# GCS upload notifications are published to DOCUMENT_UPLOADS and pushed to the API
+DEFAULT_ROUTES: dict[PubSubTopic, set[PubSubSubscription]] = {
+    PubSubTopic.DOCUMENT_UPLOADS: {PubSubSubscription.DOCUMENT_UPLOADS_API},
+}
+
+
+@dataclass
+class LoopbackMessage:
+    topic: PubSubTopic
+    message_id: str
+    data: bytes
+    attributes: dict[str, str]
+    ordering_key: str | None
+    publish_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class LoopbackPubSubBroker:
+    def __init__(
+        self,
+        dispatcher: PubSubDispatcher | None = None,
+        *,
+        project_id: str = "local",
+        routes: dict[PubSubTopic, set[PubSubSubscription]] | None = None,
+        latency_seconds: float = 0.0,
+        ack_deadline_seconds: float = 10.0,
+        max_delivery_attempts: int = 5,
+        min_backoff_seconds: float = 0.1,
+        max_backoff_seconds: float = 10.0,
+        duplicate_ratio: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        self._dispatcher = dispatcher
+        self._project_id = project_id
+        self._routes: dict[PubSubTopic, set[PubSubSubscription]] = defaultdict(set)
+        for topic, subscriptions in (DEFAULT_ROUTES if routes is None else routes).items():
+            self._routes[topic].update(subscriptions)
+        self._latency = latency_seconds
+        self._ack_deadline = ack_deadline_seconds
+        self._max_attempts = max(1, max_delivery_attempts)
+        self._min_backoff = min_backoff_seconds
+        self._max_backoff = max_backoff_seconds
+        self._duplicate_ratio = duplicate_ratio
+        self._random = random.Random(seed)
+
+        self._ids = itertools.count(1)
+        self._tasks: set[asyncio.Task] = set()
+        self._closed = False
+        self.published: list[LoopbackMessage] = []
+        self.dead_lettered: list[tuple[PubSubSubscription, LoopbackMessage]] = []
+        self._counts: dict[str, int] = defaultdict(int)
+
+    @property
+    def project_id(self) -> str:
+        return self._project_id
+
+    def subscribe(self, topic: PubSubTopic, subscription: PubSubSubscription) -> None:
+        """Route messages published to `topic` to `subscription`'s handlers."""
+        self._routes[topic].add(subscription)
+
+    def _serialize_data(self, data: dict[str, Any] | str | bytes) -> bytes:
+        if isinstance(data, bytes):
+            return data
+        if isinstance(data, str):
+            return data.encode("utf-8")
+        if isinstance(data, dict):
+            return json.dumps(data, default=str).encode("utf-8")
+        raise PubSubPublishError(f"Unsupported data type: {type(data)}")
+
+    async def publish(
+        self,
+        topic: PubSubTopic,
+        data: dict[str, Any] | str | bytes,
+        attributes: dict[str, str] | None = None,
+        ordering_key: str | None = None,
+    ) -> str:
+        if self._closed:
+            raise PubSubPublishError("Broker is closed", topic=topic.value)
+
+        message = LoopbackMessage(
+            topic=topic,
+            message_id=f"loopback-{next(self._ids)}",
+            data=self._serialize_data(data),
+            attributes=dict(attributes or {}),
+            ordering_key=ordering_key,
+        )
+        self.published.append(message)
+        self._counts["published"] += 1
+
+        for subscription in self._routes.get(topic, ()):
+            self._schedule(subscription, message, attempt=1, delay=self._latency)
+            if self._duplicate_ratio and self._random.random() < self._duplicate_ratio:
+                self._counts["duplicated"] += 1
+                self._schedule(subscription, message, attempt=1, delay=self._latency * 2)
+
+        logger.debug("Loopback published to %s: %s", topic.value, message.message_id)
+        return message.message_id
+
+    async def publish_batch(self, topic: PubSubTopic, messages: list[dict[str, Any]]) -> list[str]:
+        return [
+            await self.publish(topic, m.get("data", {}), m.get("attributes"), m.get("ordering_key"))
+            for m in messages
+        ]
+
+    def messages(self, topic: PubSubTopic) -> list[LoopbackMessage]:
+        return [m for m in self.published if m.topic == topic]
+
+    def _schedule(self, subscription: PubSubSubscription, message: LoopbackMessage, *, attempt: int, delay: float) -> None:
+        if self._closed:
+            return
+        task = asyncio.get_running_loop().create_task(self._deliver(subscription, message, attempt, delay))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _backoff(self, attempt: int) -> float:
+        return min(self._min_backoff * 2 ** (attempt - 1), self._max_backoff)
+
+    async def _deliver(
+        self,
+        subscription: PubSubSubscription,
+        message: LoopbackMessage,
+        attempt: int,
+        delay: float,
+    ) -> None:
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        ctx = PubSubContext.from_raw_message(
+            subscription=subscription.full_name(self._project_id),
+            message_id=message.message_id,
+            publish_time=message.publish_time,
+            data=message.data,
+            attributes={**message.attributes, "deliveryAttempt": str(attempt)},
+        )
+        dispatcher = self._dispatcher or get_dispatcher()
+        self._counts["delivered"] += 1
+
+        dispatch = asyncio.ensure_future(dispatcher.dispatch(ctx))
+        done, _ = await asyncio.wait({dispatch}, timeout=self._ack_deadline)
+        if not done:
+            # Late ack: Pub/Sub redelivers while this attempt keeps running
+            self._counts["ack_deadline_expired"] += 1
+            self._retry(subscription, message, attempt, "ack deadline expired")
+            await asyncio.wait({dispatch})
+            if not dispatch.cancelled() and dispatch.exception() is None:
+                self._counts["acked"] += 1
+            return
+
+        if dispatch.exception() is None:
+            self._counts["acked"] += 1
+            return
+
+        self._counts["nacked"] += 1
+        self._retry(subscription, message, attempt, str(dispatch.exception()))
+
+    def _retry(self, subscription: PubSubSubscription, message: LoopbackMessage, attempt: int, reason: str) -> None:
+        if attempt >= self._max_attempts:
+            logger.error(
+                "Dead-lettering %s on %s after %d attempts: %s",
+                message.message_id, subscription.value, attempt, reason,
+            )
+            self.dead_lettered.append((subscription, message))
+            self._counts["dead_lettered"] += 1
+            return
+        self._counts["redelivered"] += 1
+        self._schedule(subscription, message, attempt=attempt + 1, delay=self._backoff(attempt))
+
+    async def drain(self, timeout: float | None = None) -> bool:
+        """Wait until no delivery (or redelivery) is pending; False on timeout."""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while self._tasks:
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return False
+            await asyncio.wait(set(self._tasks), timeout=remaining)
+        return True
+
+    def stats(self) -> dict[str, int]:
+        return dict(self._counts)
+
+    def close(self) -> None:
+        self._closed = True
+        for task in self._tasks:
+            task.cancel()
+        if self._counts:
+            logger.info("Loopback Pub/Sub broker stats: %s", self.stats())
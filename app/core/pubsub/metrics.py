@@ -0,0 +1,64 @@
+"""Pub/Sub pipeline metrics, served by the /metrics endpoint (see app/core/metrics.py)."""
+from __future__ import annotations
+
+from app.core.metrics import get_metrics_registry
+
+_registry = get_metrics_registry()
+
+# Outcomes: processed, dropped, retryable (incl. timeouts), unexpected
+HANDLER_MESSAGES = _registry.counter(
+    "pubsub_handler_messages_total",
+    "Messages handled, per handler and outcome",
+    ["subscription", "handler", "outcome"],
+)
+HANDLER_DURATION = _registry.histogram(
+    "pubsub_handler_duration_seconds",
+    "Handler run time (excluding limiter wait), per handler and outcome",
+    ["subscription", "handler", "outcome"],
+)
+# Results: handled, retry, duplicate, unrouted
+DISPATCH_MESSAGES = _registry.counter(
+    "pubsub_dispatch_messages_total",
+    "Messages dispatched, per subscription and result",
+    ["subscription", "result"],
+)
+LIMITER_WAIT = _registry.histogram(
+    "pubsub_dispatch_limiter_wait_seconds",
+    "Time handlers waited for the dispatcher concurrency limiter",
+    ["subscription"],
+)
+DEDUP_LOOKUPS = _registry.counter(
+    "pubsub_dedup_lookups_total",
+    "Redelivery dedup lookups, by result (cache_hit, store_hit, miss)",
+    ["result"],
+)
+PULL_MESSAGES = _registry.counter(
+    "pubsub_pull_messages_total",
+    "Streaming-pull messages settled, per subscription and result (ack, nack)",
+    ["subscription", "result"],
+)
+PUBLISH_FLUSHES = _registry.counter(
+    "pubsub_publish_flushes_total",
+    "Coalesced publish flushes, per topic and reason",
+    ["topic", "reason"],
+)
+PUBLISH_FLUSHED_MESSAGES = _registry.counter(
+    "pubsub_publish_flushed_messages_total",
+    "Messages handed to the client by coalesced flushes, per topic",
+    ["topic"],
+)
+OUTBOX_MESSAGES = _registry.counter(
+    "pubsub_outbox_messages_total",
+    "Outbox rows relayed, by result (published, retry, failed)",
+    ["result"],
+)
+PUSH_SHED = _registry.counter(
+    "pubsub_push_shed_total",
+    "Push deliveries refused under overload, by reason (db_pool, loop_lag)",
+    ["reason"],
+)
+
+
+def register_gauge(name: str, help_text: str, callback, **labels: str) -> None:
+    """Expose a queue depth (or similar) read at scrape time."""
+    _registry.gauge(name, help_text, callback, **labels)
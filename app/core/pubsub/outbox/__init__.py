@@ -0,0 +1,5 @@
+from .models import PubSubOutbox, PubSubOutboxStatus
+from .repository import PubSubOutboxRepository
+from .relay import get_outbox_relay
+
+__all__ = ["PubSubOutbox", "PubSubOutboxStatus", "PubSubOutboxRepository", "get_outbox_relay"]
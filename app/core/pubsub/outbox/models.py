@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from enum import Enum
+
+from app.domain._shared.types import DateTime
+from app.infrastructure.db import Base
+import app.infrastructure.db.sa as sa
+from app.infrastructure.db.mixins import UUIDPrimaryKeyMixin, TimestampsMixin
+
+
+class PubSubOutboxStatus(str, Enum):
+    PENDING = "PENDING"
+    PUBLISHING = "PUBLISHING"
+    FAILED = "FAILED"
+
+
+class PubSubOutbox(UUIDPrimaryKeyMixin, TimestampsMixin, Base):
+    """
+    Pub/Sub messages written in the same transaction as the state they announce.
+
+    The relay (see relay.py) publishes them in batches and deletes each row once
+    its publish is acknowledged, so delivery is at-least-once.
+    """
+
+    __tablename__ = "pubsub_outbox"
+
+    topic: sa.Mapped[str] = sa.mapped_column(sa.String, nullable=False)
+    payload: sa.Mapped[dict] = sa.mapped_column(sa.JSONB, nullable=False)
+    attributes: sa.Mapped[dict] = sa.mapped_column(
+        sa.JSONB,
+        nullable=False,
+        server_default=sa.text("'{}'::jsonb"),
+    )
+
+    status: sa.Mapped[PubSubOutboxStatus] = sa.mapped_column(
+        sa.SAEnum(PubSubOutboxStatus, name="pubsub_outbox_status", native_enum=False),
+        nullable=False,
+        server_default=sa.text(f"'{PubSubOutboxStatus.PENDING.value}'"),
+    )
+
+    attempt_count: sa.Mapped[int] = sa.mapped_column(
+        sa.Integer,
+        nullable=False,
+        server_default=sa.text("0"),
+    )
+
+    # Not claimable before this (retry backoff)
+    available_at: sa.Mapped[DateTime] = sa.mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.text("now()"),
+    )
+    # Claim lease; a PUBLISHING row past this is considered abandoned
+    locked_until: sa.Mapped[DateTime | None] = sa.mapped_column(sa.DateTime(timezone=True), nullable=True)
+
+    last_error: sa.Mapped[str | None] = sa.mapped_column(sa.Text, nullable=True)
+
+    __table_args__ = (
+        sa.Index(
+            "ix_pubsub_outbox_open_available",
+            "available_at",
+            "created_at",
+            postgresql_where=sa.text("status IN ('PENDING','PUBLISHING')"),
+        ),
+    )
+
+
+__all__ = [
+    "PubSubOutbox",
+    "PubSubOutboxStatus",
+]
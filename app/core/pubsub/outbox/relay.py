@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import defaultdict
+from functools import lru_cache
+
+from app.core.config import get_settings
+from app.core.pubsub.enums import PubSubTopic
+from app.core.pubsub.metrics import OUTBOX_MESSAGES
+from app.core.pubsub.outbox.repository import ClaimedOutboxMessage, PubSubOutboxRepository
+from app.core.pubsub.setup import get_publisher
+from app.infrastructure.db import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+_MAX_RETRY_DELAY_SECONDS = 300.0
+
+
+class PubSubOutboxRelay:
+    """
+    Background publisher for the Pub/Sub outbox.
+
+    Claims up to `batch_size` rows under a lease, publishes them per topic with
+    `publish_batch`, and deletes the rows once Pub/Sub has acknowledged them.
+    A batch that fails is retried with exponential backoff, then parked as
+    FAILED; rows of a crashed relay are reclaimed when their lease expires.
+    While a full batch was claimed the relay keeps draining without waiting.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory=AsyncSessionLocal,
+        batch_size: int = 100,
+        lease_seconds: float = 60,
+        max_attempts: int = 10,
+        retry_base_seconds: float = 2.0,
+        poll_interval_seconds: float = 5.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+        self._retry_base = retry_base_seconds
+        self._poll_interval = poll_interval_seconds
+
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._closing = False
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._closing = False
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="pubsub-outbox-relay")
+
+    def notify(self) -> None:
+        """Signal that new messages were committed."""
+        self._wakeup.set()
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop after the batch in flight; unsent rows are picked up on next start."""
+        if self._task is None:
+            return
+
+        self._closing = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            # Rows stay PUBLISHING; they are reclaimed once their lease expires.
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while not self._closing:
+            self._wakeup.clear()
+
+            claimed = await self._claim()
+            if claimed:
+                await self._publish(claimed)
+                if len(claimed) >= self._batch_size:
+                    continue
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _claim(self) -> list[ClaimedOutboxMessage]:
+        try:
+            async with self._session_factory() as db:
+                claimed = await PubSubOutboxRepository(db).claim_batch(
+                    limit=self._batch_size,
+                    lease_seconds=self._lease_seconds,
+                )
+                await db.commit()
+                return claimed
+        except Exception as e:
+            logger.error("Failed to claim outbox messages: %s", e, exc_info=True)
+            return []
+
+    async def _publish(self, claimed: list[ClaimedOutboxMessage]) -> None:
+        by_topic: dict[str, list[ClaimedOutboxMessage]] = defaultdict(list)
+        for message in claimed:
+            by_topic[message.topic].append(message)
+
+        topics = list(by_topic)
+        results = await asyncio.gather(
+            *(self._publish_topic(topic, by_topic[topic]) for topic in topics),
+            return_exceptions=True,
+        )
+
+        published: list[str] = []
+        failures: list[tuple[list[ClaimedOutboxMessage], str]] = []
+        for topic, result in zip(topics, results):
+            if isinstance(result, BaseException):
+                failures.append((by_topic[topic], f"{type(result).__name__}: {result}"))
+            else:
+                published.extend(m.id for m in by_topic[topic])
+        if published:
+            OUTBOX_MESSAGES.inc(len(published), result="published")
+
+        try:
+            async with self._session_factory() as db:
+                repo = PubSubOutboxRepository(db)
+                await repo.delete_published(published)
+                for messages, error in failures:
+                    await self._record_failure(repo, messages, error)
+                await db.commit()
+        except Exception as e:
+            # Published rows are sent again after their lease expires (at-least-once).
+            logger.error("Failed to record outbox publish results: %s", e, exc_info=True)
+
+    async def _publish_topic(self, topic: str, messages: list[ClaimedOutboxMessage]) -> None:
+        await get_publisher().publish_batch(
+            PubSubTopic(topic),
+            [{"data": m.payload, "attributes": m.attributes} for m in messages],
+        )
+        logger.info("Relayed %d outbox messages to %s", len(messages), topic)
+
+    async def _record_failure(
+        self,
+        repo: PubSubOutboxRepository,
+        messages: list[ClaimedOutboxMessage],
+        error: str,
+    ) -> None:
+        give_up = [m.id for m in messages if m.attempt_count >= self._max_attempts]
+        if give_up:
+            logger.error("Giving up on %d outbox messages: %s", len(give_up), error)
+            await repo.mark_failed(give_up, error=error)
+            OUTBOX_MESSAGES.inc(len(give_up), result="failed")
+
+        retry_by_attempt: dict[int, list[str]] = defaultdict(list)
+        for m in messages:
+            if m.attempt_count < self._max_attempts:
+                retry_by_attempt[m.attempt_count].append(m.id)
+        for attempt, ids in retry_by_attempt.items():
+            delay = min(self._retry_base * 2 ** (attempt - 1), _MAX_RETRY_DELAY_SECONDS)
+            logger.warning("Outbox publish failed, retrying %d messages in %.0fs: %s", len(ids), delay, error)
+            await repo.mark_retry(ids, error=error, retry_in_seconds=delay)
+            OUTBOX_MESSAGES.inc(len(ids), result="retry")
+
+
+@lru_cache(maxsize=1)
+def get_outbox_relay() -> PubSubOutboxRelay:
+    """Get the process-wide Pub/Sub outbox relay."""
+    settings = get_settings()
+    return PubSubOutboxRelay(
+        batch_size=settings.pubsub_outbox_batch_size,
+        lease_seconds=settings.pubsub_outbox_lease_seconds,
+        max_attempts=settings.pubsub_outbox_max_attempts,
+        retry_base_seconds=settings.pubsub_outbox_retry_base_seconds,
+        poll_interval_seconds=settings.pubsub_outbox_poll_interval_seconds,
+    )
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import delete, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pubsub.enums import PubSubTopic
+from app.core.pubsub.outbox.models import PubSubOutbox, PubSubOutboxStatus
+
+
+@dataclass(frozen=True)
+class ClaimedOutboxMessage:
+    id: str
+    topic: str
+    payload: dict[str, Any]
+    attributes: dict[str, str]
+    attempt_count: int
+
+
+# Oldest claimable rows first; rows leased by another relay are skipped, and a
+# PUBLISHING row whose lease ran out (crashed relay) is claimed again.
+_CLAIM_BATCH_SQL = text(
+    """
+    WITH batch AS (
+        SELECT o.id
+        FROM pubsub_outbox o
+        WHERE o.status IN ('PENDING', 'PUBLISHING')
+          AND o.available_at <= now()
+          AND (o.status = 'PENDING' OR o.locked_until < now())
+        ORDER BY o.available_at, o.created_at
+        LIMIT :limit
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE pubsub_outbox t
+    SET status = 'PUBLISHING',
+        locked_until = now() + make_interval(secs => :lease_seconds),
+        attempt_count = t.attempt_count + 1,
+        updated_at = now()
+    FROM batch
+    WHERE t.id = batch.id
+    RETURNING t.id, t.topic, t.payload, t.attributes, t.attempt_count
+    """
+)
+
+
+class PubSubOutboxRepository:
+    def __init__(self, db: AsyncSession):
+        self._db = db
+
+    def add(
+        self,
+        topic: PubSubTopic,
+        data: dict[str, Any],
+        attributes: dict[str, str] | None = None,
+    ) -> PubSubOutbox:
+        """Stage a message; it is only visible to the relay once the caller commits."""
+        entry = PubSubOutbox(topic=topic.value, payload=data, attributes=attributes or {})
+        self._db.add(entry)
+        return entry
+
+    async def claim_batch(self, *, limit: int, lease_seconds: float) -> list[ClaimedOutboxMessage]:
+        result = await self._db.execute(
+            _CLAIM_BATCH_SQL,
+            {"limit": limit, "lease_seconds": float(lease_seconds)},
+        )
+        return [
+            ClaimedOutboxMessage(
+                id=row.id,
+                topic=row.topic,
+                payload=row.payload,
+                attributes=row.attributes,
+                attempt_count=row.attempt_count,
+            )
+            for row in result
+        ]
+
+    async def delete_published(self, ids: list[str]) -> None:
+        if ids:
+            await self._db.execute(delete(PubSubOutbox).where(PubSubOutbox.id.in_(ids)))
+
+    async def mark_retry(self, ids: list[str], *, error: str, retry_in_seconds: float) -> None:
+        if not ids:
+            return
+        await self._db.execute(
+            update(PubSubOutbox)
+            .where(PubSubOutbox.id.in_(ids))
+            .values(
+                status=PubSubOutboxStatus.PENDING,
+                locked_until=None,
+                available_at=text("now() + make_interval(secs => :retry_in)").bindparams(
+                    retry_in=float(retry_in_seconds)
+                ),
+                last_error=error,
+            )
+        )
+
+    async def mark_failed(self, ids: list[str], *, error: str) -> None:
+        if not ids:
+            return
+        await self._db.execute(
+            update(PubSubOutbox)
+            .where(PubSubOutbox.id.in_(ids))
+            .values(
+                status=PubSubOutboxStatus.FAILED,
+                locked_until=None,
+                last_error=error,
+            )
+        )
@@ -0,0 +1,141 @@
+"""
+Load shedding for the Pub/Sub push endpoint.
+
+Under overload a push request that waits for a database connection (up to
+`db_pool_timeout`) or for a lagging event loop only adds to the queue, and
+ties up the same pool user-facing requests need. `PushLoadShedder` lets the
+endpoint refuse such requests up front with a retryable status instead, so
+Pub/Sub's push backoff spreads the burst out.
+
+Two signals are checked, both without I/O:
+- pool saturation: connections checked out vs. pool_size + max_overflow
+- event-loop lag: how late a periodic probe task wakes up
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from functools import lru_cache
+
+from app.core.config import get_settings
+from app.infrastructure.db import engine
+
+from .metrics import PUSH_SHED, register_gauge
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """Measures event-loop lag with a task that sleeps `interval_seconds` at a time."""
+
+    def __init__(self, interval_seconds: float = 0.1) -> None:
+        self._interval = interval_seconds
+        self._expected_at: float | None = None
+        self._last_lag = 0.0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def lag(self) -> float:
+        """Seconds the probe was (or, while still overdue, is) late."""
+        if self._expected_at is None:
+            return 0.0
+        return max(self._last_lag, time.monotonic() - self._expected_at)
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="loop-lag-monitor")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._expected_at = None
+        self._last_lag = 0.0
+
+    async def _run(self) -> None:
+        while True:
+            self._expected_at = time.monotonic() + self._interval
+            await asyncio.sleep(self._interval)
+            self._last_lag = max(0.0, time.monotonic() - self._expected_at)
+
+
+class PushLoadShedder:
+    """
+    Decides whether a push request should be refused before it is handled.
+
+    `overload_reason()` returns "db_pool" once `pool_utilization` of the pool's
+    capacity is checked out, "loop_lag" once the loop lags more than
+    `max_loop_lag_seconds`, and None otherwise. Pools without a fixed capacity
+    (e.g. NullPool) are never considered saturated.
+    """
+
+    def __init__(
+        self,
+        pool,
+        *,
+        pool_utilization: float = 1.0,
+        max_loop_lag_seconds: float = 0.25,
+        lag_monitor: LoopLagMonitor | None = None,
+    ) -> None:
+        self._pool = pool
+        self._pool_utilization = pool_utilization
+        self._max_loop_lag = max_loop_lag_seconds
+        self._lag_monitor = lag_monitor or LoopLagMonitor()
+
+        register_gauge("db_pool_checked_out", "Database connections checked out", self._checked_out)
+        register_gauge("event_loop_lag_seconds", "Event-loop lag seen by the probe task", lambda: self._lag_monitor.lag)
+
+    def start(self) -> None:
+        self._lag_monitor.start()
+
+    async def stop(self) -> None:
+        await self._lag_monitor.stop()
+
+    def _checked_out(self) -> int:
+        return self._pool.checkedout() if hasattr(self._pool, "checkedout") else 0
+
+    def _capacity(self) -> int | None:
+        try:
+            return self._pool.size() + max(0, self._pool._max_overflow)
+        except AttributeError:
+            return None
+
+    def overload_reason(self) -> str | None:
+        capacity = self._capacity()
+        if capacity and self._checked_out() >= capacity * self._pool_utilization:
+            return "db_pool"
+        if self._lag_monitor.lag > self._max_loop_lag:
+            return "loop_lag"
+        return None
+
+    def should_shed(self) -> str | None:
+        """Like `overload_reason()`, also counting and logging refusals."""
+        reason = self.overload_reason()
+        if reason is not None:
+            PUSH_SHED.inc(reason=reason)
+            logger.warning(
+                "Shedding Pub/Sub push (%s): %d connections checked out, loop lag %.0f ms",
+                reason,
+                self._checked_out(),
+                self._lag_monitor.lag * 1000,
+            )
+        return reason
+
+
+@lru_cache(maxsize=1)
+def get_load_shedder() -> PushLoadShedder:
+    """Get the process-wide push load shedder for the application engine's pool."""
+    settings = get_settings()
+    return PushLoadShedder(
+        engine.sync_engine.pool,
+        pool_utilization=settings.pubsub_shed_pool_utilization,
+        max_loop_lag_seconds=settings.pubsub_shed_max_loop_lag_seconds,
+        lag_monitor=LoopLagMonitor(settings.pubsub_shed_lag_probe_interval_seconds),
+    )
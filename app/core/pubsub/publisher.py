@@ -1,22 +1,68 @@
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import json
 import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
 from typing import Any
 
 from google.cloud import pubsub_v1
 
 from .enums import PubSubTopic
 from .exceptions import PubSubConfigError, PubSubPublishError
+from .metrics import PUBLISH_FLUSHED_MESSAGES, PUBLISH_FLUSHES, register_gauge
 
 logger = logging.getLogger(__name__)
 
+
+def _to_asyncio_future(future: concurrent.futures.Future) -> asyncio.Future:
+    """
+    Bridge a google-cloud publish future (resolved on the client's background
+    thread) to an asyncio future on the running loop, without blocking it.
+    """
+    loop = asyncio.get_running_loop()
+    aio_future = loop.create_future()
+
+    def _transfer(done: concurrent.futures.Future) -> None:
+        if aio_future.done():
+            return
+        exc = done.exception()
+        if exc is not None:
+            aio_future.set_exception(exc)
+        else:
+            aio_future.set_result(done.result())
+
+    def _on_done(done: concurrent.futures.Future) -> None:
+        try:
+            loop.call_soon_threadsafe(_transfer, done)
+        except RuntimeError:
+            pass  # loop already closed
+
+    future.add_done_callback(_on_done)
+    return aio_future
+
+
 class PubSubPublisher:
-    def __init__(self, project_id: str) -> None:
+    def __init__(
+        self,
+        project_id: str,
+        *,
+        client: pubsub_v1.PublisherClient | None = None,
+        batch_settings: pubsub_v1.types.BatchSettings | None = None,
+        publish_timeout: float = 30.0,
+    ) -> None:
         if not project_id:
             raise PubSubConfigError("project_id is required")
         self._project_id = project_id
-        self._client = pubsub_v1.PublisherClient()
+        self._client = client or pubsub_v1.PublisherClient(batch_settings or pubsub_v1.types.BatchSettings())
+        self._publish_timeout = publish_timeout
+
+    @property
+    def publish_timeout(self) -> float:
+        return self._publish_timeout
 
     @property
     def project_id(self) -> str:
@@ -34,6 +80,22 @@ class PubSubPublisher:
             return json.dumps(data, default=str).encode("utf-8")
         raise PubSubPublishError(f"Unsupported data type: {type(data)}")
 
+    def submit(
+        self,
+        topic: PubSubTopic,
+        data: bytes,
+        attributes: dict[str, str] | None = None,
+        ordering_key: str | None = None,
+    ) -> asyncio.Future:
+        """Hand a serialized message to the client; the future resolves to its message id."""
+        future = self._client.publish(
+            self._get_topic_path(topic),
+            data,
+            ordering_key=ordering_key or "",
+            **(attributes or {}),
+        )
+        return _to_asyncio_future(future)
+
     async def publish(
         self,
         topic: PubSubTopic,
@@ -41,17 +103,11 @@ class PubSubPublisher:
         attributes: dict[str, str] | None = None,
         ordering_key: str | None = None,
     ) -> str:
-        topic_path = self._get_topic_path(topic)
         serialized = self._serialize_data(data)
 
         try:
-            future = self._client.publish(
-                topic_path,
-                serialized,
-                ordering_key=ordering_key or "",
-                **(attributes or {}),
-            )
-            message_id = future.result(timeout=30)
+            future = self.submit(topic, serialized, attributes, ordering_key)
+            message_id = await asyncio.wait_for(future, self._publish_timeout)
             logger.info("Published to %s: %s", topic.value, message_id)
             return message_id
         except Exception as e:
@@ -65,14 +121,19 @@ class PubSubPublisher:
             serialized = self._serialize_data(msg.get("data", {}))
             futures.append(self._client.publish(topic_path, serialized, **msg.get("attributes", {})))
 
+        results = await asyncio.gather(
+            *(asyncio.wait_for(_to_asyncio_future(f), self._publish_timeout) for f in futures),
+            return_exceptions=True,
+        )
+
         message_ids = []
         errors = []
-        for i, future in enumerate(futures):
-            try:
-                message_ids.append(future.result(timeout=30))
-            except Exception as e:
-                errors.append(f"{i}: {e}")
+        for i, result in enumerate(results):
+            if isinstance(result, BaseException):
+                errors.append(f"{i}: {result!r}")
                 message_ids.append("")
+            else:
+                message_ids.append(result)
 
         if errors:
             raise PubSubPublishError(f"Batch publish failures: {', '.join(errors)}", topic=topic.value)
@@ -83,6 +144,182 @@ class PubSubPublisher:
     def close(self) -> None:
         self._client.stop()
 
+
+@dataclass
+class _PendingMessage:
+    data: bytes
+    attributes: dict[str, str] | None
+    ordering_key: str | None
+    size: int
+    future: asyncio.Future
+
+
+@dataclass
+class _TopicBuffer:
+    messages: list[_PendingMessage] = field(default_factory=list)
+    size: int = 0
+    timer: asyncio.TimerHandle | None = None
+
+
+@dataclass
+class CoalescingStats:
+    """Flush counters for one topic, for tuning the batch limits."""
+
+    flushes: int = 0
+    messages: int = 0
+    bytes: int = 0
+    max_batch: int = 0
+    reasons: Counter = field(default_factory=Counter)
+
+    def record(self, messages: int, size: int, reason: str) -> None:
+        self.flushes += 1
+        self.messages += messages
+        self.bytes += size
+        self.max_batch = max(self.max_batch, messages)
+        self.reasons[reason] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "flushes": self.flushes,
+            "messages": self.messages,
+            "bytes": self.bytes,
+            "avg_batch": round(self.messages / self.flushes, 2) if self.flushes else 0.0,
+            "max_batch": self.max_batch,
+            "reasons": dict(self.reasons),
+        }
+
+
+class CoalescingPubSubPublisher:
+    """
+    Buffers `publish()` calls per topic across concurrent requests and hands
+    each buffer to the client in one go once it reaches `max_messages` or
+    `max_bytes`, or `max_latency` seconds after its first message.
+
+    Callers still get their own message id (or PubSubPublishError). Sized so
+    that one flush fills one client batch, i.e. one Publish RPC.
+    """
+
+    def __init__(
+        self,
+        publisher: PubSubPublisher,
+        *,
+        max_messages: int = 100,
+        max_bytes: int = 1_000_000,
+        max_latency: float = 0.01,
+        stats_log_seconds: float = 60.0,
+    ) -> None:
+        self._publisher = publisher
+        self._max_messages = max(1, max_messages)
+        self._max_bytes = max(1, max_bytes)
+        self._max_latency = max_latency
+        self._stats_log_seconds = stats_log_seconds
+        self._buffers: dict[PubSubTopic, _TopicBuffer] = {}
+        self._stats: dict[PubSubTopic, CoalescingStats] = {}
+        self._last_stats_log = time.monotonic()
+        register_gauge(
+            "pubsub_publish_buffered_messages",
+            "Messages waiting in coalescing buffers",
+            lambda: sum(len(b.messages) for b in self._buffers.values()),
+        )
+
+    @property
+    def project_id(self) -> str:
+        return self._publisher.project_id
+
+    async def publish(
+        self,
+        topic: PubSubTopic,
+        data: dict[str, Any] | str | bytes,
+        attributes: dict[str, str] | None = None,
+        ordering_key: str | None = None,
+    ) -> str:
+        serialized = self._publisher._serialize_data(data)
+        size = len(serialized) + sum(len(k) + len(v) for k, v in (attributes or {}).items())
+        future = asyncio.get_running_loop().create_future()
+
+        buffer = self._buffers.setdefault(topic, _TopicBuffer())
+        if buffer.messages and buffer.size + size > self._max_bytes:
+            self._flush(topic, "max_bytes")
+            buffer = self._buffers.setdefault(topic, _TopicBuffer())
+
+        buffer.messages.append(_PendingMessage(serialized, attributes, ordering_key, size, future))
+        buffer.size += size
+
+        if len(buffer.messages) >= self._max_messages:
+            self._flush(topic, "max_messages")
+        elif buffer.size >= self._max_bytes:
+            self._flush(topic, "max_bytes")
+        elif buffer.timer is None:
+            buffer.timer = asyncio.get_running_loop().call_later(
+                self._max_latency, self._flush, topic, "max_latency"
+            )
+
+        try:
+            message_id = await asyncio.wait_for(future, self._publisher.publish_timeout)
+            logger.debug("Published to %s: %s", topic.value, message_id)
+            return message_id
+        except Exception as e:
+            raise PubSubPublishError(f"Publish failed: {e}", topic=topic.value, cause=e) from e
+
+    async def publish_batch(self, topic: PubSubTopic, messages: list[dict[str, Any]]) -> list[str]:
+        # Already a batch; nothing to gain from buffering it
+        return await self._publisher.publish_batch(topic, messages)
+
+    def _flush(self, topic: PubSubTopic, reason: str) -> None:
+        buffer = self._buffers.pop(topic, None)
+        if buffer is None or not buffer.messages:
+            return
+        if buffer.timer is not None:
+            buffer.timer.cancel()
+
+        for message in buffer.messages:
+            try:
+                submitted = self._publisher.submit(topic, message.data, message.attributes, message.ordering_key)
+            except Exception as e:
+                if not message.future.done():
+                    message.future.set_exception(e)
+                continue
+            submitted.add_done_callback(lambda done, out=message.future: _copy_result(done, out))
+
+        self._stats.setdefault(topic, CoalescingStats()).record(len(buffer.messages), buffer.size, reason)
+        PUBLISH_FLUSHES.inc(topic=topic.value, reason=reason)
+        PUBLISH_FLUSHED_MESSAGES.inc(len(buffer.messages), topic=topic.value)
+        logger.debug("Flushed %d messages (%d bytes) to %s on %s", len(buffer.messages), buffer.size, topic.value, reason)
+        self._maybe_log_stats()
+
+    def flush(self) -> None:
+        """Hand every buffered message to the client now."""
+        for topic in list(self._buffers):
+            self._flush(topic, "close")
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {topic.value: s.as_dict() for topic, s in self._stats.items()}
+
+    def _maybe_log_stats(self) -> None:
+        now = time.monotonic()
+        if now - self._last_stats_log < self._stats_log_seconds:
+            return
+        self._last_stats_log = now
+        logger.info("Pub/Sub coalescing stats: %s", self.stats())
+
+    def close(self) -> None:
+        self.flush()
+        if self._stats:
+            logger.info("Pub/Sub coalescing stats: %s", self.stats())
+        self._publisher.close()
+
+
+def _copy_result(source: asyncio.Future, target: asyncio.Future) -> None:
+    if target.done():
+        return  # caller gave up (timeout / cancellation); the message is still sent
+    if source.cancelled():
+        target.cancel()
+    elif source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
+
+
 class MockPubSubPublisher:
     def __init__(self, project_id: str = "test-project") -> None:
         self._project_id = project_id
@@ -23,8 +23,13 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from google.cloud import pubsub_v1
+
+from app.core.config import get_settings
+
 from .dispatcher import get_dispatcher
-from .publisher import PubSubPublisher, MockPubSubPublisher
+from .loopback import LoopbackPubSubBroker
+from .publisher import CoalescingPubSubPublisher, PubSubPublisher, MockPubSubPublisher
 
 if TYPE_CHECKING:
     from app.infrastructure.db.session_manager import SessionManager
@@ -32,21 +37,75 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 # Global publisher instance
-_publisher: PubSubPublisher | MockPubSubPublisher | None = None
+_publisher: (
+    PubSubPublisher | CoalescingPubSubPublisher | MockPubSubPublisher | LoopbackPubSubBroker | None
+) = None
+
+# Client batches are committed right after a coalesced flush instead of
+# waiting out a second max_latency window.
+_COALESCED_CLIENT_LATENCY_SECONDS = 0.001
+
+
+def _build_publisher(project_id: str) -> PubSubPublisher | CoalescingPubSubPublisher:
+    settings = get_settings()
+    batch_settings = pubsub_v1.types.BatchSettings(
+        max_messages=settings.pubsub_batch_max_messages,
+        max_bytes=settings.pubsub_batch_max_bytes,
+        max_latency=(
+            _COALESCED_CLIENT_LATENCY_SECONDS
+            if settings.pubsub_coalesce_publishes
+            else settings.pubsub_batch_max_latency_seconds
+        ),
+    )
+    publisher = PubSubPublisher(
+        project_id=project_id,
+        batch_settings=batch_settings,
+        publish_timeout=settings.pubsub_publish_timeout_seconds,
+    )
+    if not settings.pubsub_coalesce_publishes:
+        return publisher
+
+    logger.info(
+        "Coalescing Pub/Sub publishes (max_messages=%d, max_bytes=%d, max_latency=%.3fs)",
+        settings.pubsub_batch_max_messages,
+        settings.pubsub_batch_max_bytes,
+        settings.pubsub_batch_max_latency_seconds,
+    )
+    return CoalescingPubSubPublisher(
+        publisher,
+        max_messages=settings.pubsub_batch_max_messages,
+        max_bytes=settings.pubsub_batch_max_bytes,
+        max_latency=settings.pubsub_batch_max_latency_seconds,
+        stats_log_seconds=settings.pubsub_coalesce_stats_log_seconds,
+    )
 
 def setup_pubsub(
     project_id: str | None = None,
     session_manager: "SessionManager | None" = None,
     use_mock_publisher: bool = False,
+    use_loopback_broker: bool | None = None,
 ) -> None:
     global _publisher
     dispatcher = get_dispatcher()
+    settings = get_settings()
+    if use_loopback_broker is None:
+        use_loopback_broker = settings.pubsub_loopback_broker
 
     if use_mock_publisher:
         _publisher = MockPubSubPublisher()
         logger.info("Using mock Pub/Sub publisher")
+    elif use_loopback_broker:
+        _publisher = LoopbackPubSubBroker(
+            dispatcher,
+            project_id=project_id or "local",
+            latency_seconds=settings.pubsub_loopback_latency_seconds,
+            ack_deadline_seconds=settings.pubsub_loopback_ack_deadline_seconds,
+            max_delivery_attempts=settings.pubsub_loopback_max_delivery_attempts,
+            duplicate_ratio=settings.pubsub_loopback_duplicate_ratio,
+        )
+        logger.info("Using in-process loopback Pub/Sub broker")
     elif project_id:
-        _publisher = PubSubPublisher(project_id=project_id)
+        _publisher = _build_publisher(project_id)
         logger.info("Initialized Pub/Sub publisher for %s", project_id)
     else:
         logger.warning("Pub/Sub publisher not initialized (no project_id)")
@@ -62,15 +121,25 @@ def setup_pubsub(
 
     if session_manager:
         from app.domain.document.handlers import DocumentUploadHandler
-        dispatcher.register(DocumentUploadHandler(session_manager))
+        dispatcher.register(
+            DocumentUploadHandler(
+                session_manager,
+                batch_max_size=settings.pubsub_upload_batch_max_size,
+                batch_window_seconds=settings.pubsub_upload_batch_window_seconds,
+            )
+        )
         logger.info("Registered DocumentUploadHandler")
+
+        from app.domain.processing.handlers import ParsingResultHandler
+        dispatcher.register(ParsingResultHandler(session_manager))
+        logger.info("Registered ParsingResultHandler")
     else:
         logger.warning("session_manager missing, skipping handler registration")
 
     logger.info("Pub/Sub setup complete")
 
 
-def get_publisher() -> PubSubPublisher | MockPubSubPublisher:
+def get_publisher() -> PubSubPublisher | CoalescingPubSubPublisher | MockPubSubPublisher | LoopbackPubSubBroker:
     """Get the global publisher instance."""
     if _publisher is None:
         raise RuntimeError("Pub/Sub not initialized. Call setup_pubsub() first.")
@@ -0,0 +1,172 @@
+"""
+Streaming-pull runtime for the Pub/Sub dispatcher.
+
+An alternative to push delivery at /webhooks/pubsub: the worker holds a
+streaming pull per subscription and feeds messages to the same registered
+handlers. Outstanding messages/bytes are bounded by the client's flow control,
+which also keeps extending leases of messages still being handled; handler
+concurrency is bounded on the event loop.
+
+Ack/nack follows the push endpoint's status codes: handled, dropped or
+unrouted messages are acked (204), retryable failures are nacked (500).
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from google.cloud import pubsub_v1
+
+from app.core.config import get_settings
+
+from .context import PubSubContext
+from .dispatcher import PubSubDispatcher, get_dispatcher
+from .enums import PubSubSubscription
+from .exceptions import PubSubConfigError, PubSubRetryableError
+from .metrics import PULL_MESSAGES, register_gauge
+
+logger = logging.getLogger(__name__)
+
+
+class PubSubPullSubscriber:
+    def __init__(
+        self,
+        subscription: PubSubSubscription,
+        *,
+        project_id: str,
+        client: pubsub_v1.SubscriberClient | Any | None = None,
+        dispatcher: PubSubDispatcher | None = None,
+        max_messages: int = 100,
+        max_bytes: int = 100 * 1024 * 1024,
+        concurrency: int = 16,
+        max_lease_seconds: int = 600,
+        lease_extension_seconds: int = 60,
+    ) -> None:
+        if not project_id:
+            raise PubSubConfigError("project_id is required")
+        self._subscription = subscription
+        self._subscription_path = subscription.full_name(project_id)
+        self._client = client or pubsub_v1.SubscriberClient()
+        self._dispatcher = dispatcher or get_dispatcher()
+        self._flow_control = pubsub_v1.types.FlowControl(
+            max_messages=max_messages,
+            max_bytes=max_bytes,
+            max_lease_duration=max_lease_seconds,
+            min_duration_per_lease_extension=lease_extension_seconds,
+        )
+        self._concurrency = concurrency
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._active: set[asyncio.Task] = set()
+        self._closing = False
+        self.acked = 0
+        self.nacked = 0
+        register_gauge(
+            "pubsub_pull_messages_active",
+            "Pulled messages leased and not yet settled",
+            lambda: len(self._active),
+            subscription=subscription.value,
+        )
+
+    @property
+    def subscription(self) -> PubSubSubscription:
+        return self._subscription
+
+    async def run(self, stop: asyncio.Event, drain_timeout: float = 30.0) -> None:
+        """Pull and handle messages until `stop` is set or the stream fails."""
+        self._loop = asyncio.get_running_loop()
+        self._closing = False
+        self._semaphore = asyncio.Semaphore(self._concurrency)
+
+        streaming = self._client.subscribe(
+            self._subscription_path,
+            callback=self._on_message,
+            flow_control=self._flow_control,
+        )
+        logger.info(
+            "Pulling %s (max_messages=%d, concurrency=%d)",
+            self._subscription.value,
+            self._flow_control.max_messages,
+            self._concurrency,
+        )
+
+        stream_done = asyncio.wrap_future(streaming)
+        stop_requested = asyncio.ensure_future(stop.wait())
+        try:
+            await asyncio.wait({stream_done, stop_requested}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self._closing = True
+            stop_requested.cancel()
+            streaming.cancel()
+
+        if self._active:
+            # Unfinished messages are neither acked nor nacked; they are
+            # redelivered once their lease runs out.
+            _, pending = await asyncio.wait(self._active, timeout=drain_timeout)
+            for task in pending:
+                task.cancel()
+
+        logger.info("Stopped pulling %s (acked=%d, nacked=%d)", self._subscription.value, self.acked, self.nacked)
+
+        if stream_done.done() and not stream_done.cancelled() and stream_done.exception() is not None:
+            raise stream_done.exception()
+
+    def _on_message(self, message) -> None:
+        # Called on the client's callback thread
+        try:
+            self._loop.call_soon_threadsafe(self._spawn, message)
+        except RuntimeError:
+            message.nack()  # loop already closed
+
+    def _spawn(self, message) -> None:
+        if self._closing:
+            message.nack()
+            return
+        task = asyncio.create_task(self._process(message))
+        self._active.add(task)
+        task.add_done_callback(self._active.discard)
+
+    async def _process(self, message) -> None:
+        async with self._semaphore:
+            ctx = PubSubContext.from_raw_message(
+                subscription=self._subscription_path,
+                message_id=message.message_id,
+                publish_time=message.publish_time,
+                data=message.data,
+                attributes=dict(message.attributes),
+            )
+            try:
+                await self._dispatcher.dispatch(ctx)
+            except PubSubRetryableError as e:
+                logger.error("Retryable error for %s: %s", ctx.message_id, e)
+                message.nack()
+                self.nacked += 1
+                PULL_MESSAGES.inc(subscription=self._subscription.value, result="nack")
+                return
+            except Exception:
+                logger.exception("Unexpected error dispatching %s", ctx.message_id)
+                message.nack()
+                self.nacked += 1
+                PULL_MESSAGES.inc(subscription=self._subscription.value, result="nack")
+                return
+
+            message.ack()
+            self.acked += 1
+            PULL_MESSAGES.inc(subscription=self._subscription.value, result="ack")
+
+
+def build_pull_subscriber(subscription: PubSubSubscription, **kwargs: Any) -> PubSubPullSubscriber:
+    """Create a subscriber configured from settings (keyword arguments override)."""
+    settings = get_settings()
+    options: dict[str, Any] = {
+        "project_id": settings.gcp_project_id,
+        "max_messages": settings.pubsub_subscriber_max_messages,
+        "max_bytes": settings.pubsub_subscriber_max_bytes,
+        "concurrency": settings.pubsub_subscriber_concurrency,
+        "max_lease_seconds": settings.pubsub_subscriber_max_lease_seconds,
+        "lease_extension_seconds": settings.pubsub_subscriber_lease_extension_seconds,
+    }
+    options.update(kwargs)
+    return PubSubPullSubscriber(subscription, **options)
@@ -0,0 +1,67 @@
+"""
+Streaming-pull Pub/Sub worker, run as its own process.
+
+Registers the same handlers as the API (see setup.py) and pulls from the given
+subscriptions until SIGINT/SIGTERM. Points at the Pub/Sub emulator when
+PUBSUB_EMULATOR_HOST is set.
+
+Usage:
+    python -m app.core.pubsub.worker [--subscription mareon-prod-document-uploads-api-sub ...]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import signal
+
+from app.core.config import get_settings
+from app.core.logging import setup_logging
+from app.core.pubsub.enums import PubSubSubscription
+from app.core.pubsub.outbox import get_outbox_relay
+from app.core.pubsub.setup import setup_pubsub, teardown_pubsub
+from app.core.pubsub.subscriber import build_pull_subscriber
+from app.infrastructure.db import database_lifespan
+
+logger = logging.getLogger(__name__)
+
+
+async def run_worker(subscriptions: list[PubSubSubscription]) -> None:
+    settings = get_settings()
+    setup_pubsub(project_id=settings.gcp_project_id)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        async with database_lifespan():
+            # Handlers write parsing-job notifications to the outbox
+            outbox_relay = get_outbox_relay()
+            outbox_relay.start()
+            try:
+                await asyncio.gather(*(build_pull_subscriber(sub).run(stop) for sub in subscriptions))
+            finally:
+                await outbox_relay.stop()
+    finally:
+        teardown_pubsub()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--subscription",
+        action="append",
+        choices=[s.value for s in PubSubSubscription],
+        help="subscription to pull from (repeatable; default: all)",
+    )
+    args = parser.parse_args()
+
+    setup_logging()
+    subscriptions = [PubSubSubscription(s) for s in args.subscription] if args.subscription else list(PubSubSubscription)
+    asyncio.run(run_worker(subscriptions))
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,9 @@ class AppSettings(BaseSettings):
     api_v1_prefix: str = "/api/v1"
     gcp_project_id: str = "mareon"
 
+    # Shared secret the metrics scraper sends as a bearer token to /metrics
+    metrics_token: str = ""
+
     @property
     def is_local(self) -> bool:
         return self.app_env == "local"
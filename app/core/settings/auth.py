@@ -9,6 +9,31 @@ class AuthSettings(BaseSettings):
     clerk_publishable_key: str = ""
     clerk_webhook_secret: str = ""
 
+    # Session token verification (in-process, see core/auth/tokens.py)
+    clerk_jwt_key: str = ""  # PEM public key; enables networkless verification
+    clerk_authorized_parties: list[str] = []  # allowed `azp` origins (empty = skip check)
+    auth_jwks_refresh_seconds: int = 3600
+    auth_token_cache_size: int = 10_000
+    auth_clock_skew_seconds: int = 5
+
+    # Clerk id -> internal id resolution cache (see core/auth/id_cache.py)
+    auth_id_cache_size: int = 10_000
+    auth_id_cache_ttl_seconds: int = 300
+    auth_id_cache_negative_ttl_seconds: int = 30
+
+    # Background self-healing of Clerk public metadata (see core/auth/metadata_sync.py)
+    clerk_metadata_sync_batch_size: int = 20
+    clerk_metadata_sync_max_attempts: int = 5
+    clerk_metadata_sync_retry_base_seconds: float = 1.0
+    clerk_metadata_sync_suppress_seconds: int = 300
+
+    # Clerk webhook inbox consumer (see core/auth/webhooks/consumer.py)
+    clerk_webhook_consumer_concurrency: int = 4
+    clerk_webhook_lease_seconds: int = 60
+    clerk_webhook_max_attempts: int = 8
+    clerk_webhook_retry_base_seconds: float = 2.0
+    clerk_webhook_poll_interval_seconds: float = 5.0
+
     def validate_auth(self):
         if self.auth_enabled:
             missing = []
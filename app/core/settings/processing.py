@@ -0,0 +1,17 @@
+from pydantic_settings import BaseSettings
+
+
+class ProcessingSettings(BaseSettings):
+    # Shared secret parsing workers send as a bearer token to /parsing-jobs endpoints
+    parsing_worker_token: str = ""
+
+    # Parsing job leases (see domain/processing/reaper.py): workers heartbeat
+    # well within the lease; the reaper releases jobs whose lease ran out
+    parsing_job_lease_seconds: int = 300
+    parsing_job_heartbeat_seconds: float = 60.0
+    parsing_job_reaper_interval_seconds: float = 30.0
+    parsing_job_reaper_chunk_size: int = 100
+    parsing_job_reaper_max_chunks: int = 50  # per pass; the rest waits for the next one
+
+    # Certificates of a parsing result are upserted this many rows per statement
+    parsing_result_chunk_size: int = 200
@@ -0,0 +1,58 @@
+from pydantic_settings import BaseSettings
+
+
+class PubSubSettings(BaseSettings):
+    pubsub_publish_timeout_seconds: float = 30.0
+
+    # Publish batching (see core/pubsub/publisher.py). The limits configure the
+    # client's BatchSettings and, with coalescing enabled, the per-topic buffer
+    # shared by all requests in CoalescingPubSubPublisher.
+    pubsub_coalesce_publishes: bool = False
+    pubsub_batch_max_messages: int = 100
+    pubsub_batch_max_bytes: int = 1_000_000
+    pubsub_batch_max_latency_seconds: float = 0.01
+    pubsub_coalesce_stats_log_seconds: float = 60.0
+
+    # Transactional outbox relay (see core/pubsub/outbox/relay.py)
+    pubsub_outbox_batch_size: int = 100
+    pubsub_outbox_lease_seconds: int = 60
+    pubsub_outbox_max_attempts: int = 10
+    pubsub_outbox_retry_base_seconds: float = 2.0
+    pubsub_outbox_poll_interval_seconds: float = 5.0
+
+    # Streaming-pull worker (see core/pubsub/subscriber.py)
+    pubsub_subscriber_max_messages: int = 100
+    pubsub_subscriber_max_bytes: int = 100 * 1024 * 1024
+    pubsub_subscriber_concurrency: int = 16
+    pubsub_subscriber_max_lease_seconds: int = 600
+    pubsub_subscriber_lease_extension_seconds: int = 60
+
+    # Micro-batching of GCS upload notifications (see domain/document/handlers.py);
+    # 1 processes every message in its own transaction
+    pubsub_upload_batch_max_size: int = 1
+    pubsub_upload_batch_window_seconds: float = 0.05
+
+    # Dispatcher (see core/pubsub/dispatcher.py)
+    pubsub_handler_timeout_seconds: float = 30.0
+    pubsub_dispatch_max_concurrency: int = 64
+
+    # Redelivery dedup ahead of the handlers (see core/pubsub/dedup/)
+    pubsub_dedup_cache_size: int = 100_000  # 0 disables the in-process cache
+    pubsub_dedup_ttl_seconds: int = 3600
+    pubsub_dedup_postgres: bool = False  # also record processed ids in pubsub_processed_message
+    pubsub_dedup_retention_seconds: int = 7 * 24 * 3600
+
+    # Load shedding on the push endpoint (see core/pubsub/overload.py): refuse
+    # deliveries with 503 while the DB pool or the event loop is saturated
+    pubsub_shed_enabled: bool = True
+    pubsub_shed_pool_utilization: float = 1.0  # share of pool_size + max_overflow checked out
+    pubsub_shed_max_loop_lag_seconds: float = 0.25
+    pubsub_shed_lag_probe_interval_seconds: float = 0.1
+
+    # In-process loopback broker instead of GCP (see core/pubsub/loopback.py),
+    # for local development and benchmarks
+    pubsub_loopback_broker: bool = False
+    pubsub_loopback_latency_seconds: float = 0.0
+    pubsub_loopback_ack_deadline_seconds: float = 10.0
+    pubsub_loopback_max_delivery_attempts: int = 5
+    pubsub_loopback_duplicate_ratio: float = 0.0
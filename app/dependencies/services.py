@@ -17,6 +17,8 @@ from app.domain.document.repository import (
     DocumentFileRepository,
 )
 
+from app.domain.processing.repository import ParsingJobRepository
+
 from app.domain.vessel.repository import (
     VesselRepository,
     VesselIdentityRepository,
@@ -34,6 +36,9 @@ from app.domain.organization.service.protocols import OrganizationServiceProtoco
 from app.domain.document.service.document_service import DocumentService
 from app.domain.document.service.protocols import DocumentServiceProtocol
 
+from app.domain.processing.service.parsing_job_service import ParsingJobService
+from app.domain.processing.service.protocols import ParsingJobServiceProtocol
+
 from app.domain.vessel.service.vessel_service import VesselService
 from app.domain.vessel.service.protocols import VesselServiceProtocol
 
@@ -55,6 +60,9 @@ def _document_repo(db: AsyncSession) -> DocumentRepository:
 def _document_file_repo(db: AsyncSession) -> DocumentFileRepository:
     return DocumentFileRepository(db)
 
+def _parsing_job_repo(db: AsyncSession) -> ParsingJobRepository:
+    return ParsingJobRepository(db)
+
 def _vessel_repo(db: AsyncSession) -> VesselRepository:
     return VesselRepository(db)
 
@@ -69,6 +77,9 @@ def _vessel_certificate_repo(db: AsyncSession) -> VesselCertificateRepository:
 
 
 # ── Public dependencies (what routers should import) ──────────────────────────
+# The request session is created unbound: no pool connection is checked out
+# until a repository issues its first statement. `get_auth_context` does not
+# share it, so building a service costs nothing until it actually queries.
 
 def get_user_service(
     db: AsyncSession = Depends(get_db_session),
@@ -97,6 +108,7 @@ def get_organization_service(
         db=db,
         organizations=_org_repo(db),
         org_members=_org_member_repo(db),
+        users=_user_repo(db),
     )
 
 
@@ -108,6 +120,7 @@ def get_authed_organization_service(
         db=db,
         organizations=_org_repo(db),
         org_members=_org_member_repo(db),
+        users=_user_repo(db),
         ctx=ctx,
     )
 
@@ -140,4 +153,13 @@ def get_vessel_service(
         users=_user_repo(db),
         orgs=_org_repo(db),
         ctx=ctx,
-    )
\ No newline at end of file
+    )
+
+
+def get_parsing_job_service(
+    db: AsyncSession = Depends(get_db_session),
+) -> ParsingJobServiceProtocol:
+    return ParsingJobService(
+        db=db,
+        jobs=_parsing_job_repo(db),
+    )
@@ -0,0 +1,130 @@
+"""
+Incremental reading of a large top-level JSON object from a byte stream.
+
+Only the object's members are materialized, one at a time; members named in
+`stream_arrays` are yielded item by item instead, so a document whose bulk is
+one long array is read with memory bounded by its largest item plus a chunk.
+
+Usage:
+    async for key, value in iter_object_members(storage.iter_file(path), stream_arrays={"certificates"}):
+        ...  # ("identity", {...}), ("certificates", {...}), ("certificates", {...}), ...
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+from collections.abc import AsyncIterator, Collection
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]}"
+# Consumed text is dropped from the buffer once it exceeds this many characters
+_COMPACT_AT = 64 * 1024
+
+
+class JsonStreamError(ValueError):
+    """The stream is not a well-formed JSON object."""
+
+
+class _Reader:
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    async def _fill(self) -> bool:
+        if self._eof:
+            return False
+        try:
+            chunk = await anext(self._chunks)
+        except StopAsyncIteration:
+            self._eof = True
+            self._buf += self._decode(b"", final=True)
+            return False
+        if self._pos >= _COMPACT_AT:
+            self._buf, self._pos = self._buf[self._pos:], 0
+        self._buf += self._decode(chunk)
+        return True
+
+    def _decode(self, chunk: bytes, final: bool = False) -> str:
+        try:
+            return self._decoder.decode(chunk, final=final)
+        except UnicodeDecodeError as e:
+            raise JsonStreamError(f"Invalid UTF-8: {e}") from e
+
+    async def peek(self) -> str:
+        """Next non-whitespace character ("" at end of stream), not consumed."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not await self._fill():
+                return ""
+
+    async def expect(self, *chars: str) -> str:
+        char = await self.peek()
+        if char not in chars:
+            raise JsonStreamError(f"Expected one of {chars!r} at offset {self._pos}, got {char!r}")
+        self._pos += 1
+        return char
+
+    async def value(self) -> Any:
+        await self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                if await self._fill():
+                    continue
+                raise JsonStreamError(f"Invalid JSON value: {e}") from e
+            # A number cut by a chunk boundary decodes as its prefix ("12" of "12.5"),
+            # so scalars only count once a delimiter follows them
+            truncated = end == len(self._buf) or (
+                not isinstance(value, (str, dict, list)) and self._buf[end] not in _DELIMITERS
+            )
+            if truncated and await self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+async def iter_object_members(
+    chunks: AsyncIterator[bytes],
+    *,
+    stream_arrays: Collection[str] = (),
+) -> AsyncIterator[tuple[str, Any]]:
+    """Yield (key, value) per member of the top-level object; array members in `stream_arrays` yield (key, item) per item."""
+    reader = _Reader(chunks)
+    await reader.expect("{")
+    if await reader.peek() == "}":
+        await reader.expect("}")
+        return
+
+    while True:
+        key = await reader.value()
+        if not isinstance(key, str):
+            raise JsonStreamError(f"Object key must be a string, got {key!r}")
+        await reader.expect(":")
+
+        if key in stream_arrays and await reader.peek() == "[":
+            await reader.expect("[")
+            if await reader.peek() == "]":
+                await reader.expect("]")
+            else:
+                while True:
+                    yield key, await reader.value()
+                    if await reader.expect(",", "]") == "]":
+                        break
+        else:
+            yield key, await reader.value()
+
+        if await reader.expect(",", "}") == "}":
+            break
+
+    if await reader.peek() != "":
+        raise JsonStreamError("Trailing data after the top-level object")
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import re
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,12 +15,13 @@ from app.core.pubsub import (
     PubSubRetryableError,
     PubSubSubscription,
     PubSubTopic,
-    get_publisher,
 )
+from app.core.pubsub.batching import MicroBatcher
+from app.core.pubsub.outbox import PubSubOutboxRepository, get_outbox_relay
 from app.domain._shared.gcs import build_parsing_result_uri
 from app.domain.processing.enums import ParsingJobStatus
-from app.domain.processing.models import ParsingJob
 from app.domain.processing.repository import ParsingJobRepository
+from app.domain.document.models import DocumentFile
 from app.domain.document.repository import DocumentFileRepository
 
 if TYPE_CHECKING:
@@ -51,6 +52,17 @@ class ParsedUploadPath:
         )
 
 
+@dataclass(frozen=True)
+class _Upload:
+    ctx: PubSubContext
+    metadata: GcsObjectMetadata
+    parsed: ParsedUploadPath
+
+    @property
+    def source_uri(self) -> str:
+        return f"gs://{self.metadata.bucket}/{self.metadata.name}"
+
+
 class DocumentUploadHandler(GcsUploadHandler):
     name = "document_upload_handler"
     subscriptions = {PubSubSubscription.DOCUMENT_UPLOADS_API}
@@ -64,8 +76,25 @@ class DocumentUploadHandler(GcsUploadHandler):
         "image/jpeg",
     }
 
-    def __init__(self, session_manager: "SessionManager") -> None:
+    def __init__(
+        self,
+        session_manager: "SessionManager",
+        *,
+        batch_max_size: int = 1,
+        batch_window_seconds: float = 0.05,
+    ) -> None:
         self._session_manager = session_manager
+        # With batching, uploads arriving within the window share one transaction
+        self._batcher: MicroBatcher[_Upload] | None = (
+            MicroBatcher(
+                self._process_batch,
+                max_size=batch_max_size,
+                window_seconds=batch_window_seconds,
+                name=self.name,
+            )
+            if batch_max_size > 1
+            else None
+        )
 
     async def handle_upload(self, ctx: PubSubContext, metadata: GcsObjectMetadata) -> None:
         logger.info("Processing upload: %s", metadata.name)
@@ -74,59 +103,110 @@ class DocumentUploadHandler(GcsUploadHandler):
         if not parsed:
             raise PubSubDropError(f"Invalid path: {metadata.name}")
 
-        parsing_job = None
+        upload = _Upload(ctx=ctx, metadata=metadata, parsed=parsed)
+        if self._batcher is not None:
+            await self._batcher.submit(upload)
+            return
+
+        (outcome,) = await self._process_batch([upload])
+        if outcome is not None:
+            raise outcome
+
+    async def _process_batch(self, uploads: list[_Upload]) -> list[BaseException | None]:
         async with self._session_manager() as session:
             try:
-                parsing_job = await self._process_upload(session, ctx, metadata, parsed)
+                outcomes, created = await self._process_uploads(session, uploads)
                 await session.commit()
-            except (PubSubDropError, PubSubRetryableError):
-                await session.rollback()
-                raise
             except Exception as e:
                 await session.rollback()
-                logger.exception("Error processing upload: %s", metadata.name)
-                raise PubSubRetryableError(f"Unexpected error: {e}") from e
+                logger.exception("Error processing %d upload(s)", len(uploads))
+                error = PubSubRetryableError(f"Unexpected error: {e}")
+                return [error] * len(uploads)
 
-        if parsing_job:
-            try:
-                await get_publisher().publish(
-                    topic=PubSubTopic.PARSING_JOBS,
-                    data={
-                        "job_id": str(parsing_job.id),
-                        "org_id": str(parsing_job.org_id),
-                        "document_id": parsed.document_id,
-                        "file_id": str(parsing_job.document_file_id),
-                        "source_uri": parsing_job.source_gcs_uri,
-                        "result_uri": parsing_job.result_gcs_uri,
-                    },
-                    attributes={
-                        "eventType": "PARSING_JOB_CREATED",
-                        "orgId": str(parsing_job.org_id),
-                    },
-                )
-                logger.info("Published parsing job notification for job %s", parsing_job.id)
-            except Exception as e:
-                logger.error("Failed to publish parsing job notification: %s", e)
+        if created:
+            # The notifications were committed to the outbox with the jobs
+            get_outbox_relay().notify()
+        return outcomes
 
-    async def _process_upload(
+    async def _process_uploads(
         self,
         session: AsyncSession,
-        ctx: PubSubContext,
-        metadata: GcsObjectMetadata,
-        parsed: ParsedUploadPath,
-    ) -> ParsingJob | None:
+        uploads: list[_Upload],
+    ) -> tuple[list[BaseException | None], int]:
+        """
+        Confirm the uploads and create their ParsingJobs: one query for the
+        files, one for existing jobs, one bulk insert. Returns per-upload
+        outcomes (None, or the PubSubDropError for that message) and the
+        number of jobs created.
+        """
         file_repo = DocumentFileRepository(session)
         job_repo = ParsingJobRepository(session)
+        outcomes: list[BaseException | None] = [None] * len(uploads)
+
+        files = await file_repo.get_by_ids(list({u.parsed.document_file_id for u in uploads}))
+
+        candidates: list[_Upload] = []
+        for i, upload in enumerate(uploads):
+            doc_file = files.get(upload.parsed.document_file_id)
+            if not doc_file:
+                outcomes[i] = PubSubDropError(f"DocumentFile not found: {upload.parsed.document_file_id}")
+                continue
+            if str(doc_file.org_id) != upload.parsed.org_id:
+                outcomes[i] = PubSubDropError("Org ID mismatch")
+                continue
 
-        doc_file = await file_repo.get_by_id(parsed.document_file_id)
-        if not doc_file:
-            raise PubSubDropError(f"DocumentFile not found: {parsed.document_file_id}")
+            self._confirm_upload(doc_file, upload)
+            if getattr(doc_file, "requires_parsing", True):
+                candidates.append(upload)
 
-        if str(doc_file.org_id) != parsed.org_id:
-            raise PubSubDropError("Org ID mismatch")
+        # Write the confirmed files in one flush
+        await session.flush()
 
-        # Confirm upload by setting source_uri and updating metadata from GCS
-        source_uri = f"gs://{metadata.bucket}/{metadata.name}"
+        if not candidates:
+            return outcomes, 0
+
+        active_files, seen_messages = await job_repo.find_existing_for_uploads(
+            list({u.parsed.document_file_id for u in candidates}),
+            [u.ctx.message_id for u in candidates if u.ctx.message_id],
+        )
+
+        to_create: dict[str, _Upload] = {}
+        for upload in candidates:
+            file_id = upload.parsed.document_file_id
+            if file_id in active_files or file_id in to_create:
+                continue
+            if upload.ctx.message_id and upload.ctx.message_id in seen_messages:
+                continue
+            to_create[file_id] = upload
+
+        job_ids = await job_repo.insert_many([self._job_row(u) for u in to_create.values()])
+
+        outbox = PubSubOutboxRepository(session)
+        for file_id, job_id in job_ids.items():
+            upload = to_create[file_id]
+            outbox.add(
+                PubSubTopic.PARSING_JOBS,
+                data={
+                    "job_id": str(job_id),
+                    "org_id": upload.parsed.org_id,
+                    "document_id": upload.parsed.document_id,
+                    "file_id": file_id,
+                    "source_uri": upload.source_uri,
+                    "result_uri": self._result_uri(upload),
+                },
+                attributes={
+                    "eventType": "PARSING_JOB_CREATED",
+                    "orgId": upload.parsed.org_id,
+                },
+            )
+            logger.info("Created ParsingJob %s for DocumentFile %s", job_id, file_id)
+
+        return outcomes, len(job_ids)
+
+    def _confirm_upload(self, doc_file: DocumentFile, upload: _Upload) -> None:
+        """Confirm upload by setting source_uri and updating metadata from GCS."""
+        metadata = upload.metadata
+        source_uri = upload.source_uri
 
         if doc_file.source_uri is None:
             doc_file.source_uri = source_uri
@@ -137,50 +217,38 @@ class DocumentUploadHandler(GcsUploadHandler):
                 doc_file.content_md5_b64 = metadata.md5_hash
             if metadata.content_type:
                 doc_file.mime_type = metadata.content_type
-            await file_repo.update(doc_file)
             logger.info(
                 "Confirmed upload for DocumentFile %s: %s",
-                parsed.document_file_id,
+                upload.parsed.document_file_id,
                 source_uri,
             )
         elif doc_file.source_uri != source_uri:
             # source_uri already set but doesn't match - this shouldn't happen
             logger.warning(
                 "DocumentFile %s already has source_uri %s, received %s",
-                parsed.document_file_id,
+                upload.parsed.document_file_id,
                 doc_file.source_uri,
                 source_uri,
             )
 
-        requires_parsing = getattr(doc_file, "requires_parsing", True)
-        if not requires_parsing:
-            return None
-
-        if await job_repo.does_job_exist_for_file(parsed.document_file_id):
-            return None
-
-        if ctx.message_id and await job_repo.does_job_exist_for_message(ctx.message_id):
-            return None
-
+    @staticmethod
+    def _result_uri(upload: _Upload) -> str:
         # Predefine the result URI so the worker knows where to upload
-        result_gcs_uri = build_parsing_result_uri(
-            bucket=metadata.bucket,
-            org_id=parsed.org_id,
-            document_id=parsed.document_id,
-            file_id=parsed.document_file_id,
-        )
-
-        parsing_job = ParsingJob(
-            org_id=parsed.org_id,
-            document_file_id=parsed.document_file_id,
-            status=ParsingJobStatus.PENDING,
-            attempt_count=0,
-            pubsub_message_id=ctx.message_id,
-            pubsub_publish_time=ctx.publish_time,
-            source_gcs_uri=source_uri,
-            result_gcs_uri=result_gcs_uri,
+        return build_parsing_result_uri(
+            bucket=upload.metadata.bucket,
+            org_id=upload.parsed.org_id,
+            document_id=upload.parsed.document_id,
+            file_id=upload.parsed.document_file_id,
         )
 
-        await job_repo.create(parsing_job)
-        logger.info("Created ParsingJob %s with result_uri %s", parsing_job.id, result_gcs_uri)
-        return parsing_job
\ No newline at end of file
+    def _job_row(self, upload: _Upload) -> dict[str, Any]:
+        return {
+            "org_id": upload.parsed.org_id,
+            "document_file_id": upload.parsed.document_file_id,
+            "status": ParsingJobStatus.PENDING,
+            "attempt_count": 0,
+            "pubsub_message_id": upload.ctx.message_id or None,
+            "pubsub_publish_time": upload.ctx.publish_time,
+            "source_gcs_uri": upload.source_uri,
+            "result_gcs_uri": self._result_uri(upload),
+        }
@@ -26,6 +26,13 @@ class DocumentFileRepository(DocumentFileRepositoryProtocol):
             await self._db.delete(doc_file)
             await self._db.flush()
 
+    async def get_by_ids(self, ids: list[DocumentFileId]) -> dict[DocumentFileId, DocumentFile]:
+        """Fetch many files in one query; ids that don't exist are absent from the result."""
+        if not ids:
+            return {}
+        result = await self._db.execute(select(DocumentFile).where(DocumentFile.id.in_(ids)))
+        return {f.id: f for f in result.scalars().all()}
+
     async def update(self, file: DocumentFile) -> DocumentFile:
         await self._db.flush()
         return file
@@ -68,4 +68,7 @@ class DocumentFileRepositoryProtocol(BaseRepository[DocumentFile, DocumentFileId
     async def get_latest_file_for_document(
         self,
         document_id: DocumentId,
-    ) -> DocumentFile | None: ...
\ No newline at end of file
+    ) -> DocumentFile | None: ...
+
+    @abstractmethod
+    async def get_by_ids(self, ids: list[DocumentFileId]) -> dict[DocumentFileId, DocumentFile]: ...
\ No newline at end of file
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from sqlalchemy import select, delete as sa_delete
+from collections.abc import Sequence
+
+from sqlalchemy import select, func, delete as sa_delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain._shared.types import OrganizationMemberId
 from app.domain.organization.models import OrganizationMember
 from app.domain.organization.repository.protocols import OrganizationMemberRepositoryProtocol
+from app.domain.organization.schemas import OrganizationMemberCreate
 
 class OrganizationMemberRepository(OrganizationMemberRepositoryProtocol):
     def __init__(self, db: AsyncSession):
@@ -36,4 +40,17 @@ class OrganizationMemberRepository(OrganizationMemberRepositoryProtocol):
 
     async def update(self, member: OrganizationMember) -> OrganizationMember:
         await self._db.flush()
-        return member
\ No newline at end of file
+        return member
+
+    async def upsert_many(self, members: Sequence[OrganizationMemberCreate]) -> None:
+        """INSERT ... ON CONFLICT (user_id, org_id) DO UPDATE SET role, only when the role changed."""
+        rows = {(m.user_id, m.org_id): m.model_dump() for m in members}
+        if not rows:
+            return
+        stmt = pg_insert(OrganizationMember).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[OrganizationMember.user_id, OrganizationMember.org_id],
+            set_={"role": stmt.excluded.role, "updated_at": func.now()},
+            where=OrganizationMember.role.is_distinct_from(stmt.excluded.role),
+        )
+        await self._db.execute(stmt)
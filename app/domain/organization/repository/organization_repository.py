@@ -1,10 +1,20 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.organization.models import Organization
 from app.domain.organization.repository.protocols import OrganizationRepositoryProtocol
+from app.domain.organization.schemas import OrganizationCreate
+
+
+def _org_rows(orgs: Sequence[OrganizationCreate]) -> list[dict]:
+    # One row per clerk_id (last wins): ON CONFLICT can't touch a row twice.
+    rows = {o.clerk_id: o.model_dump() for o in orgs}
+    return list(rows.values())
 
 
 class OrganizationRepository(OrganizationRepositoryProtocol):
@@ -33,3 +43,42 @@ class OrganizationRepository(OrganizationRepositoryProtocol):
         stmt = select(Organization).where(Organization.clerk_id == clerk_org_id)
         res = await self._db.execute(stmt)
         return res.scalar_one_or_none()
+
+    async def get_ids_by_clerk_ids(self, clerk_org_ids: Iterable[str]) -> dict[str, str]:
+        ids = list(set(clerk_org_ids))
+        if not ids:
+            return {}
+        stmt = select(Organization.clerk_id, Organization.id).where(Organization.clerk_id.in_(ids))
+        res = await self._db.execute(stmt)
+        return {clerk_id: org_id for clerk_id, org_id in res.all()}
+
+    async def insert_missing(self, orgs: Sequence[OrganizationCreate]) -> dict[str, str]:
+        """INSERT ... ON CONFLICT DO NOTHING; returns clerk_id -> id of the rows actually inserted."""
+        rows = _org_rows(orgs)
+        if not rows:
+            return {}
+        stmt = (
+            pg_insert(Organization)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[Organization.clerk_id])
+            .returning(Organization.clerk_id, Organization.id)
+        )
+        res = await self._db.execute(stmt)
+        return {clerk_id: org_id for clerk_id, org_id in res.all()}
+
+    async def upsert_many(self, orgs: Sequence[OrganizationCreate]) -> dict[str, str]:
+        """INSERT ... ON CONFLICT DO UPDATE of name/logo; returns clerk_id -> id for every row."""
+        rows = _org_rows(orgs)
+        if not rows:
+            return {}
+        stmt = pg_insert(Organization).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Organization.clerk_id],
+            set_={
+                "name": stmt.excluded.name,
+                "logo_url": stmt.excluded.logo_url,
+                "updated_at": func.now(),
+            },
+        ).returning(Organization.clerk_id, Organization.id)
+        res = await self._db.execute(stmt)
+        return {clerk_id: org_id for clerk_id, org_id in res.all()}
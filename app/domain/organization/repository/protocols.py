@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from collections.abc import Iterable, Sequence
 
 from app.domain._shared.repository import BaseRepository, CompositeKeyRepository
 from app.domain._shared.types import OrganizationMemberId
 from app.domain.organization.models import Organization, OrganizationMember
+from app.domain.organization.schemas import OrganizationCreate, OrganizationMemberCreate
 
 class OrganizationRepositoryProtocol(BaseRepository[Organization, str]):
     @abstractmethod
@@ -13,6 +15,15 @@ class OrganizationRepositoryProtocol(BaseRepository[Organization, str]):
     @abstractmethod
     async def update(self, org: Organization) -> Organization: ...
 
+    @abstractmethod
+    async def get_ids_by_clerk_ids(self, clerk_org_ids: Iterable[str]) -> dict[str, str]: ...
+
+    @abstractmethod
+    async def insert_missing(self, orgs: Sequence[OrganizationCreate]) -> dict[str, str]: ...
+
+    @abstractmethod
+    async def upsert_many(self, orgs: Sequence[OrganizationCreate]) -> dict[str, str]: ...
+
 class OrganizationMemberRepositoryProtocol(CompositeKeyRepository[OrganizationMember, OrganizationMemberId]):
     @abstractmethod
     async def get_by_id(self, id: OrganizationMemberId) -> OrganizationMember | None: ...
@@ -21,4 +32,7 @@ class OrganizationMemberRepositoryProtocol(CompositeKeyRepository[OrganizationMe
     async def delete(self, id: OrganizationMemberId) -> None: ...
 
     @abstractmethod
-    async def update(self, member: OrganizationMember) -> OrganizationMember: ...
\ No newline at end of file
+    async def update(self, member: OrganizationMember) -> OrganizationMember: ...
+
+    @abstractmethod
+    async def upsert_many(self, members: Sequence[OrganizationMemberCreate]) -> None: ...
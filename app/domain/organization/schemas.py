@@ -2,6 +2,7 @@ from pydantic import BaseModel
 from typing import Optional
 from app.domain._shared.types import DateTime
 from app.domain.organization.models import OrganizationRole
+from app.domain.users.schemas import UserCreate
 
 
 class OrganizationBase(BaseModel):
@@ -49,4 +50,20 @@ class OrganizationMemberRead(OrganizationMemberBase):
     updated_at: DateTime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class OrganizationMembershipUpsert(BaseModel):
+    """One membership event: the user and org are created if missing."""
+    user: UserCreate
+    organization: OrganizationCreate
+    role: OrganizationRole
+
+
+class OrganizationMembershipUpsertResult(BaseModel):
+    # Clerk id -> internal id, for every user/org in the batch
+    user_ids: dict[str, str]
+    org_ids: dict[str, str]
+    # Clerk ids of the rows inserted by this call
+    created_user_clerk_ids: list[str]
+    created_org_clerk_ids: list[str]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import AuthContext
@@ -14,8 +16,15 @@ from app.domain.organization.repository.protocols import (
     OrganizationRepositoryProtocol,
     OrganizationMemberRepositoryProtocol,
 )
-from app.domain.organization.schemas import OrganizationCreate, OrganizationUpdate
+from app.domain.organization.schemas import (
+    OrganizationCreate,
+    OrganizationUpdate,
+    OrganizationMemberCreate,
+    OrganizationMembershipUpsert,
+    OrganizationMembershipUpsertResult,
+)
 from app.domain.organization.service.protocols import OrganizationServiceProtocol
+from app.domain.users.repository.protocols import UserRepositoryProtocol
 
 
 class OrganizationService(OrganizationServiceProtocol):
@@ -30,11 +39,13 @@ class OrganizationService(OrganizationServiceProtocol):
         db: AsyncSession,
         organizations: OrganizationRepositoryProtocol,
         org_members: OrganizationMemberRepositoryProtocol,
+        users: UserRepositoryProtocol,
         ctx: AuthContext | None = None,
     ):
         self._db = db
         self._organizations = organizations
         self._org_members = org_members
+        self._users = users
         self._ctx = ctx
 
     async def create_organization(self, payload: OrganizationCreate) -> Organization:
@@ -120,6 +131,55 @@ class OrganizationService(OrganizationServiceProtocol):
             await self._db.rollback()
             raise
 
+    async def upsert_organizations(self, payloads: Sequence[OrganizationCreate]) -> dict[str, str]:
+        """Bulk create-or-update by clerk_id in one statement; returns clerk_id -> id."""
+        try:
+            ids = await self._organizations.upsert_many(payloads)
+            await self._db.commit()
+            return ids
+        except Exception:
+            await self._db.rollback()
+            raise
+
+    async def upsert_memberships(
+        self, items: Sequence[OrganizationMembershipUpsert]
+    ) -> OrganizationMembershipUpsertResult:
+        """
+        Applies a batch of membership events in one transaction with a constant
+        number of statements: users and orgs are inserted if missing (existing
+        rows are left untouched), then memberships are upserted with their role.
+        """
+        try:
+            created_users = await self._users.insert_missing([i.user for i in items])
+            user_ids = dict(created_users)
+            missing_users = {i.user.clerk_user_id for i in items} - user_ids.keys()
+            user_ids.update(await self._users.get_ids_by_clerk_ids(missing_users))
+
+            created_orgs = await self._organizations.insert_missing([i.organization for i in items])
+            org_ids = dict(created_orgs)
+            missing_orgs = {i.organization.clerk_id for i in items} - org_ids.keys()
+            org_ids.update(await self._organizations.get_ids_by_clerk_ids(missing_orgs))
+
+            await self._org_members.upsert_many([
+                OrganizationMemberCreate(
+                    user_id=user_ids[i.user.clerk_user_id],
+                    org_id=org_ids[i.organization.clerk_id],
+                    role=i.role,
+                )
+                for i in items
+            ])
+            await self._db.commit()
+
+            return OrganizationMembershipUpsertResult(
+                user_ids=user_ids,
+                org_ids=org_ids,
+                created_user_clerk_ids=list(created_users),
+                created_org_clerk_ids=list(created_orgs),
+            )
+        except Exception:
+            await self._db.rollback()
+            raise
+
     async def remove_member_from_organization(
         self, organization_id: str, user_id: str
     ) -> None:
@@ -1,7 +1,13 @@
+from collections.abc import Sequence
 from typing import Protocol
 
 from app.domain.organization.models import Organization
-from app.domain.organization.schemas import OrganizationCreate, OrganizationUpdate
+from app.domain.organization.schemas import (
+    OrganizationCreate,
+    OrganizationUpdate,
+    OrganizationMembershipUpsert,
+    OrganizationMembershipUpsertResult,
+)
 
 
 class OrganizationServiceProtocol(Protocol):
@@ -13,3 +19,5 @@ class OrganizationServiceProtocol(Protocol):
     async def add_member_to_organization(self, organization_id: str, user_id: str, role: str) -> None: ...
     async def remove_member_from_organization(self, organization_id: str, user_id: str) -> None: ...
     async def update_organization_member_role(self, organization_id: str, user_id: str, new_role: str) -> None: ...
+    async def upsert_organizations(self, payloads: Sequence[OrganizationCreate]) -> dict[str, str]: ...
+    async def upsert_memberships(self, items: Sequence[OrganizationMembershipUpsert]) -> OrganizationMembershipUpsertResult: ...
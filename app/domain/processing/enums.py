@@ -7,4 +7,40 @@ class ParsingJobStatus(str, Enum):
     COMPLETED = "COMPLETED"
     FAILED = "FAILED"
     RETRYING = "RETRYING"
-    CANCELLED = "CANCELLED"
\ No newline at end of file
+    CANCELLED = "CANCELLED"
+
+
+# Status changes a worker may report: current status -> allowed new statuses.
+# Anything else (e.g. reviving a FAILED job, or COMPLETED -> COMPLETED replays)
+# is rejected by ParsingJobRepository.apply_status_updates.
+WORKER_STATUS_TRANSITIONS: dict[ParsingJobStatus, frozenset[ParsingJobStatus]] = {
+    ParsingJobStatus.PENDING: frozenset({
+        ParsingJobStatus.QUEUED,
+        ParsingJobStatus.PROCESSING,
+        ParsingJobStatus.FAILED,
+        ParsingJobStatus.CANCELLED,
+    }),
+    ParsingJobStatus.QUEUED: frozenset({
+        ParsingJobStatus.PROCESSING,
+        ParsingJobStatus.FAILED,
+        ParsingJobStatus.CANCELLED,
+    }),
+    ParsingJobStatus.PROCESSING: frozenset({
+        ParsingJobStatus.COMPLETED,
+        ParsingJobStatus.FAILED,
+        ParsingJobStatus.RETRYING,
+        ParsingJobStatus.CANCELLED,
+    }),
+    ParsingJobStatus.RETRYING: frozenset({
+        ParsingJobStatus.QUEUED,
+        ParsingJobStatus.PROCESSING,
+        ParsingJobStatus.FAILED,
+        ParsingJobStatus.CANCELLED,
+    }),
+}
+
+TERMINAL_STATUSES: frozenset[ParsingJobStatus] = frozenset({
+    ParsingJobStatus.COMPLETED,
+    ParsingJobStatus.FAILED,
+    ParsingJobStatus.CANCELLED,
+})
@@ -12,6 +12,11 @@ class ParsingJobAlreadyExistsError(MareonError):
     code = "PARSING_JOB_ALREADY_EXISTS"
     status_code = status.HTTP_409_CONFLICT
 
+class ParsingResultInvalidError(MareonError):
+    message = "Parsing result could not be ingested."
+    code = "PARSING_RESULT_INVALID"
+    status_code = status.HTTP_422_UNPROCESSABLE_CONTENT
 
 
-__all__ = ["ParsingJobNotFound", "ParsingJobAlreadyExistsError"]
\ No newline at end of file
+
+__all__ = ["ParsingJobNotFound", "ParsingJobAlreadyExistsError", "ParsingResultInvalidError"]
\ No newline at end of file
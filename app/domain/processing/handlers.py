@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+from app.core.pubsub import (
+    GcsObjectMetadata,
+    GcsUploadHandler,
+    PubSubContext,
+    PubSubDropError,
+    PubSubRetryableError,
+    PubSubSubscription,
+)
+from app.domain._shared.gcs import build_gcs_uri
+from app.domain.processing.enums import ParsingJobStatus
+from app.domain.processing.exceptions import ParsingResultInvalidError
+from app.domain.processing.ingestion import ParsingResultIngestor
+from app.domain.processing.models import ParsingJob
+from app.domain.processing.repository import ParsingJobRepository
+
+if TYPE_CHECKING:
+    from app.infrastructure.db.session_manager import SessionManager
+
+logger = logging.getLogger(__name__)
+
+
+class ParsingResultHandler(GcsUploadHandler):
+    """
+    Completes parsing jobs when the worker's result object lands in GCS.
+
+    Workers write to the job's predefined result_gcs_uri under
+    `org-uploads-parsed/`; its finalize notification arrives on the same
+    subscription as uploads. The job is found by that URI, the result is
+    ingested into the vessel tables and the job marked COMPLETED in the same
+    transaction, so completion needs no polling.
+
+    A result object rewritten for a job that is already COMPLETED is ingested
+    again (the upserts are idempotent); FAILED and CANCELLED jobs are left alone.
+    """
+
+    name = "parsing_result_handler"
+    subscriptions = {PubSubSubscription.DOCUMENT_UPLOADS_API}
+    allowed_prefixes = {"org-uploads-parsed/"}
+
+    def __init__(self, session_manager: "SessionManager") -> None:
+        self._session_manager = session_manager
+
+    async def handle_upload(self, ctx: PubSubContext, metadata: GcsObjectMetadata) -> None:
+        result_uri = build_gcs_uri(metadata.bucket, metadata.name)
+
+        async with self._session_manager() as session:
+            jobs = ParsingJobRepository(session)
+            try:
+                job = await jobs.get_latest_by_result_uri(result_uri, for_update=True)
+                if job is None:
+                    raise PubSubDropError(f"No parsing job for result: {result_uri}")
+                if job.status in (ParsingJobStatus.FAILED, ParsingJobStatus.CANCELLED):
+                    raise PubSubDropError(f"Parsing job {job.id} is {job.status.value}, ignoring result")
+
+                await ParsingResultIngestor(session).ingest(job)
+                self._complete(job)
+                await session.commit()
+            except PubSubDropError:
+                await session.rollback()
+                raise
+            except ParsingResultInvalidError as e:
+                await session.rollback()
+                await self._fail(jobs, result_uri, e)
+                await session.commit()
+                raise PubSubDropError(e.message) from e
+            except Exception as e:
+                await session.rollback()
+                logger.exception("Error completing parsing job for %s", result_uri)
+                raise PubSubRetryableError(f"Unexpected error: {e}") from e
+
+        logger.info("Completed ParsingJob %s from %s", job.id, result_uri)
+
+    @staticmethod
+    def _complete(job: ParsingJob) -> None:
+        if job.status != ParsingJobStatus.COMPLETED:
+            job.status = ParsingJobStatus.COMPLETED
+            job.finished_at = datetime.now(timezone.utc)
+        job.error_message = None
+        job.error_details = None
+        job.locked_by = None
+        job.locked_until = None
+
+    @staticmethod
+    async def _fail(jobs: ParsingJobRepository, result_uri: str, error: ParsingResultInvalidError) -> None:
+        """
+        Record an unusable result on the job; a redelivery would not fix it.
+        A completed job keeps its status: its earlier result is already ingested.
+        """
+        job = await jobs.get_latest_by_result_uri(result_uri, for_update=True)
+        if job is None:
+            return
+        logger.warning("Parsing result of job %s is invalid: %s", job.id, error.message)
+        if job.status == ParsingJobStatus.COMPLETED:
+            return
+        job.status = ParsingJobStatus.FAILED
+        job.finished_at = datetime.now(timezone.utc)
+        job.error_message = error.message
+        job.error_details = {"code": error.code, "result_gcs_uri": result_uri}
+        job.locked_by = None
+        job.locked_until = None
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterable
+
+from app.core.config import get_settings
+from app.domain._shared.types import ParsingJobId
+from app.domain.processing.repository import ParsingJobRepository
+from app.infrastructure.db import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class LeaseHeartbeat:
+    """
+    Keeps a worker's leases on claimed parsing jobs alive while it works on them.
+
+    Every `interval_seconds` the leases of the jobs still held are extended by
+    `lease_seconds` in one UPDATE. A job the reaper already released shows up
+    in `lost`; the worker should abandon it, as it may be claimed elsewhere.
+
+    Usage:
+        jobs = await repo.claim_batch(worker_id=worker_id, limit=10, lease_seconds=300)
+        async with LeaseHeartbeat(worker_id, [j.id for j in jobs]) as heartbeat:
+            for job in jobs:
+                if job.id in heartbeat.lost:
+                    continue
+                await parse(job)
+                heartbeat.release(job.id)
+    """
+
+    def __init__(
+        self,
+        worker_id: str,
+        job_ids: Iterable[ParsingJobId],
+        *,
+        session_factory=AsyncSessionLocal,
+        lease_seconds: float | None = None,
+        interval_seconds: float | None = None,
+    ) -> None:
+        settings = get_settings()
+        self._worker_id = worker_id
+        self._held: set[ParsingJobId] = set(job_ids)
+        self._session_factory = session_factory
+        self._lease_seconds = lease_seconds or settings.parsing_job_lease_seconds
+        self._interval = interval_seconds or settings.parsing_job_heartbeat_seconds
+        self._task: asyncio.Task | None = None
+        self.lost: set[ParsingJobId] = set()
+
+    def release(self, job_id: ParsingJobId) -> None:
+        """Stop heartbeating a job (finished or given up by the worker)."""
+        self._held.discard(job_id)
+
+    async def beat(self) -> None:
+        if not self._held:
+            return
+        held = set(self._held)
+        try:
+            async with self._session_factory() as db:
+                still_held = await ParsingJobRepository(db).extend_leases(
+                    list(held),
+                    worker_id=self._worker_id,
+                    lease_seconds=self._lease_seconds,
+                )
+                await db.commit()
+        except Exception as e:
+            # Retried on the next beat; the lease leaves room for a few misses
+            logger.warning("Parsing job heartbeat failed for %s: %s", self._worker_id, e)
+            return
+
+        lost = (held - still_held) & self._held
+        if lost:
+            logger.warning("Worker %s lost the lease on %d parsing jobs", self._worker_id, len(lost))
+            self.lost |= lost
+            self._held -= lost
+
+    async def _run(self) -> None:
+        while self._held:
+            await asyncio.sleep(self._interval)
+            await self.beat()
+
+    async def __aenter__(self) -> LeaseHeartbeat:
+        self._task = asyncio.get_running_loop().create_task(self._run(), name=f"lease-heartbeat-{self._worker_id}")
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
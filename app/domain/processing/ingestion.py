@@ -0,0 +1,219 @@
+"""
+Ingestion of parsing results into the vessel tables.
+
+The worker writes one JSON object per parsed file to the job's result_gcs_uri:
+
+    {
+        "identity": {"imo_number": "9876543", "reported_name": "...", ...},
+        "dimensions": {"loa_m": 199.9, ...},
+        "certificates": [{"domain": "CLASS", "description": "...", ...}, ...]
+    }
+
+Members are optional and unknown keys are ignored. The object is streamed from
+storage and certificates are upserted `chunk_size` at a time, so a class status
+report with hundreds of certificates is read in one pass with bounded memory.
+The worker writes "identity" first: the vessel is resolved from the identity
+seen before the first row is written.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.domain._shared.gcs import parse_gcs_uri
+from app.domain._shared.json_stream import JsonStreamError, iter_object_members
+from app.domain._shared.types import UserId, VesselId
+from app.domain.document.models import DocumentFile
+from app.domain.processing.exceptions import ParsingResultInvalidError
+from app.domain.processing.models import ParsingJob
+from app.domain.processing.repository import ParsingJobRepository
+from app.domain.vessel.models import Vessel
+from app.domain.vessel.repository import (
+    VesselCertificateRepository,
+    VesselDimensionsRepository,
+    VesselIdentityRepository,
+    VesselRepository,
+)
+from app.domain.vessel.schemas import (
+    VesselCertificateBase,
+    VesselDimensionsCreate,
+    VesselIdentityCreate,
+)
+from app.infrastructure.storage import StorageClient, get_storage_client
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ParsingResultSummary:
+    vessel_id: VesselId | None = None
+    identity: bool = False
+    dimensions: bool = False
+    certificates: int = 0
+    skipped_certificates: int = 0
+
+
+def _validate(schema: type[BaseModel], data: Any) -> BaseModel:
+    if not isinstance(data, dict):
+        raise ValueError(f"expected an object, got {type(data).__name__}")
+    # Request schemas forbid extra fields; workers may report more than we store
+    return schema.model_validate({k: v for k, v in data.items() if k in schema.model_fields})
+
+
+class ParsingResultIngestor:
+    """
+    Streams a parsing job's result object into VesselIdentity, VesselDimensions
+    and VesselCertificate for the job's organization.
+
+    The vessel is the one an earlier result of the same file was ingested
+    into (recorded on ParsingJob.vessel_id), else matched by IMO, then MMSI
+    number, within the organization, else created. Ingesting a result again
+    therefore updates the same rows. Numbers already held by another vessel
+    are not copied, as they are unique across organizations.
+
+    Nothing is committed: the caller owns the transaction, so a result is
+    ingested entirely or not at all.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        *,
+        storage: StorageClient | None = None,
+        chunk_size: int | None = None,
+    ) -> None:
+        self._db = db
+        self._storage = storage
+        self._chunk_size = chunk_size or get_settings().parsing_result_chunk_size
+        self._jobs = ParsingJobRepository(db)
+        self._vessels = VesselRepository(db)
+        self._identities = VesselIdentityRepository(db)
+        self._dimensions = VesselDimensionsRepository(db)
+        self._certificates = VesselCertificateRepository(db)
+
+    async def ingest(self, job: ParsingJob) -> ParsingResultSummary:
+        if not job.result_gcs_uri:
+            raise ParsingResultInvalidError("Parsing job has no result URI.", metadata={"job_id": job.id})
+
+        storage = self._storage or get_storage_client()
+        bucket, path = parse_gcs_uri(job.result_gcs_uri)
+        if storage.bucket_name is not None and bucket != storage.bucket_name:
+            raise ParsingResultInvalidError(
+                "Parsing result is outside the configured bucket.",
+                metadata={"job_id": job.id, "uri": job.result_gcs_uri},
+            )
+
+        summary = ParsingResultSummary()
+        identity: dict[str, Any] = {}
+        pending: list[dict[str, Any]] = []
+        created_by = await self._db.scalar(
+            select(DocumentFile.uploaded_by).where(DocumentFile.id == job.document_file_id)
+        )
+
+        async def vessel_id() -> VesselId:
+            if summary.vessel_id is None:
+                summary.vessel_id = await self._resolve_vessel(job, identity, created_by)
+                if identity:
+                    await self._identities.upsert(summary.vessel_id, identity)
+                    summary.identity = True
+            return summary.vessel_id
+
+        async def flush_certificates() -> None:
+            rows = [
+                {**row, "vessel_id": await vessel_id(), "org_id": job.org_id, "created_by": created_by}
+                for row in pending
+            ]
+            pending.clear()
+            summary.certificates += await self._certificates.upsert_many(rows)
+
+        try:
+            async for key, value in iter_object_members(storage.iter_file(path), stream_arrays={"certificates"}):
+                try:
+                    if key == "identity":
+                        if summary.vessel_id is not None:
+                            logger.warning("Ignoring identity after vessel data in %s", job.result_gcs_uri)
+                            continue
+                        identity = _validate(VesselIdentityCreate, value).model_dump(exclude_unset=True)
+                    elif key == "dimensions":
+                        dimensions = _validate(VesselDimensionsCreate, value).model_dump(exclude_none=True)
+                        if dimensions:
+                            await self._dimensions.upsert(await vessel_id(), dimensions)
+                            summary.dimensions = True
+                    elif key == "certificates":
+                        pending.append(_validate(VesselCertificateBase, value).model_dump())
+                        if len(pending) >= self._chunk_size:
+                            await flush_certificates()
+                except (ValidationError, ValueError) as e:
+                    if key != "certificates":
+                        raise ParsingResultInvalidError(
+                            f"Invalid '{key}' in parsing result: {e}",
+                            metadata={"job_id": job.id},
+                        ) from e
+                    # One unreadable certificate should not cost the rest of the report
+                    summary.skipped_certificates += 1
+                    logger.warning("Skipping invalid certificate in %s: %s", job.result_gcs_uri, e)
+        except JsonStreamError as e:
+            raise ParsingResultInvalidError(
+                f"Malformed parsing result: {e}",
+                metadata={"job_id": job.id, "uri": job.result_gcs_uri},
+            ) from e
+
+        if pending:
+            await flush_certificates()
+        if identity and summary.vessel_id is None:
+            await vessel_id()
+
+        logger.info(
+            "Ingested parsing result of job %s into vessel %s: %d certificates (%d skipped)",
+            job.id, summary.vessel_id, summary.certificates, summary.skipped_certificates,
+        )
+        return summary
+
+    async def _resolve_vessel(
+        self,
+        job: ParsingJob,
+        identity: dict[str, Any],
+        created_by: UserId | None,
+    ) -> VesselId:
+        """
+        The vessel for `identity`, recorded on the job: the one an earlier
+        result of the same file went into, else the organization's vessel with
+        the same IMO or MMSI number, else a new one. Numbers owned by another
+        vessel are dropped from `identity`.
+        """
+        imo, mmsi = identity.get("imo_number"), identity.get("mmsi_number")
+        owners = await self._identities.find_owners(imo_number=imo, mmsi_number=mmsi)
+
+        # Re-ingesting (a rewritten result, a redelivery, a re-parse) must land
+        # on the same vessel, even when the result carries no numbers
+        vessel_id = job.vessel_id or await self._jobs.get_vessel_id_for_file(job.document_file_id)
+        if vessel_id is None:
+            # Prefer the IMO match: it identifies a hull for life, an MMSI can be reassigned
+            match = next((o for o in owners if imo and o[2] == imo and o[1] == job.org_id), None)
+            match = match or next((o for o in owners if mmsi and o[3] == mmsi and o[1] == job.org_id), None)
+            vessel_id = match[0] if match is not None else None
+
+        for owner_id, _, owner_imo, owner_mmsi in owners:
+            if owner_id == vessel_id:
+                continue
+            if imo and owner_imo == imo:
+                identity.pop("imo_number", None)
+            if mmsi and owner_mmsi == mmsi:
+                identity.pop("mmsi_number", None)
+
+        if vessel_id is None:
+            vessel = Vessel(org_id=job.org_id, created_by=created_by)
+            if identity.get("reported_name"):
+                vessel.name = identity["reported_name"]
+            await self._vessels.create(vessel)
+            vessel_id = vessel.id
+
+        job.vessel_id = vessel_id
+        return vessel_id
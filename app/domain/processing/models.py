@@ -59,6 +59,21 @@ class ParsingJob(UUIDPrimaryKeyMixin, TimestampsMixin, Base):
         nullable=True,
     )
 
+    # Worker lease, set when a worker claims the job (see ParsingJobRepository.claim_batch)
+    locked_by: sa.Mapped[str | None] = sa.mapped_column(sa.String, nullable=True)
+    locked_until: sa.Mapped[DateTime | None] = sa.mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=True,
+    )
+
+    # Vessel the result was ingested into; later results of the same file reuse it
+    vessel_id: sa.Mapped[str | None] = sa.mapped_column(
+        sa.String,
+        sa.ForeignKey("vessel.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+
     error_message: sa.Mapped[str | None] = sa.mapped_column(sa.Text, nullable=True)
     error_details: sa.Mapped[dict | None] = sa.mapped_column(sa.JSONB, nullable=True)
 
@@ -90,6 +105,15 @@ class ParsingJob(UUIDPrimaryKeyMixin, TimestampsMixin, Base):
         ),
 
         # Helpful indexes
+        sa.Index("ix_parsing_job_status_created_at", "status", "created_at"),
+        # Expired-lease scan of the stuck-job reaper
+        sa.Index(
+            "ix_parsing_job_processing_lease",
+            "locked_until",
+            postgresql_where=sa.text("status = 'PROCESSING'"),
+        ),
+        # Result-object notifications find their job by URI (see processing/handlers.py)
+        sa.Index("ix_parsing_job_result_gcs_uri_created_at", "result_gcs_uri", "created_at"),
         sa.Index("ix_parsing_job_org_status_created", "org_id", "status", "created_at"),
         sa.Index("ix_parsing_job_org_created", "org_id", "created_at"),
     )
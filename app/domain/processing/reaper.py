@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from functools import lru_cache
+
+from app.core.config import get_settings
+from app.core.metrics import get_metrics_registry
+from app.domain.processing.enums import ParsingJobStatus
+from app.domain.processing.repository import ParsingJobRepository
+from app.infrastructure.db import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+REAPED_JOBS = get_metrics_registry().counter(
+    "parsing_jobs_reaped_total",
+    "PROCESSING parsing jobs released after their lease expired, by new status",
+    ["status"],
+)
+
+
+class ParsingJobReaper:
+    """
+    Periodically releases parsing jobs stuck in PROCESSING whose worker lease
+    expired (see `ParsingJobRepository.reap_expired`): RETRYING while attempts
+    remain, FAILED otherwise, which also frees the file's active-job slot.
+    Jobs left in PROCESSING without a lease count as expired `lease_seconds`
+    after they started.
+
+    Each chunk of `chunk_size` jobs is its own short transaction, so the reaper
+    never holds locks on many rows; a pass stops after `max_chunks`.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory=AsyncSessionLocal,
+        interval_seconds: float = 30.0,
+        lease_seconds: float = 300.0,
+        chunk_size: int = 100,
+        max_chunks: int = 50,
+    ) -> None:
+        self._session_factory = session_factory
+        self._interval = interval_seconds
+        self._lease_seconds = lease_seconds
+        self._chunk_size = chunk_size
+        self._max_chunks = max_chunks
+
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._closing = False
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._closing = False
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="parsing-job-reaper")
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop after the chunk in flight."""
+        if self._task is None:
+            return
+
+        self._closing = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while not self._closing:
+            self._wakeup.clear()
+            await self.reap()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def reap(self) -> int:
+        """One pass; returns the number of jobs released."""
+        total = 0
+        for _ in range(self._max_chunks):
+            if self._closing:
+                break
+            try:
+                async with self._session_factory() as db:
+                    reaped = await ParsingJobRepository(db).reap_expired(
+                        limit=self._chunk_size,
+                        lease_seconds=self._lease_seconds,
+                    )
+                    await db.commit()
+            except Exception as e:
+                logger.error("Failed to reap expired parsing jobs: %s", e, exc_info=True)
+                break
+
+            failed = sum(1 for _, status in reaped if status == ParsingJobStatus.FAILED)
+            if failed:
+                REAPED_JOBS.inc(failed, status=ParsingJobStatus.FAILED.value)
+            if len(reaped) > failed:
+                REAPED_JOBS.inc(len(reaped) - failed, status=ParsingJobStatus.RETRYING.value)
+            total += len(reaped)
+            if len(reaped) < self._chunk_size:
+                break
+
+        if total:
+            logger.warning("Released %d parsing jobs with expired leases", total)
+        return total
+
+
+@lru_cache(maxsize=1)
+def get_parsing_job_reaper() -> ParsingJobReaper:
+    """Get the process-wide parsing job reaper."""
+    settings = get_settings()
+    return ParsingJobReaper(
+        interval_seconds=settings.parsing_job_reaper_interval_seconds,
+        lease_seconds=settings.parsing_job_lease_seconds,
+        chunk_size=settings.parsing_job_reaper_chunk_size,
+        max_chunks=settings.parsing_job_reaper_max_chunks,
+    )
@@ -1,13 +1,38 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from typing import Any, Sequence
+
+from sqlalchemy import String, Text, and_, case, cast, column, func, literal, or_, select, text, update, values
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain._shared.types import ParsingJobId, DocumentFileId
+from app.domain._shared.types import ParsingJobId, DocumentFileId, VesselId
 from app.domain.processing.models import ParsingJob
-from app.domain.processing.enums import ParsingJobStatus
+from app.domain.processing.enums import ParsingJobStatus, TERMINAL_STATUSES, WORKER_STATUS_TRANSITIONS
 from .protocols import ParsingJobRepositoryProtocol
 
+_ACTIVE_STATUSES = [
+    ParsingJobStatus.PENDING,
+    ParsingJobStatus.QUEUED,
+    ParsingJobStatus.PROCESSING,
+    ParsingJobStatus.RETRYING,
+]
+
+_CLAIMABLE_STATUSES = [ParsingJobStatus.PENDING, ParsingJobStatus.RETRYING]
+
+_TRANSITIONS = values(
+    column("from_status", String),
+    column("to_status", String),
+    name="transitions",
+    literal_binds=True,
+).data([
+    (current.value, new.value)
+    for current, allowed in WORKER_STATUS_TRANSITIONS.items()
+    for new in sorted(allowed)
+])
+
+
 class ParsingJobRepository(ParsingJobRepositoryProtocol):
     def __init__(self, db: AsyncSession):
         self._db = db
@@ -53,4 +78,325 @@ class ParsingJobRepository(ParsingJobRepositoryProtocol):
         ).limit(1).with_for_update(skip_locked=True)  # optional: avoid blocking if many concurrent checks
 
         result = await self._db.execute(stmt)
-        return result.scalar() is not None
\ No newline at end of file
+        return result.scalar() is not None
+
+    async def find_existing_for_uploads(
+        self,
+        file_ids: Sequence[DocumentFileId],
+        message_ids: Sequence[str],
+    ) -> tuple[set[DocumentFileId], set[str]]:
+        """
+        Batched form of `does_job_exist_for_file` + `does_job_exist_for_message`.
+        Returns (files with an active job, message ids that already created a job).
+        """
+        conditions = []
+        if file_ids:
+            conditions.append(
+                ParsingJob.document_file_id.in_(file_ids) & ParsingJob.status.in_(_ACTIVE_STATUSES)
+            )
+        if message_ids:
+            conditions.append(ParsingJob.pubsub_message_id.in_(message_ids))
+        if not conditions:
+            return set(), set()
+
+        stmt = select(ParsingJob.document_file_id, ParsingJob.status, ParsingJob.pubsub_message_id).where(
+            or_(*conditions)
+        )
+        result = await self._db.execute(stmt)
+
+        wanted_files = set(file_ids)
+        wanted_messages = set(message_ids)
+        active_files: set[DocumentFileId] = set()
+        seen_messages: set[str] = set()
+        for file_id, status, message_id in result.all():
+            if file_id in wanted_files and status in _ACTIVE_STATUSES:
+                active_files.add(file_id)
+            if message_id in wanted_messages:
+                seen_messages.add(message_id)
+        return active_files, seen_messages
+
+    async def insert_many(self, rows: Sequence[dict[str, Any]]) -> dict[DocumentFileId, ParsingJobId]:
+        """
+        INSERT ... ON CONFLICT DO NOTHING; rows that lose a race on the active-job
+        or message-id unique indexes are skipped. Returns document_file_id -> id
+        of the jobs actually inserted.
+        """
+        if not rows:
+            return {}
+        stmt = (
+            pg_insert(ParsingJob)
+            .values(list(rows))
+            .on_conflict_do_nothing()
+            .returning(ParsingJob.document_file_id, ParsingJob.id)
+        )
+        result = await self._db.execute(stmt)
+        return {file_id: job_id for file_id, job_id in result.all()}
+
+    async def claim_batch(self, *, worker_id: str, limit: int, lease_seconds: float) -> list[ParsingJob]:
+        """
+        Atomically move up to `limit` of the oldest PENDING/RETRYING jobs to
+        PROCESSING for `worker_id`, leased for `lease_seconds`. Rows locked by a
+        concurrent claim are skipped rather than waited on, so workers never
+        block each other; served by ix_parsing_job_status_created_at.
+        """
+        batch = (
+            select(ParsingJob.id)
+            .where(
+                ParsingJob.status.in_(_CLAIMABLE_STATUSES),
+                ParsingJob.attempt_count < ParsingJob.max_attempts,
+            )
+            .order_by(ParsingJob.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("batch")
+        )
+        stmt = (
+            update(ParsingJob)
+            .where(ParsingJob.id == batch.c.id)
+            .values(
+                status=ParsingJobStatus.PROCESSING,
+                attempt_count=ParsingJob.attempt_count + 1,
+                started_at=func.now(),
+                finished_at=None,
+                locked_by=worker_id,
+                locked_until=text("now() + make_interval(secs => :lease_seconds)").bindparams(
+                    lease_seconds=float(lease_seconds)
+                ),
+            )
+            .returning(ParsingJob)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._db.scalars(stmt)
+        return list(result.all())
+
+    async def extend_leases(
+        self,
+        job_ids: Sequence[ParsingJobId],
+        *,
+        worker_id: str,
+        lease_seconds: float,
+    ) -> set[ParsingJobId]:
+        """
+        Heartbeat: push out the lease of jobs `worker_id` still holds. Returns
+        the ids still leased to it; a missing id was reaped (or finished) and
+        the worker should abandon it.
+        """
+        if not job_ids:
+            return set()
+        stmt = (
+            update(ParsingJob)
+            .where(
+                ParsingJob.id.in_(job_ids),
+                ParsingJob.status == ParsingJobStatus.PROCESSING,
+                ParsingJob.locked_by == worker_id,
+            )
+            .values(
+                locked_until=text("now() + make_interval(secs => :lease_seconds)").bindparams(
+                    lease_seconds=float(lease_seconds)
+                ),
+            )
+            .returning(ParsingJob.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._db.execute(stmt)
+        return set(result.scalars().all())
+
+    async def reap_expired(self, *, limit: int, lease_seconds: float) -> list[tuple[ParsingJobId, ParsingJobStatus]]:
+        """
+        Release up to `limit` PROCESSING jobs whose lease has expired (their
+        worker died or stalled): back to RETRYING while attempts remain,
+        otherwise FAILED. Jobs in PROCESSING without a lease (set by a worker
+        that never took one, or from before leases existed) expire
+        `lease_seconds` after they started. Uses ix_parsing_job_processing_lease
+        (which also holds the NULL leases) and skips rows locked by a
+        concurrent claim, heartbeat or reaper. Returns (id, new status).
+        """
+        unleased_expiry = func.coalesce(ParsingJob.started_at, ParsingJob.updated_at) + text(
+            "make_interval(secs => :lease_seconds)"
+        ).bindparams(lease_seconds=float(lease_seconds))
+        expired = (
+            select(ParsingJob.id)
+            .where(
+                # Inlined so the partial index predicate matches under generic plans
+                text("parsing_job.status = 'PROCESSING'"),
+                or_(
+                    ParsingJob.locked_until < func.now(),
+                    and_(ParsingJob.locked_until.is_(None), unleased_expiry < func.now()),
+                ),
+            )
+            .order_by(ParsingJob.locked_until.nullsfirst())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("expired")
+        )
+        exhausted = ParsingJob.attempt_count >= ParsingJob.max_attempts
+        stmt = (
+            update(ParsingJob)
+            .where(ParsingJob.id == expired.c.id)
+            .values(
+                status=case(
+                    (exhausted, literal(ParsingJobStatus.FAILED.value)),
+                    else_=literal(ParsingJobStatus.RETRYING.value),
+                ),
+                finished_at=case((exhausted, func.now()), else_=None),
+                error_message=case(
+                    (exhausted, literal("Worker lease expired; no attempts left")),
+                    else_=literal("Worker lease expired"),
+                ),
+                locked_by=None,
+                locked_until=None,
+            )
+            .returning(ParsingJob.id, ParsingJob.status)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._db.execute(stmt)
+        return [(job_id, status) for job_id, status in result.all()]
+
+    async def apply_status_updates(
+        self,
+        updates: Sequence[dict[str, Any]],
+        *,
+        lease_seconds: float,
+        worker_id: str | None = None,
+    ) -> set[ParsingJobId]:
+        """
+        Apply many worker status updates in one `UPDATE ... FROM (VALUES ...)`.
+
+        Each update is a dict with id, status, error_message, error_details and
+        result_gcs_uri. It only applies if the job's current status may move to
+        the new one (WORKER_STATUS_TRANSITIONS, joined in SQL) and, given a
+        `worker_id`, the job is not leased to another worker. Terminal statuses
+        stamp finished_at. Moving into PROCESSING counts an attempt, as
+        `claim_batch` does, and is refused once attempts are exhausted; it takes
+        a `lease_seconds` lease for `worker_id` (without one, the lease is
+        unowned but still expires, so the reaper can release the job). Leaving
+        PROCESSING releases the lease. RETRYING with no attempts left is written
+        as FAILED, as `reap_expired` does, since nothing would claim it again.
+        Returns the ids that were updated.
+        """
+        if not updates:
+            return set()
+
+        batch = values(
+            column("id", String),
+            column("status", String),
+            column("error_message", Text),
+            column("error_details", JSONB(none_as_null=True)),
+            column("result_gcs_uri", String),
+            name="batch",
+        ).data([
+            (
+                str(u["id"]),
+                ParsingJobStatus(u["status"]).value,
+                u.get("error_message"),
+                u.get("error_details"),
+                u.get("result_gcs_uri"),
+            )
+            for u in updates
+        ])
+
+        is_processing = batch.c.status == ParsingJobStatus.PROCESSING.value
+        exhausted = ParsingJob.attempt_count >= ParsingJob.max_attempts
+        retry_exhausted = and_(batch.c.status == ParsingJobStatus.RETRYING.value, exhausted)
+        conditions = [
+            ParsingJob.id == batch.c.id,
+            _TRANSITIONS.c.from_status == ParsingJob.status,
+            _TRANSITIONS.c.to_status == batch.c.status,
+            or_(~is_processing, ~exhausted),
+        ]
+        if worker_id is not None:
+            conditions.append(or_(ParsingJob.locked_by.is_(None), ParsingJob.locked_by == worker_id))
+
+        stmt = (
+            update(ParsingJob)
+            .where(*conditions)
+            .values(
+                status=case(
+                    (retry_exhausted, literal(ParsingJobStatus.FAILED.value)),
+                    else_=batch.c.status,
+                ),
+                attempt_count=case(
+                    (is_processing, ParsingJob.attempt_count + 1),
+                    else_=ParsingJob.attempt_count,
+                ),
+                started_at=case(
+                    (is_processing, func.coalesce(ParsingJob.started_at, func.now())),
+                    else_=ParsingJob.started_at,
+                ),
+                finished_at=case(
+                    (batch.c.status.in_([s.value for s in TERMINAL_STATUSES]), func.now()),
+                    (retry_exhausted, func.now()),
+                    else_=None,
+                ),
+                error_message=case(
+                    (retry_exhausted, func.coalesce(batch.c.error_message, literal("No attempts left"))),
+                    else_=batch.c.error_message,
+                ),
+                # An all-NULL VALUES column is typed text by Postgres
+                error_details=cast(batch.c.error_details, JSONB),
+                result_gcs_uri=func.coalesce(batch.c.result_gcs_uri, ParsingJob.result_gcs_uri),
+                locked_by=case((is_processing, literal(worker_id, String)), else_=None),
+                locked_until=case(
+                    (
+                        is_processing,
+                        text("now() + make_interval(secs => :lease_seconds)").bindparams(
+                            lease_seconds=float(lease_seconds)
+                        ),
+                    ),
+                    else_=None,
+                ),
+            )
+            .returning(ParsingJob.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._db.execute(stmt)
+        return set(result.scalars().all())
+
+    async def get_statuses(self, ids: Sequence[ParsingJobId]) -> dict[ParsingJobId, ParsingJobStatus]:
+        if not ids:
+            return {}
+        result = await self._db.execute(
+            select(ParsingJob.id, ParsingJob.status).where(ParsingJob.id.in_(ids))
+        )
+        return {job_id: status for job_id, status in result.all()}
+
+    async def get_exhausted(self, ids: Sequence[ParsingJobId]) -> set[ParsingJobId]:
+        """The ids among `ids` that have used all their attempts."""
+        if not ids:
+            return set()
+        result = await self._db.execute(
+            select(ParsingJob.id).where(
+                ParsingJob.id.in_(ids),
+                ParsingJob.attempt_count >= ParsingJob.max_attempts,
+            )
+        )
+        return set(result.scalars().all())
+
+    async def get_latest_by_result_uri(self, result_gcs_uri: str, *, for_update: bool = False) -> ParsingJob | None:
+        """
+        The most recent job writing to `result_gcs_uri`. Re-parsing a file
+        reuses its result URI, so older jobs of the same file may share it.
+        """
+        stmt = (
+            select(ParsingJob)
+            .where(ParsingJob.result_gcs_uri == result_gcs_uri)
+            .order_by(ParsingJob.created_at.desc())
+            .limit(1)
+        )
+        if for_update:
+            stmt = stmt.with_for_update()
+        result = await self._db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_vessel_id_for_file(self, document_file_id: DocumentFileId) -> VesselId | None:
+        """The vessel the file's most recent ingested result went into, if any."""
+        stmt = (
+            select(ParsingJob.vessel_id)
+            .where(
+                ParsingJob.document_file_id == document_file_id,
+                ParsingJob.vessel_id.is_not(None),
+            )
+            .order_by(ParsingJob.created_at.desc())
+            .limit(1)
+        )
+        return await self._db.scalar(stmt)
@@ -1,16 +1,53 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from typing import Any, Sequence
 
 from app.domain._shared.repository import BaseRepository
 from app.domain._shared.types import ParsingJobId
+from app.domain.processing.enums import ParsingJobStatus
 from app.domain.processing.models import ParsingJob
 
-from app.domain._shared.types import DocumentFileId
+from app.domain._shared.types import DocumentFileId, VesselId
 
 class ParsingJobRepositoryProtocol(BaseRepository[ParsingJob, ParsingJobId]):
     @abstractmethod
     async def update(self, job: ParsingJob) -> ParsingJob: ...
     async def does_job_exist_for_message(self, messageId: str) -> bool: ...
     async def does_job_exist_for_file(self, id: DocumentFileId) -> bool: ...
-    
\ No newline at end of file
+    @abstractmethod
+    async def find_existing_for_uploads(
+        self,
+        file_ids: Sequence[DocumentFileId],
+        message_ids: Sequence[str],
+    ) -> tuple[set[DocumentFileId], set[str]]: ...
+    @abstractmethod
+    async def insert_many(self, rows: Sequence[dict[str, Any]]) -> dict[DocumentFileId, ParsingJobId]: ...
+    @abstractmethod
+    async def claim_batch(self, *, worker_id: str, limit: int, lease_seconds: float) -> list[ParsingJob]: ...
+    @abstractmethod
+    async def extend_leases(
+        self,
+        job_ids: Sequence[ParsingJobId],
+        *,
+        worker_id: str,
+        lease_seconds: float,
+    ) -> set[ParsingJobId]: ...
+    @abstractmethod
+    async def reap_expired(self, *, limit: int, lease_seconds: float) -> list[tuple[ParsingJobId, ParsingJobStatus]]: ...
+    @abstractmethod
+    async def apply_status_updates(
+        self,
+        updates: Sequence[dict[str, Any]],
+        *,
+        lease_seconds: float,
+        worker_id: str | None = None,
+    ) -> set[ParsingJobId]: ...
+    @abstractmethod
+    async def get_statuses(self, ids: Sequence[ParsingJobId]) -> dict[ParsingJobId, ParsingJobStatus]: ...
+    @abstractmethod
+    async def get_exhausted(self, ids: Sequence[ParsingJobId]) -> set[ParsingJobId]: ...
+    @abstractmethod
+    async def get_latest_by_result_uri(self, result_gcs_uri: str, *, for_update: bool = False) -> ParsingJob | None: ...
+    @abstractmethod
+    async def get_vessel_id_for_file(self, document_file_id: DocumentFileId) -> VesselId | None: ...
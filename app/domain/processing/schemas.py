@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from app.domain._shared.types import DateTime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field, computed_field
 from uuid import UUID
 
@@ -39,6 +39,10 @@ class ParsingJobRead(ParsingJobBase):
     started_at: Optional[DateTime]
     finished_at: Optional[DateTime]
 
+    locked_by: Optional[str] = None
+    locked_until: Optional[DateTime] = None
+    vessel_id: Optional[str] = None
+
     error_message: Optional[str]
     error_details: Optional[Dict[str, Any]]
 
@@ -66,4 +70,32 @@ class ParsingJobStatusUpdate(BaseModel):
     result_gcs_uri: Optional[str] = Field(
         None,
         description="Final result URI (can be updated by worker if different from predefined)"
-    )
\ No newline at end of file
+    )
+
+
+class ParsingJobStatusUpdateItem(ParsingJobStatusUpdate):
+    """One job's status update within a batch."""
+    id: UUID = Field(..., description="Parsing job UUID")
+
+
+class ParsingJobStatusBatchRequest(BaseModel):
+    """Many status updates reported by a worker in one call."""
+    worker_id: Optional[str] = Field(
+        None,
+        description="Claiming worker; updates to jobs leased by another worker are rejected",
+    )
+    updates: List[ParsingJobStatusUpdateItem] = Field(..., min_length=1, max_length=1000)
+
+
+class ParsingJobStatusRejection(BaseModel):
+    id: UUID
+    current_status: Optional[ParsingJobStatus] = Field(
+        None, description="Status the job is in (None if it does not exist)"
+    )
+    reason: str
+
+
+class ParsingJobStatusBatchResponse(BaseModel):
+    applied: List[UUID]
+    rejected: List[ParsingJobStatusRejection]
+
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+from uuid import UUID
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.domain.processing.models import ParsingJob
-from app.domain.processing.schemas import ParsingJobCreate, ParsingJobRead
+from app.domain.processing.schemas import (
+    ParsingJobCreate,
+    ParsingJobRead,
+    ParsingJobStatusBatchRequest,
+    ParsingJobStatusBatchResponse,
+    ParsingJobStatusRejection,
+)
 from app.domain.processing.repository import ParsingJobRepositoryProtocol
-from app.domain.processing.enums import ParsingJobStatus
+from app.domain.processing.enums import ParsingJobStatus, WORKER_STATUS_TRANSITIONS
 from app.domain._shared.gcs import build_parsing_result_uri_from_source
 import app.domain.processing.exceptions as exc
 from .protocols import ParsingJobServiceProtocol
@@ -80,4 +89,54 @@ class ParsingJobService(ParsingJobServiceProtocol):
         await self._db.refresh(created)
 
         # 6. Return read schema
-        return ParsingJobRead.model_validate(created)
\ No newline at end of file
+        return ParsingJobRead.model_validate(created)
+
+    async def apply_status_updates(self, payload: ParsingJobStatusBatchRequest) -> ParsingJobStatusBatchResponse:
+        """
+        Applies a worker's batch of status updates in one statement.
+
+        - Repeated updates for one job collapse to the last one
+        - Illegal transitions, unknown jobs, jobs leased by another worker and
+          moves into PROCESSING with no attempts left are rejected per item,
+          with the job's current status
+        """
+        latest = {item.id: item for item in payload.updates}
+        applied = await self._jobs.apply_status_updates(
+            [
+                {
+                    "id": str(job_id),
+                    "status": item.status,
+                    "error_message": item.error_message,
+                    "error_details": item.error_details,
+                    "result_gcs_uri": item.result_gcs_uri,
+                }
+                for job_id, item in latest.items()
+            ],
+            worker_id=payload.worker_id,
+            lease_seconds=get_settings().parsing_job_lease_seconds,
+        )
+
+        rejected_ids = [str(job_id) for job_id in latest if str(job_id) not in applied]
+        current = await self._jobs.get_statuses(rejected_ids)
+        exhausted = await self._jobs.get_exhausted(rejected_ids)
+        await self._db.commit()
+
+        rejected = []
+        for job_id in rejected_ids:
+            status = current.get(job_id)
+            requested = latest[UUID(job_id)].status
+            if status is None:
+                reason = "Parsing job not found"
+            elif requested not in WORKER_STATUS_TRANSITIONS.get(status, frozenset()):
+                reason = f"Illegal transition {status.value} -> {requested.value}"
+            elif requested == ParsingJobStatus.PROCESSING and job_id in exhausted:
+                reason = "No attempts left"
+            else:
+                reason = "Leased by another worker"
+            rejected.append(ParsingJobStatusRejection(id=job_id, current_status=status, reason=reason))
+
+        return ParsingJobStatusBatchResponse(
+            applied=[job_id for job_id in latest if str(job_id) in applied],
+            rejected=rejected,
+        )
+
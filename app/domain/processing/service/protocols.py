@@ -1,6 +1,12 @@
 from typing import Protocol
-from app.domain.processing.schemas import ParsingJobCreate, ParsingJobRead
+from app.domain.processing.schemas import (
+    ParsingJobCreate,
+    ParsingJobRead,
+    ParsingJobStatusBatchRequest,
+    ParsingJobStatusBatchResponse,
+)
 
 
 class ParsingJobServiceProtocol(Protocol):
-    async def create_job(self, job: ParsingJobCreate) -> ParsingJobRead: ...
\ No newline at end of file
+    async def create_job(self, job: ParsingJobCreate) -> ParsingJobRead: ...
+    async def apply_status_updates(self, payload: ParsingJobStatusBatchRequest) -> ParsingJobStatusBatchResponse: ...
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from collections.abc import Iterable, Sequence
 
 from app.domain._shared.repository import BaseRepository
 from app.domain.users.models import User
+from app.domain.users.schemas import UserCreate
 
 
 class UserRepositoryProtocol(BaseRepository[User, str]):
     @abstractmethod
     async def get_by_clerk_id(self, clerk_user_id: str) -> User | None: ...
     @abstractmethod
-    async def update(self, user: User) -> User  : ...
\ No newline at end of file
+    async def update(self, user: User) -> User  : ...
+    @abstractmethod
+    async def get_ids_by_clerk_ids(self, clerk_user_ids: Iterable[str]) -> dict[str, str]: ...
+    @abstractmethod
+    async def insert_missing(self, users: Sequence[UserCreate]) -> dict[str, str]: ...
+    @abstractmethod
+    async def upsert_many(self, users: Sequence[UserCreate]) -> dict[str, str]: ...
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.users.models import User
 from app.domain.users.repository.protocols import UserRepositoryProtocol
+from app.domain.users.schemas import UserCreate
+
+
+def _user_rows(users: Sequence[UserCreate]) -> list[dict]:
+    # One row per clerk_user_id (last wins): ON CONFLICT can't touch a row twice.
+    rows = {u.clerk_user_id: u.model_dump() for u in users}
+    return list(rows.values())
 
 
 class UserRepository(UserRepositoryProtocol):
@@ -33,3 +43,45 @@ class UserRepository(UserRepositoryProtocol):
         stmt = select(User).where(User.clerk_user_id == clerk_user_id)
         res = await self._db.execute(stmt)
         return res.scalar_one_or_none()
+
+    async def get_ids_by_clerk_ids(self, clerk_user_ids: Iterable[str]) -> dict[str, str]:
+        ids = list(set(clerk_user_ids))
+        if not ids:
+            return {}
+        stmt = select(User.clerk_user_id, User.id).where(User.clerk_user_id.in_(ids))
+        res = await self._db.execute(stmt)
+        return {clerk_id: user_id for clerk_id, user_id in res.all()}
+
+    async def insert_missing(self, users: Sequence[UserCreate]) -> dict[str, str]:
+        """INSERT ... ON CONFLICT DO NOTHING; returns clerk_user_id -> id of the rows actually inserted."""
+        rows = _user_rows(users)
+        if not rows:
+            return {}
+        stmt = (
+            pg_insert(User)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[User.clerk_user_id])
+            .returning(User.clerk_user_id, User.id)
+        )
+        res = await self._db.execute(stmt)
+        return {clerk_id: user_id for clerk_id, user_id in res.all()}
+
+    async def upsert_many(self, users: Sequence[UserCreate]) -> dict[str, str]:
+        """INSERT ... ON CONFLICT DO UPDATE of the profile fields; returns clerk_user_id -> id for every row."""
+        rows = _user_rows(users)
+        if not rows:
+            return {}
+        stmt = pg_insert(User).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.clerk_user_id],
+            set_={
+                "email": stmt.excluded.email,
+                "first_name": stmt.excluded.first_name,
+                "last_name": stmt.excluded.last_name,
+                "full_name": stmt.excluded.full_name,
+                "image_url": stmt.excluded.image_url,
+                "updated_at": func.now(),
+            },
+        ).returning(User.clerk_user_id, User.id)
+        res = await self._db.execute(stmt)
+        return {clerk_id: user_id for clerk_id, user_id in res.all()}
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import Protocol
 
 from app.domain.users.models import User
@@ -10,3 +11,4 @@ class UserServiceProtocol(Protocol):
     async def get_user_by_clerk_id(self, clerk_user_id: str) -> User: ...
     async def update_user_by_clerk_id(self, clerk_user_id: str, payload: UserUpdate) -> User: ...
     async def delete_user_by_clerk_id(self, clerk_user_id: str) -> None: ...
+    async def upsert_users(self, payloads: Sequence[UserCreate]) -> dict[str, str]: ...
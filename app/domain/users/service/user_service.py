@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import AuthContext
@@ -87,3 +89,13 @@ class UserService(UserServiceProtocol):
         except Exception:
             await self._db.rollback()
             raise
+
+    async def upsert_users(self, payloads: Sequence[UserCreate]) -> dict[str, str]:
+        """Bulk create-or-update by clerk_user_id in one statement; returns clerk_user_id -> id."""
+        try:
+            ids = await self._users.upsert_many(payloads)
+            await self._db.commit()
+            return ids
+        except Exception:
+            await self._db.rollback()
+            raise
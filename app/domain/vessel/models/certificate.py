@@ -14,6 +14,10 @@ from app.domain.vessel.enums import CertificateDomain, CertificateStatus
 if TYPE_CHECKING:
     from .vessel import Vessel
 
+# A vessel holds one certificate per (domain, description, identifier); parsing
+# results are upserted on it, so re-ingesting a report updates in place
+CERTIFICATE_NATURAL_KEY = ("vessel_id", "domain", "description", "identifier")
+
 class VesselCertificate(
     UUIDPrimaryKeyMixin,
     TimestampsMixin,
@@ -59,6 +63,12 @@ class VesselCertificate(
         sa.Index("ix_vessel_certificate_identifier", "identifier"),
         sa.Index("ix_vessel_certificate_expiry_date", "expiry_date"),
         sa.Index("ix_vessel_certificate_status", "status"),
+        sa.Index(
+            "ux_vessel_certificate_natural_key",
+            *CERTIFICATE_NATURAL_KEY,
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
     )
 
     vessel: sa.Mapped["Vessel"] = sa.relationship(
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from typing import Any, Sequence
+
 from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain._shared.types import VesselId, CertificateId
 from app.domain.vessel.models import VesselCertificate
+from app.domain.vessel.models.certificate import CERTIFICATE_NATURAL_KEY
 from app.domain.vessel.repository.protocols import VesselCertificateRepositoryProtocol
 
 
@@ -49,4 +53,34 @@ class VesselCertificateRepository(VesselCertificateRepositoryProtocol):
         )
         result = await self._db.execute(stmt)
         certificates = list(result.scalars().all())
-        return certificates, total
\ No newline at end of file
+        return certificates, total
+
+    async def upsert_many(self, rows: Sequence[dict[str, Any]]) -> int:
+        """
+        Insert certificates, updating those that already exist for the vessel
+        (same domain, description and identifier) in one statement.
+
+        Rows repeating a natural key within the batch would hit the same row
+        twice, which Postgres rejects; the last of them wins. Returns the
+        number of rows written.
+        """
+        deduped: dict[tuple, dict[str, Any]] = {}
+        for row in rows:
+            deduped[tuple(row.get(key) for key in CERTIFICATE_NATURAL_KEY)] = row
+        if not deduped:
+            return 0
+
+        stmt = pg_insert(VesselCertificate).values(list(deduped.values()))
+        table = VesselCertificate.__table__
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c[key] for key in CERTIFICATE_NATURAL_KEY],
+            set_={
+                "issuer": func.coalesce(stmt.excluded.issuer, table.c.issuer),
+                "issued_date": func.coalesce(stmt.excluded.issued_date, table.c.issued_date),
+                "expiry_date": func.coalesce(stmt.excluded.expiry_date, table.c.expiry_date),
+                "status": stmt.excluded.status,
+                "updated_at": func.now(),
+            },
+        )
+        result = await self._db.execute(stmt)
+        return result.rowcount
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain._shared.types import VesselId
@@ -33,4 +36,19 @@ class VesselDimensionsRepository(VesselDimensionsRepositoryProtocol):
 
     async def update(self, dimensions: VesselDimensions) -> VesselDimensions:
         await self._db.flush()
-        return dimensions
\ No newline at end of file
+        return dimensions
+
+    async def upsert(self, vessel_id: VesselId, values: dict[str, Any]) -> None:
+        """Insert the vessel's dimensions, or merge the non-None `values` into the existing ones."""
+        stmt = pg_insert(VesselDimensions).values(vessel_id=vessel_id, **values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[VesselDimensions.vessel_id],
+            set_={
+                **{
+                    key: func.coalesce(stmt.excluded[key], VesselDimensions.__table__.c[key])
+                    for key in values
+                },
+                "updated_at": func.now(),
+            },
+        )
+        await self._db.execute(stmt)
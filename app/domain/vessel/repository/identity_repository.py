@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from typing import Any
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain._shared.types import VesselId
-from app.domain.vessel.models import VesselIdentity
+from app.domain._shared.types import VesselId, OrganizationId
+from app.domain.vessel.models import Vessel, VesselIdentity
 from app.domain.vessel.repository.protocols import VesselIdentityRepositoryProtocol
 
 
@@ -39,3 +42,44 @@ class VesselIdentityRepository(VesselIdentityRepositoryProtocol):
         stmt = select(VesselIdentity).where(VesselIdentity.mmsi_number == mmsi_number)
         res = await self._db.execute(stmt)
         return res.scalar_one_or_none()
+
+    async def find_owners(
+        self,
+        *,
+        imo_number: str | None = None,
+        mmsi_number: str | None = None,
+    ) -> list[tuple[VesselId, OrganizationId, str | None, str | None]]:
+        """(vessel_id, org_id, imo_number, mmsi_number) of the vessels holding either number, in any org."""
+        conditions = []
+        if imo_number:
+            conditions.append(VesselIdentity.imo_number == imo_number)
+        if mmsi_number:
+            conditions.append(VesselIdentity.mmsi_number == mmsi_number)
+        if not conditions:
+            return []
+
+        stmt = (
+            select(VesselIdentity.vessel_id, Vessel.org_id, VesselIdentity.imo_number, VesselIdentity.mmsi_number)
+            .join(Vessel, Vessel.id == VesselIdentity.vessel_id)
+            .where(or_(*conditions))
+        )
+        res = await self._db.execute(stmt)
+        return [tuple(row) for row in res.all()]
+
+    async def upsert(self, vessel_id: VesselId, values: dict[str, Any]) -> None:
+        """
+        Insert the vessel's identity, or merge `values` into the existing one.
+        None values never overwrite what is already stored.
+        """
+        stmt = pg_insert(VesselIdentity).values(vessel_id=vessel_id, **values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[VesselIdentity.vessel_id],
+            set_={
+                **{
+                    key: func.coalesce(stmt.excluded[key], VesselIdentity.__table__.c[key])
+                    for key in values
+                },
+                "updated_at": func.now(),
+            },
+        )
+        await self._db.execute(stmt)
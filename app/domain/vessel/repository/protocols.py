@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from typing import Any, Sequence
 
 from app.domain._shared.repository import BaseRepository
 from app.domain._shared.types import VesselId, OrganizationId, CertificateId
@@ -37,6 +38,17 @@ class VesselIdentityRepositoryProtocol(BaseRepository[VesselIdentity, VesselId])
     @abstractmethod
     async def get_by_mmsi_number(self, mmsi_number: str) -> VesselIdentity | None: ...
 
+    @abstractmethod
+    async def find_owners(
+        self,
+        *,
+        imo_number: str | None = None,
+        mmsi_number: str | None = None,
+    ) -> list[tuple[VesselId, OrganizationId, str | None, str | None]]: ...
+
+    @abstractmethod
+    async def upsert(self, vessel_id: VesselId, values: dict[str, Any]) -> None: ...
+
 
 class VesselDimensionsRepositoryProtocol(BaseRepository[VesselDimensions, VesselId]):
     @abstractmethod
@@ -45,6 +57,9 @@ class VesselDimensionsRepositoryProtocol(BaseRepository[VesselDimensions, Vessel
     @abstractmethod
     async def get_by_vessel_id(self, vessel_id: VesselId) -> VesselDimensions | None: ...
 
+    @abstractmethod
+    async def upsert(self, vessel_id: VesselId, values: dict[str, Any]) -> None: ...
+
 
 class VesselCertificateRepositoryProtocol(BaseRepository[VesselCertificate, CertificateId]):
     @abstractmethod
@@ -54,3 +69,6 @@ class VesselCertificateRepositoryProtocol(BaseRepository[VesselCertificate, Cert
     async def list_by_vessel(
         self, vessel_id: VesselId, offset: int = 0, limit: int = 20
     ) -> tuple[list[VesselCertificate], int]: ...
+
+    @abstractmethod
+    async def upsert_many(self, rows: Sequence[dict[str, Any]]) -> int: ...
@@ -3,6 +3,7 @@ from __future__ import annotations
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import AuthContext
+from app.core.auth.id_cache import get_org_id_cache, get_user_id_cache
 from app.domain._shared import PaginatedResponse
 from app.domain._shared.types import OrganizationId, UserId, VesselId, CertificateId
 from app.domain.organization.repository.protocols import OrganizationRepositoryProtocol
@@ -397,19 +398,27 @@ class VesselService(VesselServiceProtocol):
         org_id = self._ctx.internal_org_id
         if org_id:
             return org_id
-        org = await self._orgs.get_by_clerk_id(clerk_org_id=self._ctx.organization_id)
-        if not org:
+        org_id = await get_org_id_cache().resolve(self._ctx.organization_id, self._lookup_org_id)
+        if not org_id:
             raise VesselNotFoundError(metadata={"reason": "org_not_found"})
-        return org.id
+        return org_id
 
     async def _resolve_user_id(self) -> UserId:
         user_id = self._ctx.internal_user_id
         if user_id:
             return user_id
-        user = await self._users.get_by_clerk_id(clerk_user_id=self._ctx.user_id)
-        if not user:
+        user_id = await get_user_id_cache().resolve(self._ctx.user_id, self._lookup_user_id)
+        if not user_id:
             raise VesselNotFoundError(metadata={"reason": "user_not_found"})
-        return user.id
+        return user_id
+
+    async def _lookup_org_id(self, clerk_org_id: str) -> OrganizationId | None:
+        org = await self._orgs.get_by_clerk_id(clerk_org_id=clerk_org_id)
+        return org.id if org else None
+
+    async def _lookup_user_id(self, clerk_user_id: str) -> UserId | None:
+        user = await self._users.get_by_clerk_id(clerk_user_id=clerk_user_id)
+        return user.id if user else None
 
     def _to_vessel_read(self, vessel: Vessel) -> VesselRead:
         identity = self._to_identity_read(vessel.identity) if vessel.identity else None
@@ -14,6 +14,7 @@ from app.infrastructure.db.protocols import ConnectionStrategy
 from app.infrastructure.db.session_manager import (
     AsyncSessionLocal,
     Base,
+    LazySession,
     engine,
     get_db_session,
     database_lifespan,
@@ -29,6 +30,7 @@ __all__ = [
     # Session Management
     "get_db_session",
     "AsyncSessionLocal",
+    "LazySession",
     "engine",
     "database_lifespan",
     # Factory & Protocols
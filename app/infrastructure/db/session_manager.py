@@ -62,7 +62,9 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             return result.scalars().all()
     
     The session is automatically closed when the request completes,
-    ensuring proper connection management.
+    ensuring proper connection management. Creating it is cheap: a pool
+    connection is only checked out on the first statement, and returned
+    on commit/rollback/close.
     
     Yields:
         AsyncSession: Database session for the current request
@@ -70,6 +72,47 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         yield session
 
+
+class LazySession:
+    """
+    Session holder that only opens an `AsyncSession` when first asked for one.
+
+    Useful for code paths that *may* need the database (e.g. auth fallbacks)
+    and should neither hold the request session nor pay for a pool checkout
+    when they don't.
+
+    Usage:
+        async with LazySession() as lazy:
+            if needs_db:
+                db = lazy.get()
+                await db.execute(...)
+    """
+
+    def __init__(self, session_factory: SessionManager = AsyncSessionLocal):
+        self._session_factory = session_factory
+        self._session: AsyncSession | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._session is not None
+
+    def get(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
+
+    async def __aenter__(self) -> "LazySession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
 @asynccontextmanager
 async def database_lifespan():
     """
@@ -11,6 +11,9 @@ from app.domain.organization.models import Organization, OrganizationMember
 from app.domain.document.models import Document, DocumentFile
 from app.domain.vessel.models import Vessel, VesselIdentity, VesselDimensions, VesselCertificate
 from app.domain.processing.models import *
+from app.core.auth.webhooks.models import ClerkWebhookInbox
+from app.core.pubsub.outbox.models import PubSubOutbox
+from app.core.pubsub.dedup.models import PubSubProcessedMessage
 config = context.config
 settings = get_settings()
 
@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+
 from .protocols import StorageProtocol
 from .gcs import GCSStorage
 from app.core.config import StorageSettings
@@ -37,4 +39,12 @@ class StorageClient:
     
     async def file_exists(self, path: str) -> bool:
         """Check if a file exists in storage."""
-        return await self._storage.file_exists(path)
\ No newline at end of file
+        return await self._storage.file_exists(path)
+
+    def iter_file(self, path: str, chunk_size: int = 256 * 1024) -> AsyncIterator[bytes]:
+        """Stream a file's content in chunks."""
+        return self._storage.iter_file(path, chunk_size)
+
+    @property
+    def bucket_name(self) -> str | None:
+        return getattr(self._storage, "bucket_name", None)
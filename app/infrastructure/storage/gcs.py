@@ -1,5 +1,6 @@
 from datetime import timedelta
 import asyncio
+from collections.abc import AsyncIterator
 from typing import cast
 
 import google.auth
@@ -7,9 +8,11 @@ from google.cloud import storage
 from google.auth.credentials import Credentials
 from google.auth.transport.requests import Request
 from google.auth.exceptions import GoogleAuthError
+from google.api_core.exceptions import NotFound
 
 from .exceptions import (
     StorageError,
+    StorageFileNotFoundError,
     SignedUrlError,
     StorageDeleteError,
     StorageAuthenticationError,
@@ -127,3 +130,24 @@ class GCSStorage:
             return await asyncio.to_thread(blob.exists)
         except Exception as e:
             raise StorageError(f"Failed to check if file exists {path}: {e}")
+
+    async def iter_file(self, path: str, chunk_size: int = 256 * 1024) -> AsyncIterator[bytes]:
+        """Stream an object in `chunk_size` pieces (ranged reads, never the whole object)."""
+        reader = None
+        try:
+            blob = self.bucket.blob(path)
+            reader = await asyncio.to_thread(blob.open, "rb", chunk_size=chunk_size)
+            while True:
+                chunk = await asyncio.to_thread(reader.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        except NotFound:
+            raise StorageFileNotFoundError(f"File not found: {path}")
+        except StorageError:
+            raise
+        except Exception as e:
+            raise StorageError(f"Failed to read file {path}: {e}")
+        finally:
+            if reader is not None:
+                await asyncio.to_thread(reader.close)
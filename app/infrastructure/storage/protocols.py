@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import Protocol, Union
 from datetime import timedelta
 
@@ -31,3 +32,7 @@ class StorageProtocol(Protocol):
     async def file_exists(self, path: str) -> bool:
         """Check if a file exists in storage."""
         ...
+
+    def iter_file(self, path: str, chunk_size: int = 256 * 1024) -> AsyncIterator[bytes]:
+        """Stream a file's content in chunks."""
+        ...
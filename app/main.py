@@ -4,9 +4,14 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1 import api_router
+from app.core.auth.metadata_sync import get_metadata_sync_queue
+from app.core.auth.webhooks import get_webhook_consumer
 from app.core.config import get_settings
 from app.core.error_handlers import register_error_handlers
+from app.core.pubsub.outbox import get_outbox_relay
+from app.core.pubsub.overload import get_load_shedder
 from app.core.pubsub.setup import setup_pubsub, teardown_pubsub
+from app.domain.processing.reaper import get_parsing_job_reaper
 from app.infrastructure.db import database_lifespan
 
 
@@ -17,8 +22,21 @@ async def lifespan(app: FastAPI):
     setup_pubsub(project_id=settings.gcp_project_id)
 
     async with database_lifespan():
+        webhook_consumer = get_webhook_consumer()
+        webhook_consumer.start()
+        outbox_relay = get_outbox_relay()
+        outbox_relay.start()
+        load_shedder = get_load_shedder()
+        load_shedder.start()
+        job_reaper = get_parsing_job_reaper()
+        job_reaper.start()
         yield
+        await job_reaper.stop()
+        await load_shedder.stop()
+        await outbox_relay.stop()
+        await webhook_consumer.stop()
 
+    await get_metadata_sync_queue().stop()
     teardown_pubsub()
 
 
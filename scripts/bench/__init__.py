@@ -0,0 +1,6 @@
+"""
+Local benchmarks and load harnesses.
+
+Run from the repo root, e.g. `python -m scripts.bench.auth --help`.
+They never reach external services: anything remote is replaced by a local stand-in.
+"""
@@ -0,0 +1,67 @@
+"""Shared timing / reporting helpers for the benchmarks."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+@dataclass(frozen=True)
+class Summary:
+    name: str
+    ops: int
+    elapsed_s: float
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+
+    @property
+    def ops_per_s(self) -> float:
+        return self.ops / self.elapsed_s if self.elapsed_s else 0.0
+
+    @classmethod
+    def from_latencies(cls, name: str, latencies_s: list[float], elapsed_s: float) -> "Summary":
+        ordered = sorted(latencies_s)
+        return cls(
+            name=name,
+            ops=len(ordered),
+            elapsed_s=elapsed_s,
+            p50_ms=percentile(ordered, 50) * 1000,
+            p99_ms=percentile(ordered, 99) * 1000,
+            max_ms=(ordered[-1] * 1000) if ordered else 0.0,
+        )
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "ops": self.ops,
+            "elapsed_s": round(self.elapsed_s, 4),
+            "ops_per_s": round(self.ops_per_s, 1),
+            "p50_ms": round(self.p50_ms, 4),
+            "p99_ms": round(self.p99_ms, 4),
+            "max_ms": round(self.max_ms, 4),
+        }
+
+
+HEADER = f"{'path':<40} {'ops':>8} {'ops/s':>12} {'p50 ms':>10} {'p99 ms':>10} {'max ms':>10}"
+
+
+def format_row(summary: Summary) -> str:
+    return (
+        f"{summary.name:<40} {summary.ops:>8} {summary.ops_per_s:>12.1f} "
+        f"{summary.p50_ms:>10.3f} {summary.p99_ms:>10.3f} {summary.max_ms:>10.3f}"
+    )
+
+
+def print_table(title: str, summaries: list[Summary]) -> None:
+    print(f"\n== {title}")
+    print(HEADER)
+    for summary in summaries:
+        print(format_row(summary))
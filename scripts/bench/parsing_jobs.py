@@ -0,0 +1,182 @@
+"""
+Parsing job SQL checks against a local Postgres.
+
+The worker-facing statements of ParsingJobRepository (status batches, leases, reaper)
+are built from VALUES lists and CASE expressions whose typing only Postgres
+decides, so they are exercised here on real rows rather than compiled.
+
+Everything runs on a throwaway user/org inside one transaction that is rolled
+back, so it is safe against the docker-compose database. Prints one line per
+check and exits 1 if any fails.
+
+Usage:
+    AUTH_ENABLED=false python -m scripts.bench.parsing_jobs
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import uuid
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.document.models import Document, DocumentFile
+from app.domain.organization.models import Organization
+from app.domain.processing.enums import ParsingJobStatus
+from app.domain.processing.models import ParsingJob
+from app.domain.processing.repository import ParsingJobRepository
+from app.domain.users.models import User
+from app.infrastructure.db import AsyncSessionLocal, engine
+
+LEASE_SECONDS = 300
+
+
+class Fixture:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.jobs = ParsingJobRepository(db)
+        self.org_id = str(uuid.uuid4())
+        self.user_id = str(uuid.uuid4())
+        self.document_id = str(uuid.uuid4())
+
+    async def seed(self) -> None:
+        run = uuid.uuid4().hex[:12]
+        await self.db.execute(insert(User).values(id=self.user_id, clerk_user_id=f"user_check_{run}", email=f"check+{run}@mareon.local"))
+        await self.db.execute(insert(Organization).values(id=self.org_id, clerk_id=f"org_check_{run}", name=f"check {run}"))
+        await self.db.execute(
+            insert(Document).values(id=self.document_id, org_id=self.org_id, title="check", created_by=self.user_id)
+        )
+
+    async def job(self, status: ParsingJobStatus, **values) -> str:
+        """A job on its own file (one active job per file)."""
+        file_id, job_id = str(uuid.uuid4()), str(uuid.uuid4())
+        await self.db.execute(
+            insert(DocumentFile).values(id=file_id, document_id=self.document_id, org_id=self.org_id)
+        )
+        await self.db.execute(
+            insert(ParsingJob).values(id=job_id, org_id=self.org_id, document_file_id=file_id, status=status, **values)
+        )
+        return job_id
+
+    async def get(self, job_id: str) -> ParsingJob:
+        self.db.expire_all()
+        return (await self.db.execute(select(ParsingJob).where(ParsingJob.id == job_id))).scalar_one()
+
+
+async def status_only_update(f: Fixture) -> str | None:
+    job_id = await f.job(ParsingJobStatus.PROCESSING)
+    applied = await f.jobs.apply_status_updates(
+        [{"id": job_id, "status": ParsingJobStatus.COMPLETED}],
+        lease_seconds=LEASE_SECONDS,
+    )
+    job = await f.get(job_id)
+    if applied != {job_id} or job.status != ParsingJobStatus.COMPLETED or job.finished_at is None:
+        return f"applied={applied} status={job.status}"
+    return None
+
+
+async def mixed_error_details(f: Fixture) -> str | None:
+    failed, done = await f.job(ParsingJobStatus.PROCESSING), await f.job(ParsingJobStatus.PROCESSING)
+    applied = await f.jobs.apply_status_updates(
+        [
+            {"id": failed, "status": ParsingJobStatus.FAILED, "error_message": "boom", "error_details": {"page": 3}},
+            {"id": done, "status": ParsingJobStatus.COMPLETED},
+        ],
+        lease_seconds=LEASE_SECONDS,
+    )
+    job = await f.get(failed)
+    if applied != {failed, done} or job.error_details != {"page": 3}:
+        return f"applied={len(applied)} error_details={job.error_details!r}"
+    return None
+
+
+async def processing_takes_lease(f: Fixture) -> str | None:
+    job_id = await f.job(ParsingJobStatus.PENDING)
+    await f.jobs.apply_status_updates(
+        [{"id": job_id, "status": ParsingJobStatus.PROCESSING}],
+        worker_id="w1",
+        lease_seconds=LEASE_SECONDS,
+    )
+    job = await f.get(job_id)
+    if job.locked_by != "w1" or job.locked_until is None:
+        return f"locked_by={job.locked_by} locked_until={job.locked_until}"
+    if job.attempt_count != 1:
+        return f"attempt_count={job.attempt_count}"
+    if await f.jobs.extend_leases([job_id], worker_id="w1", lease_seconds=LEASE_SECONDS) != {job_id}:
+        return "heartbeat did not extend the lease"
+    return None
+
+
+async def exhausted_attempts(f: Fixture) -> str | None:
+    retrying = await f.job(ParsingJobStatus.PROCESSING, attempt_count=3, max_attempts=3, locked_by="w1")
+    claimed = await f.job(ParsingJobStatus.RETRYING, attempt_count=3, max_attempts=3)
+    applied = await f.jobs.apply_status_updates(
+        [
+            {"id": retrying, "status": ParsingJobStatus.RETRYING},
+            {"id": claimed, "status": ParsingJobStatus.PROCESSING},
+        ],
+        worker_id="w1",
+        lease_seconds=LEASE_SECONDS,
+    )
+    if applied != {retrying}:
+        return f"applied {sorted(applied)}, expected only the move to RETRYING"
+    job = await f.get(retrying)
+    if job.status != ParsingJobStatus.FAILED or job.finished_at is None:
+        return f"exhausted RETRYING left as status={job.status} finished_at={job.finished_at}"
+    if await f.jobs.get_exhausted([claimed]) != {claimed}:
+        return "exhausted job not reported"
+    return None
+
+
+async def reaper_releases_stale_jobs(f: Fixture) -> str | None:
+    hour_ago = text("now() - interval '1 hour'")
+    expired = await f.job(ParsingJobStatus.PROCESSING, locked_by="w1", locked_until=hour_ago, started_at=hour_ago)
+    unleased = await f.job(ParsingJobStatus.PROCESSING, started_at=hour_ago)
+    fresh = await f.job(ParsingJobStatus.PROCESSING, started_at=func.now())
+    leased = await f.job(ParsingJobStatus.PROCESSING, locked_by="w1", locked_until=text("now() + interval '1 hour'"))
+
+    reaped = dict(await f.jobs.reap_expired(limit=100, lease_seconds=LEASE_SECONDS))
+    if not {expired, unleased} <= reaped.keys() or reaped.keys() & {fresh, leased}:
+        return f"reaped {sorted(reaped)} of expired={expired} unleased={unleased}"
+    return None
+
+
+CHECKS: list[tuple[str, Callable[[Fixture], Awaitable[str | None]]]] = [
+    ("status-only update (no error_details)", status_only_update),
+    ("mixed error_details in one batch", mixed_error_details),
+    ("move to PROCESSING takes the lease", processing_takes_lease),
+    ("no move to RETRYING or PROCESSING past max_attempts", exhausted_attempts),
+    ("reaper releases expired and unleased jobs", reaper_releases_stale_jobs),
+]
+
+
+async def run() -> int:
+    failures = 0
+    try:
+        async with AsyncSessionLocal() as db:
+            fixture = Fixture(db)
+            await fixture.seed()
+            for name, check in CHECKS:
+                try:
+                    # A failing statement only rolls back its own check
+                    async with db.begin_nested():
+                        problem = await check(fixture)
+                except Exception as e:
+                    problem = f"{type(e).__name__}: {e}"
+                print(f"{'ok' if problem is None else 'FAIL':<5} {name}" + (f": {problem}" if problem else ""))
+                failures += problem is not None
+            await db.rollback()
+    finally:
+        await engine.dispose()
+    return 1 if failures else 0
+
+
+def main() -> None:
+    sys.exit(asyncio.run(run()))
+
+
+if __name__ == "__main__":
+    main()
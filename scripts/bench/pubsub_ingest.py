@@ -0,0 +1,335 @@
+"""
+End-to-end Pub/Sub ingestion load test: GCS OBJECT_FINALIZE push envelopes
+against /webhooks/pubsub, backed by a local Postgres.
+
+Seeds a throwaway user/org with `--files` pending DocumentFile rows, then fires
+one realistic finalize notification per file at `--rate` msgs/s. A
+`--duplicate-ratio` share of messages is delivered a second time with the same
+messageId (as a Pub/Sub redelivery would), some of them while the first
+delivery is still in flight.
+
+By default the app runs in-process (httpx ASGI transport, the loopback broker
+as publisher, the outbox relay running) so DB pool wait can be measured on the
+engine's pool and the parsing-job notifications relayed from the outbox are
+counted.
+`--url` targets a running instance instead; it must use the same DATABASE_URL,
+and pool wait is then not reported.
+
+Reported: achieved msgs/s, latency percentiles, status codes, DB pool wait,
+and duplicate-job violations (files with more than one ParsingJob). Exits 1 on
+any violation. Seeded rows are deleted afterwards unless `--keep`.
+
+Usage:
+    AUTH_ENABLED=false python -m scripts.bench.pubsub_ingest [--files 1000] [--rate 200]
+        [--duplicate-ratio 0.1] [--concurrency 64] [--url http://localhost:8000/api/v1/webhooks/pubsub]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import sys
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import httpx
+from sqlalchemy import delete, func, insert, select
+
+from app.core.pubsub.enums import PubSubSubscription
+from app.domain.document.models import Document, DocumentFile
+from app.domain.organization.models import Organization
+from app.domain.processing.models import ParsingJob
+from app.domain.users.models import User
+from app.infrastructure.db import AsyncSessionLocal, engine
+from scripts.bench._stats import Summary, percentile, print_table
+
+BUCKET = "mareon-bench-uploads"
+FILES_PER_DOCUMENT = 20
+SEED_CHUNK = 1000
+
+
+@dataclass(frozen=True)
+class SeededFile:
+    org_id: str
+    document_id: str
+    file_id: str
+
+    @property
+    def object_name(self) -> str:
+        return f"org-uploads/{self.org_id}/documents/{self.document_id}/files/{self.file_id}/scan.pdf"
+
+
+@dataclass(frozen=True)
+class Seed:
+    user_id: str
+    org_id: str
+    files: list[SeededFile]
+
+
+# ── seeding ──────────────────────────────────────────────────────────────────
+
+async def seed(n_files: int) -> Seed:
+    run = uuid.uuid4().hex[:12]
+    user_id, org_id = str(uuid.uuid4()), str(uuid.uuid4())
+    files: list[SeededFile] = []
+    documents: list[dict] = []
+    for i in range(n_files):
+        if i % FILES_PER_DOCUMENT == 0:
+            documents.append({
+                "id": str(uuid.uuid4()),
+                "org_id": org_id,
+                "title": f"bench {run} #{len(documents)}",
+                "created_by": user_id,
+            })
+        files.append(SeededFile(org_id, documents[-1]["id"], str(uuid.uuid4())))
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(User).values(id=user_id, clerk_user_id=f"user_bench_{run}", email=f"bench+{run}@mareon.local"))
+        await db.execute(insert(Organization).values(id=org_id, clerk_id=f"org_bench_{run}", name=f"bench {run}"))
+        for i in range(0, len(documents), SEED_CHUNK):
+            await db.execute(insert(Document), documents[i:i + SEED_CHUNK])
+        rows = [
+            {
+                "id": f.file_id,
+                "document_id": f.document_id,
+                "org_id": org_id,
+                "original_name": "scan.pdf",
+                "mime_type": "application/pdf",
+                "uploaded_by": user_id,
+            }
+            for f in files
+        ]
+        for i in range(0, len(rows), SEED_CHUNK):
+            await db.execute(insert(DocumentFile), rows[i:i + SEED_CHUNK])
+        await db.commit()
+    return Seed(user_id, org_id, files)
+
+
+async def cleanup(seeded: Seed) -> None:
+    async with AsyncSessionLocal() as db:
+        # Documents, files and parsing jobs cascade from the organization
+        await db.execute(delete(Organization).where(Organization.id == seeded.org_id))
+        await db.execute(delete(User).where(User.id == seeded.user_id))
+        await db.commit()
+
+
+async def job_counts(seeded: Seed) -> tuple[int, int, int]:
+    """(jobs created, files without a job, files with more than one job)."""
+    async with AsyncSessionLocal() as db:
+        per_file = (
+            select(ParsingJob.document_file_id, func.count().label("n"))
+            .where(ParsingJob.org_id == seeded.org_id)
+            .group_by(ParsingJob.document_file_id)
+            .subquery()
+        )
+        result = await db.execute(
+            select(
+                func.coalesce(func.sum(per_file.c.n), 0),
+                func.count(),
+                func.count().filter(per_file.c.n > 1),
+            ).select_from(per_file)
+        )
+        jobs, files_with_job, violations = result.one()
+    return int(jobs), len(seeded.files) - int(files_with_job), int(violations)
+
+
+# ── envelopes ────────────────────────────────────────────────────────────────
+
+def build_envelope(f: SeededFile, message_id: str, project_id: str) -> bytes:
+    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    generation = str(time.time_ns() // 1000)
+    size = random.randint(50_000, 5_000_000)
+    metadata = {
+        "kind": "storage#object",
+        "id": f"{BUCKET}/{f.object_name}/{generation}",
+        "name": f.object_name,
+        "bucket": BUCKET,
+        "generation": generation,
+        "metageneration": "1",
+        "contentType": "application/pdf",
+        "timeCreated": now,
+        "updated": now,
+        "storageClass": "STANDARD",
+        "size": str(size),
+        "md5Hash": base64.b64encode(uuid.uuid4().bytes).decode(),
+        "crc32c": base64.b64encode(random.randbytes(4)).decode(),
+        "etag": base64.b64encode(random.randbytes(6)).decode(),
+    }
+    envelope = {
+        "message": {
+            "attributes": {
+                "bucketId": BUCKET,
+                "eventTime": now,
+                "eventType": "OBJECT_FINALIZE",
+                "notificationConfig": f"projects/_/buckets/{BUCKET}/notificationConfigs/1",
+                "objectGeneration": generation,
+                "objectId": f.object_name,
+                "payloadFormat": "JSON_API_V1",
+            },
+            "data": base64.b64encode(json.dumps(metadata).encode()).decode(),
+            "messageId": message_id,
+            "message_id": message_id,
+            "publishTime": now,
+            "publish_time": now,
+        },
+        "subscription": PubSubSubscription.DOCUMENT_UPLOADS_API.full_name(project_id),
+    }
+    return json.dumps(envelope).encode()
+
+
+# ── pool instrumentation ─────────────────────────────────────────────────────
+
+def instrument_pool_wait(waits: list[float]) -> None:
+    """Record how long each connection checkout waits on the engine's pool."""
+    pool = engine.sync_engine.pool
+    do_get = pool._do_get
+
+    def timed_do_get():
+        started = time.perf_counter()
+        try:
+            return do_get()
+        finally:
+            waits.append(time.perf_counter() - started)
+
+    pool._do_get = timed_do_get
+
+
+# ── load ─────────────────────────────────────────────────────────────────────
+
+async def fire(
+    client: httpx.AsyncClient,
+    url: str,
+    deliveries: list[bytes],
+    rate: float,
+    concurrency: int,
+) -> tuple[list[float], Counter, float]:
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    limiter = asyncio.Semaphore(concurrency)
+
+    async def send(body: bytes) -> None:
+        async with limiter:
+            started = time.perf_counter()
+            try:
+                response = await client.post(url, content=body, headers={"content-type": "application/json"})
+                statuses[response.status_code] += 1
+            except httpx.HTTPError as e:
+                statuses[type(e).__name__] += 1
+            latencies.append(time.perf_counter() - started)
+
+    tasks = []
+    started = time.perf_counter()
+    for i, body in enumerate(deliveries):
+        # Open-loop schedule: message i goes out at i / rate regardless of responses
+        delay = started + i / rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(send(body)))
+    await asyncio.gather(*tasks)
+    return latencies, statuses, time.perf_counter() - started
+
+
+def plan_deliveries(seeded: Seed, duplicate_ratio: float, project_id: str) -> tuple[list[bytes], int]:
+    first = [build_envelope(f, str(10**15 + i), project_id) for i, f in enumerate(seeded.files)]
+    deliveries = list(first)
+    duplicates = 0
+    for i, body in enumerate(first):
+        if random.random() < duplicate_ratio:
+            # Redeliver shortly after (possibly while the first is in flight) or later in the run
+            gap = random.choice([1, 2, 5, 50, 500])
+            deliveries.insert(min(len(deliveries), i + duplicates + gap), body)
+            duplicates += 1
+    return deliveries, duplicates
+
+
+async def run(args: argparse.Namespace) -> int:
+    from app.core.config import get_settings
+
+    project_id = get_settings().gcp_project_id
+    random.seed(args.seed)
+
+    print(f"Seeding {args.files} DocumentFile rows ...")
+    seeded = await seed(args.files)
+    deliveries, duplicates = plan_deliveries(seeded, args.duplicate_ratio, project_id)
+    pool_waits: list[float] = []
+    notifications: int | None = None
+
+    try:
+        if args.url:
+            async with httpx.AsyncClient(timeout=60) as client:
+                latencies, statuses, elapsed = await fire(client, args.url, deliveries, args.rate, args.concurrency)
+        else:
+            from app.core.pubsub.enums import PubSubTopic
+            from app.core.pubsub.outbox import get_outbox_relay
+            from app.core.pubsub.setup import get_publisher, setup_pubsub, teardown_pubsub
+            from app.main import app
+
+            instrument_pool_wait(pool_waits)
+            setup_pubsub(use_loopback_broker=True)
+            broker = get_publisher()
+            relay = get_outbox_relay()
+            relay.start()
+            try:
+                transport = httpx.ASGITransport(app=app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+                    latencies, statuses, elapsed = await fire(
+                        client, "/api/v1/webhooks/pubsub", deliveries, args.rate, args.concurrency
+                    )
+            finally:
+                await relay.stop()
+                notifications = len(broker.messages(PubSubTopic.PARSING_JOBS))
+                teardown_pubsub()
+
+        jobs, files_without_job, violations = await job_counts(seeded)
+    finally:
+        if not args.keep:
+            await cleanup(seeded)
+        await engine.dispose()
+
+    ordered = sorted(latencies)
+    print_table(
+        f"/webhooks/pubsub, target {args.rate:.0f} msgs/s, concurrency {args.concurrency}",
+        [Summary.from_latencies("push delivery", latencies, elapsed)],
+    )
+    print(f"\np90 latency:            {percentile(ordered, 90) * 1000:.2f} ms")
+    print(f"status codes:           {dict(statuses)}")
+    print(f"deliveries:             {len(deliveries)} ({duplicates} duplicates)")
+    if pool_waits:
+        waits = sorted(pool_waits)
+        print(
+            f"db pool wait:           p50 {percentile(waits, 50) * 1000:.2f} ms, "
+            f"p99 {percentile(waits, 99) * 1000:.2f} ms, max {waits[-1] * 1000:.2f} ms "
+            f"over {len(waits)} checkouts"
+        )
+    else:
+        print("db pool wait:           n/a (remote instance)")
+    print(f"parsing jobs created:   {jobs} for {len(seeded.files)} files ({files_without_job} without a job)")
+    if notifications is not None:
+        print(f"parsing-job notifications: {notifications}")
+    print(f"duplicate-job violations: {violations}")
+
+    return 1 if violations else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=1000, help="files seeded (= unique messages)")
+    parser.add_argument("--rate", type=float, default=200.0, help="target msgs/s (open loop)")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.1, help="share of messages delivered twice")
+    parser.add_argument("--concurrency", type=int, default=64, help="max requests in flight")
+    parser.add_argument("--url", help="push endpoint of a running instance (default: in-process app)")
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    parser.add_argument("--keep", action="store_true", help="keep the seeded rows")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
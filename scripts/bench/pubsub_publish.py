@@ -0,0 +1,147 @@
+"""
+Pub/Sub publish benchmark and event-loop responsiveness check.
+
+Drives `PubSubPublisher` with a local stand-in for `pubsub_v1.PublisherClient`
+whose futures resolve on a background thread after `--latency-ms`, like the real
+client's batch commit. While publishes are in flight a ticker task measures how
+late the event loop wakes it up; the run fails (exit code 1) if the worst lag
+exceeds `--max-lag-ms`, i.e. if anything blocked the loop on a publish.
+The same load through `CoalescingPubSubPublisher` prints its flush stats.
+
+Usage:
+    python -m scripts.bench.pubsub_publish [--messages 200] [--latency-ms 200] [--max-lag-ms 50]
+        [--batch-messages 100] [--batch-latency-ms 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import concurrent.futures
+import heapq
+import itertools
+import sys
+import threading
+import time
+
+from app.core.pubsub.enums import PubSubTopic
+from app.core.pubsub.publisher import CoalescingPubSubPublisher, PubSubPublisher
+from scripts.bench._stats import Summary, print_table
+
+
+class SlowPublisherClient:
+    """
+    Duck-typed `pubsub_v1.PublisherClient` with a fixed publish latency.
+    Futures are resolved by a single background thread, as in the real client.
+    """
+
+    def __init__(self, latency_s: float) -> None:
+        self._latency = latency_s
+        self._ids = itertools.count(1)
+        self._pending: list[tuple[float, int, concurrent.futures.Future]] = []
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._resolve_loop, daemon=True)
+        self._thread.start()
+
+    def topic_path(self, project: str, topic: str) -> str:
+        return f"projects/{project}/topics/{topic}"
+
+    def publish(self, topic: str, data: bytes, ordering_key: str = "", **attrs) -> concurrent.futures.Future:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._cond:
+            heapq.heappush(self._pending, (time.monotonic() + self._latency, next(self._ids), future))
+            self._cond.notify()
+        return future
+
+    def _resolve_loop(self) -> None:
+        with self._cond:
+            while not self._stopped:
+                if not self._pending:
+                    self._cond.wait()
+                    continue
+                due, message_id, future = self._pending[0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                heapq.heappop(self._pending)
+                future.set_result(str(message_id))
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+
+async def _ticker(interval_s: float, lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        expected = time.perf_counter() + interval_s
+        await asyncio.sleep(interval_s)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def _run(args: argparse.Namespace) -> tuple[list[Summary], float, dict]:
+    publisher = PubSubPublisher(
+        "bench-project",
+        client=SlowPublisherClient(args.latency_ms / 1000),
+    )
+    coalescing = CoalescingPubSubPublisher(
+        PubSubPublisher("bench-project", client=SlowPublisherClient(args.latency_ms / 1000)),
+        max_messages=args.batch_messages,
+        max_latency=args.batch_latency_ms / 1000,
+    )
+    payload = {"job_id": "00000000-0000-0000-0000-000000000000", "file": "org-uploads/x/y.pdf"}
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(0.005, lags, stop))
+    summaries = []
+
+    # Concurrent single publishes (one per simulated request)
+    async def one(target) -> float:
+        t0 = time.perf_counter()
+        await target.publish(PubSubTopic.PARSING_JOBS, payload)
+        return time.perf_counter() - t0
+
+    for label, target in (("publish x concurrent", publisher), ("coalesced publish x concurrent", coalescing)):
+        started = time.perf_counter()
+        latencies = await asyncio.gather(*(one(target) for _ in range(args.messages)))
+        summaries.append(Summary.from_latencies(label, list(latencies), time.perf_counter() - started))
+
+    # One batch
+    started = time.perf_counter()
+    await publisher.publish_batch(PubSubTopic.PARSING_JOBS, [{"data": payload}] * args.messages)
+    elapsed = time.perf_counter() - started
+    summaries.append(Summary.from_latencies("publish_batch (wall time)", [elapsed] * args.messages, elapsed))
+
+    stop.set()
+    await ticker
+    publisher.close()
+    coalescing.close()
+    return summaries, max(lags, default=0.0) * 1000, coalescing.stats()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="simulated publish round-trip")
+    parser.add_argument("--max-lag-ms", type=float, default=50.0, help="fail above this event-loop lag")
+    parser.add_argument("--batch-messages", type=int, default=100, help="coalescing max_messages")
+    parser.add_argument("--batch-latency-ms", type=float, default=10.0, help="coalescing max_latency")
+    args = parser.parse_args()
+
+    summaries, max_lag_ms, flush_stats = asyncio.run(_run(args))
+    print_table(f"PubSubPublisher with {args.latency_ms:.0f} ms publish latency", summaries)
+    for topic, stats in flush_stats.items():
+        print(f"\ncoalescing flushes ({topic}): {stats}")
+    print(f"\nmax event-loop lag: {max_lag_ms:.2f} ms (limit {args.max_lag_ms:.0f} ms)")
+
+    if max_lag_ms > args.max_lag_ms:
+        print("FAIL: the event loop was blocked while publishing", file=sys.stderr)
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()